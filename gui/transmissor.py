@@ -1,17 +1,13 @@
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
-from tkinter import ttk
-from src.transmissor import CamadaFisicaTransmissor
-from src.transmissor import CamadaEnlaceTransmissor
-import socket
-import random
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
-from src.utils import string_to_byte_stream
-from src.utils import bytes_to_string
+from tkinter import ttk, messagebox
+from src.pipeline import LinkConfig, Pipeline
+from src.utils import string_to_byte_stream, BitBuffer, GraficoDecimado
+from src.comunicacao import SessaoTransmissor, TIPOS_AMOSTRA, COMPRESSOES
+from src.canal import CanalBernoulli
 
 class TRANSMISSOR_INTERFACE:
     def __init__(self):
@@ -34,12 +30,18 @@ class TRANSMISSOR_INTERFACE:
         self.amp_one: float = -1.0
         self.freq_zero: float = -2.0
         self.freq_one: float = -1.0
+        self.frequencias_mfsk: tuple[float, ...] = (1.0, 2.0, 3.0, 4.0)
+        self.sessao: SessaoTransmissor | None = None  # Conexão com o receptor, mantida entre as mensagens
+        # Envios feitos fora da thread da interface; um único trabalhador mantém a ordem das mensagens na sessão
+        self.envios = ThreadPoolExecutor(max_workers=1)
+        self.encerrando: bool = False  # Janela fechada: os envios ainda na fila são descartados
         
         # Criando a janela principal da interface gráfica
         self.root = tk.Tk()
         self.root.title("Transmissor")
         self.root.geometry("1350x750")
         self.root.resizable(True, True)
+        self.root.protocol("WM_DELETE_WINDOW", self.fechar_janela)  # Encerra a sessão e os envios ao fechar a janela
         
         # Cria os componentes da interface gráfica
         self.cria_interface()
@@ -49,43 +51,66 @@ class TRANSMISSOR_INTERFACE:
         
     def enviar_para_o_receptor(self, wave, dig_signal):
         """
-        Estabelece uma conexão com o receptor via socket e envia os dados da onda e do sinal digital.
+        Envia a onda e o sinal digital ao receptor no protocolo binário, pela sessão persistente com o endereço
+        configurado. A conexão é aberta no primeiro envio, reaproveitada pelas mensagens seguintes e refeita se cair.
+        O envio (com as reconexões e as esperas entre as tentativas) é feito fora da thread da interface.
         """
-        HOST = '127.0.0.1'  # Endereço do servidor
-        PORT = 65432        # Porta de comunicação
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as client_socket:
-            try:
-                # Conectar ao servidor
-                client_socket.connect((HOST, PORT))
-                print(f"Connected to {HOST}:{PORT}")
-                
-                # Formata os dados da mensagem
-                wave_data = ", ".join(map(str, wave))
-                extra_info = ""
-                
-                # Adiciona informações específicas para os diferentes tipos de modulação por portadora
-                if self.mod_portadora == "ASK":
-                    extra_info = f", {self.amp_zero}, {self.amp_one}" 
-                elif self.mod_portadora == "FSK":
-                    extra_info = f", {self.freq_zero}, {self.freq_one}"
-                elif self.mod_portadora == "8-QAM":
-                    dig_data = "; ".join(map(str, dig_signal))
-                    extra_info = f", {dig_data}"
-                    
-                # Mensagem formatada para ser enviada ao receptor
-                message = f"{self.sample}|{self.amplitude}|{self.frequencia}|{self.fase}|{self.mod_digital}|{self.mod_portadora}{extra_info}|{self.metodo_enquadramento}|{self.metodo_deteccao_ou_correcao}|{wave_data}|END_OF_SEQUENCE"
-                
-                # Envio da mensagem em blocos de 1024 bytes
-                for i in range(0, len(message), 1024):
-                    try:
-                        chunck = message[i: i + 1024].encode("ascii")
-                    except UnicodeDecodeError as e:
-                        chunck = "<ERROR>".encode("ascii")
-                        print(f"Erro: Os bytes não puderam ser decodificados em ascii. {e}")
-                    client_socket.sendall(chunck)
-                        
-            except ConnectionError as e:
-                print(f"Connection failed: {e}")
+        try:
+            porta = int(self.text_porta.get())
+            if not 0 < porta < 65536:
+                raise ValueError(porta)
+        except ValueError:
+            messagebox.showerror("Porta inválida", f"A porta do receptor deve ser um inteiro entre 1 e 65535: {self.text_porta.get()!r}")
+            return
+        endereco = (self.text_host.get(), porta)
+        # Mensagem a ser enviada ao receptor, com a configuração do enlace (o sinal digital só vai inteiro no modo simbolos; nos demais, só o seu número de níveis)
+        mensagem = self.config.para_mensagem(wave, dig_signal, self.select_tipo_amostra.get(), self.select_compressao.get())
+        self.envios.submit(self.enviar_em_segundo_plano, mensagem, endereco)
+
+    def fechar_janela(self):
+        """
+        Fecha a janela sem esperar os envios: os que ainda estão na fila são descartados e a sessão é encerrada pelo
+        trabalhador de envios, depois do envio em andamento (a sessão só é usada por essa thread).
+        """
+        self.encerrando = True
+        self.envios.submit(self.fechar_sessao)
+        self.envios.shutdown(wait=False)
+        self.root.destroy()
+
+    def fechar_sessao(self):
+        if self.sessao is not None:
+            self.sessao.fechar()
+            self.sessao = None
+
+    def na_interface(self, funcao, *args):
+        """
+        Agenda `funcao` na thread da interface, a partir do trabalhador de envios, se a janela ainda estiver aberta.
+        """
+        if self.encerrando:
+            return
+        try:
+            self.root.after(0, funcao, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # A janela foi fechada durante o envio
+
+    def enviar_em_segundo_plano(self, mensagem, endereco):
+        """
+        Executada pelo trabalhador de envios: envia a mensagem pela sessão do endereço dado e exibe os erros na interface.
+        """
+        if self.encerrando:
+            return
+        if self.sessao is None or (self.sessao.host, self.sessao.port) != endereco:
+            # Endereço novo: encerra a sessão anterior (a próxima conexão é aberta no envio)
+            if self.sessao is not None:
+                self.sessao.fechar()
+            self.sessao = SessaoTransmissor(*endereco)
+        try:
+            sequencia = self.sessao.enviar(mensagem)
+            status = f"Mensagem {sequencia} enviada para {endereco[0]}:{endereco[1]}"
+        except (ValueError, OSError) as e:  # Inclui ConnectionError e mensagens que o protocolo não aceita
+            status = f"Falha no envio para {endereco[0]}:{endereco[1]}"
+            self.na_interface(messagebox.showerror, "Falha no envio", f"Não foi possível enviar para {endereco[0]}:{endereco[1]}: {e}")
+        self.na_interface(lambda: self.lbl_envio.config(text=status))  # Os widgets só são alterados na thread da interface
         
     def cria_interface(self):
         """
@@ -118,7 +143,7 @@ class TRANSMISSOR_INTERFACE:
         self.lbl_mod_portadora = tk.Label(self.pnl_mensagem, text="Selecione o tipo de modulação por portadora*:")  # Cria um label para modulação por portadora
         self.lbl_mod_portadora.grid(row=4, column=0, columnspan=2, sticky="w")  # Adiciona o label ao frame da mensagem
 
-        self.select_mod_portadora = ttk.Combobox(self.pnl_mensagem, values=["Selecione um item", "ASK", "FSK", "8-QAM"], state="disabled")  # Cria um combobox para modulação por portadora
+        self.select_mod_portadora = ttk.Combobox(self.pnl_mensagem, values=["Selecione um item", "ASK", "FSK", "8-QAM", "M-FSK"], state="disabled")  # Cria um combobox para modulação por portadora
         self.select_mod_portadora.current(0)  # Define o item padrão do combobox
         self.select_mod_portadora.grid(row=5, column=0, columnspan=2, sticky="we")  # Adiciona o combobox ao frame da mensagem
         self.select_mod_portadora.bind("<<ComboboxSelected>>", self.select_mod_portadora_action)  # Associa a função ao selecionar um item
@@ -129,17 +154,18 @@ class TRANSMISSOR_INTERFACE:
         self.lbl_enquadramento = tk.Label(self.pnl_enlace, text="Selecione o método de enquadramento*:")  # Cria um label para enquadramento
         self.lbl_enquadramento.grid(row=0, column=0, columnspan=2, sticky="w")  # Adiciona o label ao frame do enlace
 
-        self.select_enquadramento = ttk.Combobox(self.pnl_enlace, values=["Selecione um item", "Contagem de Caracteres", "Insercao de Bytes"], state="disabled")  # Cria um combobox para enquadramento
+        self.select_enquadramento = ttk.Combobox(self.pnl_enlace, values=["Selecione um item", "Contagem de Caracteres", "Insercao de Bytes", "Contagem Varint"], state="disabled")  # Cria um combobox para enquadramento
         self.select_enquadramento.current(0)  # Define o item padrão do combobox
         self.select_enquadramento.grid(row=1, column=0, columnspan=2, sticky="we")  # Adiciona o combobox ao frame do enlace
+        self.select_enquadramento.bind("<<ComboboxSelected>>", self.select_enquadramento_action)  # Associa a função ao selecionar um item
 
         self.lbl_deteccao = tk.Label(self.pnl_enlace, text="Selecione o método de detecção/correção de erro(s):")  # Cria um label para detecção de erro
         self.lbl_deteccao.grid(row=2, column=0, columnspan=2, sticky="w")  # Adiciona o label ao frame do enlace
-        self.select_detecção = ttk.Combobox(self.pnl_enlace, values=["Selecione um item", "Bit de Paridade", "CRC-32", "Codigo de Hamming"], state="disabled")  # Cria um combobox para detecção de erro
+        self.select_detecção = ttk.Combobox(self.pnl_enlace, values=["Selecione um item", "Bit de Paridade", "CRC-32", "Codigo de Hamming", "Hamming (7,4)", "Hamming (15,11)", "SECDED (72,64)", "Paridade por Quadro", "CRC-32 por Quadro"], state="disabled")  # Cria um combobox para detecção de erro
         self.select_detecção.current(0)  # Define o item padrão do combobox
         self.select_detecção.grid(row=3, column=0, columnspan=2, sticky="we")  # Adiciona o combobox ao frame do enlace
 
-        self.sliderErr = tk.Scale(self.pnl_enlace, label="Erro (‰)", orient='horizontal') # Slider para configurar erro
+        self.sliderErr = tk.Scale(self.pnl_enlace, label="Erro (‰)", orient='horizontal', resolution=0.1) # Slider para configurar erro
         self.sliderErr.grid(row=4, column=0, columnspan=2, padx=5, pady=5, sticky="we")
 
         self.pnl_config = tk.LabelFrame(self.pnl_menu, text="Configurações Padrão", borderwidth=2, relief="groove")  # Cria um frame para configuração com borda
@@ -168,72 +194,87 @@ class TRANSMISSOR_INTERFACE:
         self.text_fase = tk.Entry(self.pnl_config)  # Cria um campo de entrada para fase
         self.text_fase.grid(row=3, column=1, padx=5, pady=5)  # Adiciona o campo de entrada ao frame de configuração
         self.text_fase.insert(0, "0.0")  # Insere um valor padrão no campo de entrada
+
+        self.lbl_host = tk.Label(self.pnl_config, text="Receptor:")  # Cria um label para o endereço do receptor
+        self.lbl_host.grid(row=4, column=0, sticky="w", padx=5, pady=5)  # Adiciona o label ao frame de configuração
+        self.text_host = tk.Entry(self.pnl_config)  # Cria um campo de entrada para o endereço do receptor
+        self.text_host.grid(row=4, column=1, padx=5, pady=5)  # Adiciona o campo de entrada ao frame de configuração
+        self.text_host.insert(0, "127.0.0.1")  # Insere um valor padrão no campo de entrada
+
+        self.lbl_porta = tk.Label(self.pnl_config, text="Porta:")  # Cria um label para a porta do receptor
+        self.lbl_porta.grid(row=5, column=0, sticky="w", padx=5, pady=5)  # Adiciona o label ao frame de configuração
+        self.text_porta = tk.Entry(self.pnl_config)  # Cria um campo de entrada para a porta do receptor
+        self.text_porta.grid(row=5, column=1, padx=5, pady=5)  # Adiciona o campo de entrada ao frame de configuração
+        self.text_porta.insert(0, "65432")  # Insere um valor padrão no campo de entrada
+
+        self.lbl_tipo_amostra = tk.Label(self.pnl_config, text="Amostras:")  # Cria um label para o modo de envio da onda
+        self.lbl_tipo_amostra.grid(row=6, column=0, sticky="w", padx=5, pady=5)  # Adiciona o label ao frame de configuração
+        self.select_tipo_amostra = ttk.Combobox(self.pnl_config, values=list(TIPOS_AMOSTRA), state="readonly")  # Cria um combobox para o tipo das amostras enviadas
+        self.select_tipo_amostra.current(0)  # float32 por padrão
+        self.select_tipo_amostra.grid(row=6, column=1, padx=5, pady=5)  # Adiciona o combobox ao frame de configuração
+
+        self.lbl_compressao = tk.Label(self.pnl_config, text="Compressão:")  # Cria um label para a compressão da onda
+        self.lbl_compressao.grid(row=7, column=0, sticky="w", padx=5, pady=5)  # Adiciona o label ao frame de configuração
+        self.select_compressao = ttk.Combobox(self.pnl_config, values=list(COMPRESSOES), state="readonly")  # Cria um combobox para a compressão
+        self.select_compressao.current(0)  # Sem compressão por padrão
+        self.select_compressao.grid(row=7, column=1, padx=5, pady=5)  # Adiciona o combobox ao frame de configuração
+
+        self.lbl_mtu = tk.Label(self.pnl_config, text="MTU (bytes):")  # Cria um label para o tamanho máximo da carga de cada quadro
+        self.lbl_mtu.grid(row=8, column=0, sticky="w", padx=5, pady=5)  # Adiciona o label ao frame de configuração
+        self.text_mtu = tk.Entry(self.pnl_config)  # Cria um campo de entrada para o MTU
+        self.text_mtu.grid(row=8, column=1, padx=5, pady=5)  # Adiciona o campo de entrada ao frame de configuração
+        self.text_mtu.insert(0, "4")  # Insere um valor padrão no campo de entrada
+
+        self.lbl_envio = tk.Label(self.pnl_config, text="Nenhuma mensagem enviada")  # Cria um label para o status do último envio
+        self.lbl_envio.grid(row=9, column=0, columnspan=2, sticky="w", padx=5, pady=5)  # Adiciona o label ao frame de configuração
         
         self.pnl_graficos = tk.Frame(self.root) # Cria um frame para os gráficos
         self.pnl_graficos.grid(row=2, column=0, padx=10, pady=10) # Configura o frame dos gráficos para preencher a janela
         
         self.frame_grafico_continuo = tk.Frame(self.pnl_graficos, width=600, height=400)
         self.frame_grafico_continuo.grid(row=1, column=2, padx=10, pady=10, sticky="n")
-        self.criar_grafico_vazio(self.frame_grafico_continuo, "Sinal Pós-Modulação por Portadora")
         
         self.frame_grafico_discreto = tk.Frame(self.pnl_graficos, width=600, height=400)
         self.frame_grafico_discreto.grid(row=1, column=1, padx=10, pady=10, sticky="n")
-        self.criar_grafico_vazio(self.frame_grafico_discreto, "Sinal Digital")
+        # Os gráficos (e o matplotlib) só são carregados depois que a janela é exibida
+        self.root.after_idle(self.criar_graficos)
         
-    def criar_grafico_vazio(self, frame: tk.Frame, titulo: str):
+    def criar_graficos(self):
+        """
+        Cria os gráficos vazios do sinal digital e do sinal modulado, reaproveitados por todas as mensagens.
+        """
+        self.grafico_continuo = self.criar_grafico_vazio(self.frame_grafico_continuo, "Sinal Pós-Modulação por Portadora", color='blue')
+        self.grafico_discreto = self.criar_grafico_vazio(self.frame_grafico_discreto, "Sinal Digital", drawstyle='steps-post', color='red')
+
+    def criar_grafico_vazio(self, frame: tk.Frame, titulo: str, **estilo) -> GraficoDecimado:
         """
         Na tela inicial, cria um gráfico vazio para ser preenchido posteriormente.
         """
-        fig, ax = plt.subplots()
+        # Importado aqui para que a janela abra sem esperar o carregamento do matplotlib
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
+        fig = Figure()  # Fora do pyplot, que manteria uma referência a cada figura criada
+        ax = fig.add_subplot()
         ax.set_title(titulo)
         ax.set_xlabel("Tempo")
         ax.set_ylabel("Amplitude")
         canvas = FigureCanvasTkAgg(fig, master=frame)
+        grafico = GraficoDecimado(ax, **estilo)  # Linha reaproveitada por todas as mensagens
         canvas.draw()
         toolbar = NavigationToolbar2Tk(canvas, frame)
         toolbar.update()
         canvas.get_tk_widget().pack()
         toolbar.pack()
-        return canvas, ax
+        return grafico
            
     def plota_grafico(self, dig_signal: list[int], wave: list[float]):
         """
         Exibe os gráficos do sinal digital e do sinal modulado.
         """
-        # Remove qualquer gráfico anterior
-        for widget in self.frame_grafico_continuo.winfo_children():
-            widget.destroy()
-
-        # Cria a figura
-        fig1, ax1 = plt.subplots()
-        ax1.plot(wave, color='blue')
-        ax1.set_title("Sinal Pós-Modulação por Portadora")
-        ax1.set_xlabel("Tempo")
-        ax1.set_ylabel("Amplitude")
-
-        # Cria o canvas do Matplotlib e adiciona ao frame
-        canvas1 = FigureCanvasTkAgg(fig1, master=self.frame_grafico_continuo)
-        canvas1.draw()
-        toolbar1 = NavigationToolbar2Tk(canvas1, self.frame_grafico_continuo)
-        toolbar1.update()
-        toolbar1.pack()
-        canvas1.get_tk_widget().pack()
-        
-        for widget in self.frame_grafico_discreto.winfo_children():
-            widget.destroy()
-        
-        fig2, ax2 = plt.subplots()
-        ax2.step(range(len(dig_signal)), dig_signal, where='post', color='red')  # Desenha o gráfico com transições instantâneas
-        ax2.set_title("Sinal Digital")
-        ax2.set_xlabel("Tempo")
-        ax2.set_ylabel("Amplitude")
-        
-        canvas2 = FigureCanvasTkAgg(fig2, master=self.frame_grafico_discreto)
-        canvas2.draw()
-        toolbar2 = NavigationToolbar2Tk(canvas2, self.frame_grafico_discreto)
-        toolbar2.update()
-        toolbar2.pack()
-        canvas2.get_tk_widget().pack()
+        # Atualiza as linhas criadas em criar_grafico_vazio, sem recriar figuras
+        self.grafico_continuo.atualizar(wave)
+        self.grafico_discreto.atualizar(dig_signal)  # Desenhado em degraus: transições instantâneas
         
     def text_mensagem_action(self):
         """
@@ -250,6 +291,20 @@ class TRANSMISSOR_INTERFACE:
         self.select_enquadramento.config(state="readonly")  # Habilita o combobox de enquadramento
         self.select_detecção.config(state="readonly")  # Habilita o combobox de detecção de erro
         
+    def select_enquadramento_action(self, event):
+        """
+        Ajusta o MTU ao enquadramento selecionado: o máximo na contagem varint (quadros jumbo) e, na contagem de
+        caracteres, no máximo o que cabe no byte de tamanho.
+        """
+        config = LinkConfig(enquadramento=self.select_enquadramento.get(), deteccao_correcao=self.select_detecção.get())
+        try:
+            mtu = int(self.text_mtu.get())
+        except ValueError:
+            mtu = config.mtu_maximo
+        if config.enquadramento == "Contagem Varint" or mtu > config.mtu_maximo:
+            self.text_mtu.delete(0, tk.END)
+            self.text_mtu.insert(0, str(config.mtu_maximo))
+
     def select_mod_portadora_action(self, event):
         """
         Habilita os campos específicos para cada tipo de modulação por portadora ao selecionar um item no combobox.
@@ -278,10 +333,17 @@ class TRANSMISSOR_INTERFACE:
             self.text_freq_one = tk.Entry(self.fsk_frame)
             self.text_freq_one.grid(row=1, column=1, padx=5, pady=5)
             self.text_freq_one.insert(0, "1.0")
+        elif mod_portadora == "M-FSK":
+            self.mfsk_frame = tk.LabelFrame(self.pnl_menu, text="Configurações para M-FSK", borderwidth=2, relief="groove")
+            self.mfsk_frame.grid(row=0, column=4, columnspan=2, pady=10)
+            tk.Label(self.mfsk_frame, text="Frequências (M potência de 2):").grid(row=0, column=0, padx=10, sticky="w")
+            self.text_frequencias_mfsk = tk.Entry(self.mfsk_frame)
+            self.text_frequencias_mfsk.grid(row=0, column=1, padx=5, pady=5)
+            self.text_frequencias_mfsk.insert(0, "1.0, 2.0, 3.0, 4.0")
 
     def enviar_mensagem(self):
         """
-        Função chamada quando o botão de enviar é pressionado. Ela coleta os dados inseridos na interface gráfica, realiza todas as operações selecionadas pelo usuário e envia chama a função de envio para o receptor.
+        Função chamada quando o botão de enviar é pressionado. Ela coleta os dados inseridos na interface gráfica, realiza todas as operações selecionadas pelo usuário (pela Pipeline) e chama a função de envio para o receptor.
         """
         # Coleta os dados inseridos na interface gráfica
         self.Bitstream = string_to_byte_stream(self.text_mensagem.get())
@@ -294,78 +356,56 @@ class TRANSMISSOR_INTERFACE:
         self.frequencia = float(self.text_frequencia.get())
         self.amplitude = float(self.text_amplitude.get())
         self.fase = float(self.text_fase.get())
-        # Cria as instâncias das camadas física e de enlace
-        self.Fisica = CamadaFisicaTransmissor(self.sample, self.frequencia, self.amplitude, self.fase)
-        self.Enlace = CamadaEnlaceTransmissor()
-        
-        byte_stream: bytes = bytes()
-        # Faz o enquadramento da mensagem recebida
-        if self.metodo_enquadramento == "Contagem de Caracteres":
-            byte_stream = self.Enlace.contagem_de_caracteres(self.Bitstream)
-        elif self.metodo_enquadramento == "Insercao de Bytes": # Foi necessário retirar acentos e cedilhas por causa da codificação ascii
-            byte_stream = self.Enlace.insercao_de_bytes(self.Bitstream)
-        print(byte_stream)
-        
-        # Altera o bitstream de acordo com o método de detecção/correção de erro selecionado
-        if self.metodo_deteccao_ou_correcao == "Bit de Paridade":
-            byte_stream = self.Enlace.bit_de_paridade(byte_stream)
-        elif self.metodo_deteccao_ou_correcao == "CRC-32":
-            byte_stream = self.Enlace.crc32(byte_stream)
-        elif self.metodo_deteccao_ou_correcao == "Codigo de Hamming":
-            byte_stream = self.Enlace.hamming(byte_stream)
-        else:
-            byte_stream = bytes_to_string(byte_stream) # A seleção de um método de detecção/correção de erro é opcional, caso nenhuma seja selecionada, apenas convertemos a mensagem de bytes para string
-        print(byte_stream)
-        print(len(byte_stream))
-        
-        bit_stream: list[bool] = self.Fisica.gerador_bit_stream(byte_stream) # Converte a mensagem de strig para uma lista de booleanos
-        bit_stream_para_enviar = self.inserir_error(bit_stream.copy()) # Insere erro na mensagem que será enviada (diferente da que será utilizada para plotar os gráficos na tela do transmissor)
-        
-        dig_signal: list[int] = [] # Inicializa o sinal digital
-        
-        # Modula a mensagem de acordo com o método de modulação digital selecionado
-        if self.mod_digital == "NRZ-Polar": # Utiliza uma largura de banda de B/2 Hz quando a taxa de bits é B bits/s e não garante sincronização entre o transmissor e o receptor
-            dig_signal = self.Fisica.nrz_polar(bit_stream) # Sempre criando uma versão para plotar na tela do transmissor
-            dig_signal_para_enviar = self.Fisica.nrz_polar(bit_stream_para_enviar) # e outra para enviar para o receptor (com erros)
-        elif self.mod_digital == "Manchester": # Combina o clock com o sinal de dados, garantindo sincronização entre o transmissor e o receptor, utiliza maior largura de banda (2B Hz para uma taxa de bits de B bits/s)
-            dig_signal = self.Fisica.manchester(bit_stream)
-            dig_signal_para_enviar = self.Fisica.manchester(bit_stream_para_enviar)
-        elif self.mod_digital == "Bipolar": 
-            dig_signal = self.Fisica.bipolar(bit_stream)
-            dig_signal_para_enviar = self.Fisica.bipolar(bit_stream_para_enviar)
-            
-        # Modula a mensagem de acordo com o método de modulação por portadora selecionado
-        wave: list[float] = []
         if self.mod_portadora == "ASK":
             self.amp_zero = float(self.text_amp_zero.get())
             self.amp_one = float(self.text_amp_one.get())
-            wave = self.Fisica.ask(dig_signal, self.mod_digital, self.amp_zero, self.amp_one)
-            wave_para_enviar = self.Fisica.ask(dig_signal_para_enviar, self.mod_digital)
         elif self.mod_portadora == "FSK":
             self.freq_zero = float(self.text_freq_zero.get())
             self.freq_one = float(self.text_freq_one.get())
-            print(f"{self.freq_zero}, {self.freq_one}")
-            print(self.mod_digital)
-            wave = self.Fisica.fsk(dig_signal, self.mod_digital, self.freq_zero, self.freq_one)
-            wave_para_enviar = self.Fisica.fsk(dig_signal_para_enviar, self.mod_digital)
-        elif self.mod_portadora == "8-QAM":
-            wave = self.Fisica.qam8_modulation(dig_signal.copy(), self.mod_digital)
-            wave_para_enviar = self.Fisica.qam8_modulation(dig_signal_para_enviar.copy(), self.mod_digital)
+        elif self.mod_portadora == "M-FSK":
+            self.frequencias_mfsk = tuple(float(frequencia) for frequencia in self.text_frequencias_mfsk.get().split(","))
+        # O MTU depende do enquadramento (e do trailer da verificação por quadro, na contagem de caracteres)
+        mtu_maximo = LinkConfig(enquadramento=self.metodo_enquadramento, deteccao_correcao=self.metodo_deteccao_ou_correcao).mtu_maximo
+        try:
+            mtu = int(self.text_mtu.get())
+            if not 0 < mtu <= mtu_maximo:
+                raise ValueError(mtu)
+        except ValueError:
+            messagebox.showerror("MTU inválido", f"Com o enquadramento {self.metodo_enquadramento} e a detecção {self.metodo_deteccao_ou_correcao}, "
+                                                  f"o MTU deve ser um inteiro entre 1 e {mtu_maximo}: {self.text_mtu.get()!r}")
+            return
+        # Cria a cadeia de transmissão com as técnicas selecionadas (o backend vetorizado gera as mesmas amostras do laço em Python puro)
+        self.config = LinkConfig(
+            mod_digital=self.mod_digital, mod_portadora=self.mod_portadora,
+            enquadramento=self.metodo_enquadramento, deteccao_correcao=self.metodo_deteccao_ou_correcao,
+            mtu=mtu, sample=self.sample, frequencia=self.frequencia, amplitude=self.amplitude, fase=self.fase,
+            amp_zero=self.amp_zero, amp_one=self.amp_one, freq_zero=self.freq_zero, freq_one=self.freq_one,
+            frequencias_mfsk=self.frequencias_mfsk,
+            backend="numpy",
+        )
+        self.pipeline = Pipeline(self.config)
+        
+        # Enquadramento e detecção/correção de erros, convertidos em um trem de bits
+        bit_stream: BitBuffer = self.pipeline.codificar_enlace(self.Bitstream)
+        bit_stream_para_enviar = self.inserir_error(bit_stream) # Insere erro na mensagem que será enviada (diferente da que será utilizada para plotar os gráficos na tela do transmissor)
+        
+        # Modulação digital e por portadora, sempre criando uma versão para plotar na tela do transmissor e outra para enviar para o receptor (com erros)
+        dig_signal = self.pipeline.codificar_linha(bit_stream)
+        dig_signal_para_enviar = self.pipeline.codificar_linha(bit_stream_para_enviar)
+        wave = self.pipeline.modular(dig_signal)
+        wave_para_enviar = self.pipeline.modular(dig_signal_para_enviar)
             
         self.plota_grafico(dig_signal, wave) # As ondas imprimidas na tela do transmissor, sem erros
         self.enviar_para_o_receptor(wave_para_enviar, dig_signal_para_enviar) # As ondas que serão enviadas para o receptor, com erros inseridos para simular a transmissão
         
-    def inserir_error(self, bit_stream: list[bool]) -> list[bool]:
+    def inserir_error(self, bit_stream: BitBuffer) -> BitBuffer:
         """
         Insere erro na mensagem de acordo com o valor do slider.
         
         :param bit_stream: Mensagem a ser enviada
         :return: Mensagem com erro
         """
-        erro = self.err_value
-        for i in range(len(bit_stream)):
-            if random.randint(0, 999) < erro:
-                bit_stream[i] = not bit_stream[i]
-        return bit_stream
+        # Cada bit é invertido com probabilidade err_value/1000; a máscara de erros é gerada em bloco e aplicada com um XOR
+        return CanalBernoulli(self.err_value / 1000).aplicar(bit_stream)
 
 TRANSMISSOR_INTERFACE()
\ No newline at end of file
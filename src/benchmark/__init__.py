@@ -0,0 +1,3 @@
+from .suite import Caso, Resultado, criar_casos, medir, executar, salvar, carregar, comparar
+
+__all__ = ["Caso", "Resultado", "criar_casos", "medir", "executar", "salvar", "carregar", "comparar"]
\ No newline at end of file
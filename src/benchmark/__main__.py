@@ -0,0 +1,65 @@
+"""
+Mede a vazão dos métodos das camadas do transmissor e do receptor e compara com uma linha de base.
+
+Exemplos:
+    python -m src.benchmark --salvar linha_de_base.json
+    python -m src.benchmark --comparar linha_de_base.json --limite 0.2
+    python -m src.benchmark --filtro crc32 --tamanhos 16 1048576
+"""
+
+import argparse
+from .suite import SAMPLES, TAMANHOS, Resultado, carregar, comparar, executar, salvar
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark", description="Micro-benchmarks das camadas física e de enlace.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=list(TAMANHOS), help="Tamanhos das mensagens, em bytes")
+    parser.add_argument("--samples", type=int, nargs="+", default=list(SAMPLES), help="Valores de sample da modulação por portadora")
+    parser.add_argument("--filtro", default="", help="Só executa os casos cujo nome contém este texto (ex.: receptor, crc32)")
+    parser.add_argument("--backend", default="numpy", choices=["python", "numpy"])
+    parser.add_argument("--tempo", type=float, default=0.2, help="Tempo aproximado de cada medição, em segundos")
+    parser.add_argument("--max-amostras", type=int, default=20_000_000, help="Pula as combinações que gerariam mais amostras que isso")
+    parser.add_argument("--salvar", help="Grava os resultados neste arquivo JSON (linha de base)")
+    parser.add_argument("--comparar", help="Compara os resultados com esta linha de base JSON")
+    parser.add_argument("--limite", type=float, default=0.25, help="Queda de vazão tolerada na comparação (0.25 = 25%%)")
+    return parser
+
+
+def _formatar(valor: float | None, unidade: str) -> str:
+    if valor is None:
+        return "-"
+    for prefixo in ("", "k", "M", "G"):
+        if valor < 1000:
+            return f"{valor:7.2f} {prefixo}{unidade}"
+        valor /= 1000
+    return f"{valor:7.2f} T{unidade}"
+
+
+def _exibir(resultado: Resultado) -> None:
+    sample: str = "-" if resultado.sample is None else str(resultado.sample)
+    print(f"{resultado.caso:50} {resultado.tamanho:>9} B  sample {sample:>5}  "
+          f"{_formatar(resultado.bits_por_segundo, 'bit/s'):>14}  {_formatar(resultado.amostras_por_segundo, 'amostra/s'):>18}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = criar_parser().parse_args(argv)
+    resultados: list[Resultado] = executar(
+        tuple(args.tamanhos), tuple(args.samples), args.filtro, args.backend, args.tempo, args.max_amostras, _exibir,
+    )
+    if args.salvar:
+        salvar(resultados, args.salvar)
+        print(f"Linha de base gravada em {args.salvar}")
+    if args.comparar:
+        regressoes = comparar(resultados, carregar(args.comparar), args.limite)
+        for atual, anterior, variacao in regressoes:
+            print(f"REGRESSÃO {atual.caso} ({atual.tamanho} B, sample {atual.sample}): "
+                  f"{_formatar(anterior.bits_por_segundo, 'bit/s').strip()} -> {_formatar(atual.bits_por_segundo, 'bit/s').strip()} ({variacao:+.0%})")
+        if regressoes:
+            print(f"{len(regressoes)} medições ficaram mais de {args.limite:.0%} abaixo da linha de base")
+            return 1
+        print(f"Nenhuma regressão acima de {args.limite:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,135 @@
+"""
+Relatório de sobrecarga por quadro: quanto cada enquadramento e cada MTU acrescentam à carga útil, para escolher o
+tamanho de quadro de cada enlace.
+
+Para cada combinação de enquadramento, detecção/correção e MTU, uma carga aleatória passa pela camada de enlace do
+Pipeline e os bytes entregues à camada física são separados em:
+    cabeçalho: byte de tamanho, cabeçalho varint ou as duas FLAGs da inserção de bytes;
+    escapes: ESCs inseridos antes dos FLAGs e ESCs da carga (só na inserção de bytes);
+    trailer: campo de verificação de cada quadro (Paridade por Quadro, CRC-32 por Quadro);
+    proteção: bits acrescentados à mensagem inteira (Bit de Paridade, CRC-32, códigos de Hamming).
+
+Com uma taxa de erro de bit, o relatório também estima o goodput: a eficiência multiplicada pela chance de a unidade
+verificada (o quadro, com verificação por quadro, ou a mensagem inteira) chegar sem nenhum bit invertido. Quadros
+grandes diluem o cabeçalho, mas ficam mais expostos a erros; o MTU de melhor goodput depende da taxa de erro.
+A estimativa não considera a correção dos códigos de Hamming.
+
+Exemplos:
+    python -m src.benchmark.enquadramento
+    python -m src.benchmark.enquadramento --mtu 64 1500 9000 65536 --deteccao "CRC-32 por Quadro" --taxa-erro 1e-5
+"""
+
+import argparse
+import itertools
+import time
+from dataclasses import dataclass
+import numpy as np
+from src.comunicacao.protocolo import DETECCOES_CORRECOES, ENQUADRAMENTOS
+from src.pipeline import LinkConfig, Pipeline
+from src.utils import VERIFICACOES_QUADRO
+
+
+@dataclass
+class SobrecargaQuadro:
+    """
+    Sobrecarga da camada de enlace para uma configuração.
+
+    Atributos:
+        carga: Bytes de carga útil.
+        quadros: Número de quadros.
+        cabecalho, escapes, trailer: Bytes acrescentados a todos os quadros, por origem.
+        protecao: Bits acrescentados à mensagem inteira pela detecção/correção.
+        bits_enlace: Bits entregues à camada física.
+        vazao: Bytes de carga útil por segundo enquadrados, protegidos, verificados e desenquadrados.
+    """
+    config: LinkConfig
+    carga: int
+    quadros: int
+    cabecalho: int
+    escapes: int
+    trailer: int
+    protecao: int
+    bits_enlace: int
+    vazao: float
+
+    @property
+    def por_quadro(self) -> float:
+        """
+        Bits acrescentados por quadro.
+        """
+        return (self.bits_enlace - 8 * self.carga) / max(self.quadros, 1)
+
+    @property
+    def eficiencia(self) -> float:
+        """
+        Fração dos bits entregues à camada física que são carga útil.
+        """
+        return 8 * self.carga / max(self.bits_enlace, 1)
+
+    def goodput(self, taxa_erro: float) -> float:
+        """
+        Goodput estimado com erros de bit independentes de probabilidade `taxa_erro`: a eficiência vezes a chance de
+        a unidade verificada (o quadro ou a mensagem inteira) chegar sem erros.
+        """
+        por_quadro: bool = self.config.deteccao_correcao in VERIFICACOES_QUADRO
+        bits_unidade: float = self.bits_enlace / max(self.quadros, 1) if por_quadro else self.bits_enlace
+        return self.eficiencia * (1 - taxa_erro) ** bits_unidade
+
+
+def medir_sobrecarga(config: LinkConfig, tamanho: int = 1 << 16, semente: int = 0) -> SobrecargaQuadro:
+    """
+    Mede a sobrecarga da camada de enlace com uma carga aleatória de `tamanho` bytes.
+
+    Args:
+        config (LinkConfig): A configuração do enlace (enquadramento, detecção/correção e MTU).
+        tamanho (int): Tamanho da carga útil, em bytes.
+        semente (int): Semente da carga aleatória.
+
+    Returns:
+        SobrecargaQuadro: A sobrecarga separada por origem.
+    """
+    carga: bytes = np.random.default_rng(semente).integers(0, 256, tamanho, dtype=np.uint8).tobytes()
+    pipeline: Pipeline = Pipeline(config)
+    inicio: float = time.perf_counter()
+    enquadrado: bytes = pipeline.enquadrar(carga)
+    bit_stream = pipeline.proteger(enquadrado)
+    byte_stream, _ = pipeline.verificar(bit_stream)
+    pipeline.desenquadrar(byte_stream)
+    duracao: float = time.perf_counter() - inicio
+
+    quadros: list[bytes] = pipeline.separar_quadros(enquadrado)  # Carga útil e trailer de cada quadro
+    verificacao = VERIFICACOES_QUADRO.get(config.deteccao_correcao)
+    trailer: int = len(quadros) * verificacao.tamanho if verificacao is not None else 0
+    delimitacao: int = len(enquadrado) - sum(map(len, quadros))
+    # Na inserção de bytes, tudo além das duas FLAGs de cada quadro são escapes
+    cabecalho: int = 2 * len(quadros) if config.enquadramento == "Insercao de Bytes" else delimitacao
+    return SobrecargaQuadro(
+        config, tamanho, len(quadros), cabecalho, delimitacao - cabecalho, trailer,
+        len(bit_stream) - 8 * len(enquadrado), len(bit_stream), tamanho / duracao if duracao else 0.0,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark.enquadramento", description="Sobrecarga por quadro de cada enquadramento e MTU.")
+    parser.add_argument("--enquadramento", nargs="+", default=["Contagem de Caracteres", "Contagem Varint", "Insercao de Bytes"], choices=list(ENQUADRAMENTOS))
+    parser.add_argument("--deteccao", nargs="+", default=["Nenhum", "CRC-32", "CRC-32 por Quadro"], choices=list(DETECCOES_CORRECOES))
+    parser.add_argument("--mtu", type=int, nargs="+", default=[4, 64, 255, 1500, 9000, 65536], help="Tamanhos máximos da carga de cada quadro, em bytes")
+    parser.add_argument("--tamanho", type=int, default=1 << 16, help="Tamanho da carga útil, em bytes")
+    parser.add_argument("--taxa-erro", type=float, default=1e-5, help="Probabilidade de erro de bit usada na estimativa do goodput")
+    args = parser.parse_args(argv)
+
+    print(f"{'enquadramento':<23} {'detecção':<18} {'MTU':>6} {'quadros':>8} {'cabeç.':>7} {'escapes':>8} {'trailer':>8} "
+          f"{'proteção':>9} {'extra/quadro':>12} {'eficiência':>11} {'goodput':>8} {'vazão':>11}")
+    for enquadramento, deteccao, mtu in itertools.product(args.enquadramento, args.deteccao, args.mtu):
+        config: LinkConfig = LinkConfig(enquadramento=enquadramento, deteccao_correcao=deteccao, mtu=mtu)
+        if mtu > config.mtu_maximo:
+            continue  # MTU que não cabe no cabeçalho deste enquadramento (ex.: mais de 255 bytes na contagem de caracteres)
+        sobrecarga: SobrecargaQuadro = medir_sobrecarga(config, args.tamanho)
+        print(f"{enquadramento:<23} {deteccao:<18} {mtu:>6} {sobrecarga.quadros:>8} {sobrecarga.cabecalho:>7} {sobrecarga.escapes:>8} "
+              f"{sobrecarga.trailer:>8} {sobrecarga.protecao:>9} {sobrecarga.por_quadro:>12.1f} {sobrecarga.eficiencia:>10.1%} "
+              f"{sobrecarga.goodput(args.taxa_erro):>7.1%} {sobrecarga.vazao / 1e6:>7.1f} MB/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+"""
+Mede o tempo de importação dos pacotes com `python -X importtime` e verifica um orçamento, para que um processo
+sem interface (um decodificador, um trabalhador da simulação) continue iniciando rápido.
+
+O custo do NumPy, que todos os pacotes usam, é descontado: o orçamento vale para o que o próprio projeto acrescenta.
+Também falha se algum módulo pesado que só as interfaces usam (matplotlib, tkinter) for importado.
+
+Exemplos:
+    python -m src.benchmark.importacao
+    python -m src.benchmark.importacao --modulos src.pipeline --orcamento 30 --repeticoes 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Orçamento de cada pacote, em milissegundos além do NumPy
+ORCAMENTOS: dict[str, float] = {
+    "src.utils": 30.0,
+    "src.receptor": 30.0,
+    "src.comunicacao": 40.0,
+    "src.pipeline": 50.0,
+}
+# Módulos que não devem ser carregados fora das interfaces gráficas
+PROIBIDOS: tuple[str, ...] = ("matplotlib", "tkinter", "src.comunicacao.servidor")
+RAIZ: str = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))  # Diretório que contém o pacote src
+
+
+def medir_importacao(modulo: str) -> dict[str, float]:
+    """
+    Importa o módulo em um interpretador novo com -X importtime.
+
+    Returns:
+        dict[str, float]: O tempo acumulado (em ms) de cada módulo carregado, pelo nome.
+    """
+    processo = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"], cwd=RAIZ,
+                              capture_output=True, text=True, check=True)
+    tempos: dict[str, float] = {}
+    for linha in processo.stderr.splitlines():
+        # Formato: "import time: <próprio us> | <acumulado us> | <nome indentado>"
+        if not linha.startswith("import time:"):
+            continue
+        _, acumulado, nome = linha[len("import time:"):].split("|")
+        if acumulado.strip().isdigit():
+            tempos[nome.strip()] = int(acumulado) / 1000
+    return tempos
+
+
+def _melhor_tempo(modulo: str, repeticoes: int) -> tuple[float, dict[str, float]]:
+    """
+    Importa o módulo `repeticoes` vezes e fica com a medição mais rápida (a menos afetada por ruído e pela compilação
+    dos .pyc). Retorna o tempo total em ms e os tempos de todos os módulos dessa medição.
+    """
+    medicoes: list[dict[str, float]] = [medir_importacao(modulo) for _ in range(repeticoes)]
+    melhor: dict[str, float] = min(medicoes, key=lambda tempos: tempos[modulo])
+    return melhor[modulo], melhor
+
+
+def verificar(modulos: list[str], orcamento: float | None = None, repeticoes: int = 10) -> list[tuple[str, float, float, float, list[str]]]:
+    """
+    Mede a importação de cada módulo e compara o que ela custa além de `import numpy` (medido à parte, em um
+    interpretador só com o NumPy) com o orçamento.
+
+    Args:
+        modulos (list[str]): Os módulos a importar.
+        orcamento (float, opcional): Orçamento comum, em ms; se omitido, usa o de ORCAMENTOS.
+        repeticoes (int): Número de interpretadores iniciados por módulo.
+
+    Returns:
+        list[tuple]: Para cada módulo: nome, tempo total (ms), tempo do NumPy sozinho (ms), orçamento (ms) e os
+        módulos proibidos que foram carregados.
+    """
+    numpy, _ = _melhor_tempo("numpy", repeticoes)
+    resultados: list[tuple[str, float, float, float, list[str]]] = []
+    for modulo in modulos:
+        total, tempos = _melhor_tempo(modulo, repeticoes)
+        proibidos: list[str] = sorted(nome for nome in tempos if nome.split(".")[0] in PROIBIDOS or nome in PROIBIDOS)
+        limite: float = orcamento if orcamento is not None else ORCAMENTOS.get(modulo, 50.0)
+        resultados.append((modulo, total, numpy, limite, proibidos))
+    return resultados
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark.importacao", description="Orçamento de tempo de importação dos pacotes.")
+    parser.add_argument("--modulos", nargs="+", default=list(ORCAMENTOS), help="Módulos a importar")
+    parser.add_argument("--orcamento", type=float, help="Orçamento de cada módulo em ms, além do NumPy (padrão: o de cada pacote)")
+    parser.add_argument("--repeticoes", type=int, default=10, help="Interpretadores iniciados por módulo (vale o menor tempo)")
+    args = parser.parse_args()
+
+    falhou: bool = False
+    print(f"{'módulo':<18} {'total':>9} {'numpy':>9} {'próprio':>9} {'orçamento':>10}")
+    for modulo, total, numpy, limite, proibidos in verificar(args.modulos, args.orcamento, args.repeticoes):
+        proprio: float = total - numpy
+        excedeu: bool = proprio > limite or bool(proibidos)
+        falhou |= excedeu
+        print(f"{modulo:<18} {total:7.1f}ms {numpy:7.1f}ms {proprio:7.1f}ms {limite:8.1f}ms  {'EXCEDEU' if excedeu else 'ok'}")
+        if proibidos:
+            print(f"    módulos proibidos carregados: {', '.join(proibidos)}")
+    sys.exit(1 if falhou else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import json
+import platform
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable
+import numpy as np
+from src.transmissor import CamadaEnlaceTransmissor, CamadaFisicaTransmissor
+from src.receptor import CamadaEnlaceReceptor, CamadaFisicaReceptor
+from src.utils import BitBuffer
+
+TAMANHOS: tuple[int, ...] = (16, 256, 4096, 65536, 1 << 20)  # De 16 B a 1 MB
+SAMPLES: tuple[int, ...] = (8, 100, 1000)
+FREQUENCIAS_MFSK: tuple[float, ...] = (1.0, 2.0, 3.0, 4.0)
+
+
+@dataclass
+class Caso:
+    """
+    Um método medido pela suíte.
+
+    Args:
+        nome (str): Identificador do caso, no formato "camada.metodo".
+        preparar (Callable): Recebe os dados e o sample e retorna a função a ser cronometrada (sem argumentos) e o
+            número de amostras que ela produz ou consome (0 para os métodos que não trabalham com amostras).
+        usa_sample (bool): Se o caso deve ser repetido para cada valor de sample.
+    """
+    nome: str
+    preparar: Callable[[bytes, int], tuple[Callable[[], object], int]]
+    usa_sample: bool = False
+
+
+@dataclass
+class Resultado:
+    """
+    Medição de um caso para um tamanho de mensagem (e um sample, nos casos de modulação por portadora).
+    """
+    caso: str
+    tamanho: int  # Bytes de carga útil
+    sample: int | None
+    segundos: float  # Melhor tempo de uma chamada
+    repeticoes: int
+    bits_por_segundo: float  # Bits de carga útil processados por segundo
+    amostras_por_segundo: float | None
+
+    @property
+    def chave(self) -> tuple[str, int, int | None]:
+        return (self.caso, self.tamanho, self.sample)
+
+
+def criar_casos(backend: str = "numpy") -> list[Caso]:
+    """
+    Monta os casos de todos os métodos públicos das camadas do transmissor e do receptor.
+
+    Os dados de entrada de cada método do receptor são gerados pelo método correspondente do transmissor, fora do
+    trecho cronometrado.
+    """
+    enlace_tx: CamadaEnlaceTransmissor = CamadaEnlaceTransmissor()
+    enlace_rx: CamadaEnlaceReceptor = CamadaEnlaceReceptor()
+
+    def fisica(sample: int) -> tuple[CamadaFisicaTransmissor, CamadaFisicaReceptor]:
+        return CamadaFisicaTransmissor(sample, 1.0, 1.0, 0.0, backend=backend), CamadaFisicaReceptor(sample, 1.0, 1.0, 0.0)
+
+    def enlace(metodo: Callable, entrada: Callable[[bytes], object] = lambda dados: dados):
+        def preparar(dados: bytes, sample: int):
+            argumento = entrada(dados)
+            return (lambda: metodo(argumento)), 0
+        return preparar
+
+    def linha(metodo: Callable, entrada: Callable[[BitBuffer], object] = lambda bits: bits):
+        def preparar(dados: bytes, sample: int):
+            argumento = entrada(BitBuffer(dados))
+            return (lambda: metodo(argumento)), 0
+        return preparar
+
+    def portadora(modular: Callable, demodular: Callable | None = None):
+        # modular(tx, dig_signal) gera a onda; nos casos do receptor, a onda é gerada antes e só demodular(rx, wave, dig_signal) é medido
+        def preparar(dados: bytes, sample: int):
+            tx, rx = fisica(sample)
+            dig_signal: np.ndarray = tx.nrz_polar(BitBuffer(dados))
+            wave = modular(tx, dig_signal)  # Também dá o número de amostras (o 8-QAM e o M-FSK agrupam bits por símbolo)
+            if demodular is None:
+                return (lambda: modular(tx, dig_signal)), len(wave)
+            return (lambda: demodular(rx, wave, dig_signal)), len(wave)
+        return preparar
+
+    def ask(tx: CamadaFisicaTransmissor, dig_signal: np.ndarray):
+        return tx.ask(dig_signal, "NRZ-Polar")
+
+    def fsk(tx: CamadaFisicaTransmissor, dig_signal: np.ndarray):
+        return tx.fsk(dig_signal, "NRZ-Polar", 1.0, 2.0)
+
+    def qam8(tx: CamadaFisicaTransmissor, dig_signal: np.ndarray):
+        return tx.qam8_modulation(list(dig_signal) if tx.backend == "python" else dig_signal, "NRZ-Polar")  # O laço em Python puro altera a lista
+
+    def mfsk(tx: CamadaFisicaTransmissor, dig_signal: np.ndarray):
+        return tx.mfsk(dig_signal, "NRZ-Polar", FREQUENCIAS_MFSK)
+
+    tx, rx = fisica(8)
+    return [
+        # Camada de enlace do transmissor
+        Caso("transmissor.contagem_de_caracteres", enlace(enlace_tx.contagem_de_caracteres)),
+        Caso("transmissor.contagem_varint", enlace(enlace_tx.contagem_varint)),
+        Caso("transmissor.insercao_de_bytes", enlace(enlace_tx.insercao_de_bytes)),
+        Caso("transmissor.bit_de_paridade", enlace(enlace_tx.bit_de_paridade)),
+        Caso("transmissor.crc32", enlace(enlace_tx.crc32)),
+        Caso("transmissor.hamming", enlace(enlace_tx.hamming)),
+        Caso("transmissor.hamming_em_blocos", enlace(enlace_tx.hamming_em_blocos)),
+        # Camada de enlace do receptor
+        Caso("receptor.desenquadramento_contagem_de_caracteres", enlace(enlace_rx.desenquadramento_contagem_de_caracteres, enlace_tx.contagem_de_caracteres)),
+        Caso("receptor.desenquadramento_contagem_varint", enlace(enlace_rx.desenquadramento_contagem_varint, enlace_tx.contagem_varint)),
+        Caso("receptor.desenquadramento_insercao_de_bytes", enlace(enlace_rx.desenquadramento_insercao_de_bytes, enlace_tx.insercao_de_bytes)),
+        Caso("receptor.verificar_bits_de_paridade", enlace(enlace_rx.verificar_bits_de_paridade, enlace_tx.bit_de_paridade)),
+        Caso("receptor.verificar_crc32", enlace(enlace_rx.verificar_crc32, enlace_tx.crc32)),
+        Caso("receptor.corrigir_hamming", enlace(enlace_rx.corrigir_hamming, enlace_tx.hamming)),
+        Caso("receptor.corrigir_hamming_em_blocos", enlace(enlace_rx.corrigir_hamming_em_blocos, enlace_tx.hamming_em_blocos)),
+        # Camada física: codificação de linha
+        Caso("transmissor.gerador_bit_stream", linha(tx.gerador_bit_stream)),
+        Caso("transmissor.nrz_polar", linha(tx.nrz_polar)),
+        Caso("transmissor.manchester", linha(tx.manchester)),
+        Caso("transmissor.bipolar", linha(tx.bipolar)),
+        Caso("receptor.decodificar_nrz_polar", linha(rx.decodificar_nrz_polar, tx.nrz_polar)),
+        Caso("receptor.decodificar_manchester", linha(rx.decodificar_manchester, tx.manchester)),
+        Caso("receptor.decodificar_bipolar", linha(rx.decodificar_bipolar, tx.bipolar)),
+        # Camada física: modulação por portadora
+        Caso("transmissor.ask", portadora(ask), usa_sample=True),
+        Caso("transmissor.fsk", portadora(fsk), usa_sample=True),
+        Caso("transmissor.qam8_modulation", portadora(qam8), usa_sample=True),
+        Caso("transmissor.mfsk", portadora(mfsk), usa_sample=True),
+        Caso("receptor.decodificar_ask", portadora(ask, lambda rx, wave, dig: rx.decodificar_ask(wave, "NRZ-Polar")), usa_sample=True),
+        Caso("receptor.decodificar_fsk", portadora(fsk, lambda rx, wave, dig: rx.decodificar_fsk(wave, "NRZ-Polar", 1.0, 2.0)), usa_sample=True),
+        Caso("receptor.decodificar_qam8", portadora(qam8, lambda rx, wave, dig: rx.decodificar_qam8(wave, "NRZ-Polar", len(dig))), usa_sample=True),
+        Caso("receptor.decodificar_mfsk", portadora(mfsk, lambda rx, wave, dig: rx.decodificar_mfsk(wave, "NRZ-Polar", FREQUENCIAS_MFSK, len(dig))), usa_sample=True),
+    ]
+
+
+def medir(funcao: Callable[[], object], tempo_minimo: float = 0.2, rodadas: int = 3) -> tuple[float, int]:
+    """
+    Cronometra uma função como o timeit: calibra quantas chamadas cabem em tempo_minimo / rodadas e retorna o melhor
+    tempo médio por chamada entre as rodadas.
+
+    Returns:
+        tuple[float, int]: O tempo por chamada, em segundos, e o número total de chamadas feitas.
+    """
+    inicio: float = time.perf_counter()
+    funcao()  # Primeira chamada (aquece caches) também serve de calibração
+    estimativa: float = max(time.perf_counter() - inicio, 1e-9)
+    chamadas: int = max(1, int(tempo_minimo / rodadas / estimativa))
+    melhor: float = estimativa
+    for _ in range(rodadas if estimativa < tempo_minimo else 0):
+        inicio = time.perf_counter()
+        for _ in range(chamadas):
+            funcao()
+        melhor = min(melhor, (time.perf_counter() - inicio) / chamadas)
+    return melhor, 1 + (rodadas * chamadas if estimativa < tempo_minimo else 0)
+
+
+def executar(tamanhos: tuple[int, ...] = TAMANHOS, samples: tuple[int, ...] = SAMPLES, filtro: str = "",
+             backend: str = "numpy", tempo_minimo: float = 0.2, max_amostras: int = 20_000_000,
+             ao_medir: Callable[[Resultado], None] | None = None) -> list[Resultado]:
+    """
+    Executa a suíte completa.
+
+    Args:
+        tamanhos (tuple[int, ...]): Tamanhos das mensagens, em bytes.
+        samples (tuple[int, ...]): Valores de sample usados nos casos de modulação por portadora.
+        filtro (str): Só executa os casos cujo nome contém este texto.
+        backend (str): Backend da modulação no transmissor ("numpy" ou "python").
+        tempo_minimo (float): Tempo aproximado gasto em cada medição, em segundos.
+        max_amostras (int): Combinações de tamanho e sample que gerariam mais amostras que isso são puladas (1 MB com
+            sample 1000 seriam 8 bilhões de amostras).
+        ao_medir (Callable, opcional): Chamada a cada resultado, para exibir o progresso.
+
+    Returns:
+        list[Resultado]: Os resultados de todas as medições.
+    """
+    gerador: np.random.Generator = np.random.default_rng(0)
+    resultados: list[Resultado] = []
+    for caso in criar_casos(backend):
+        if filtro not in caso.nome:
+            continue
+        for tamanho in tamanhos:
+            dados: bytes = gerador.integers(0, 256, tamanho, dtype=np.uint8).tobytes()
+            for sample in (samples if caso.usa_sample else (None,)):
+                if sample is not None and tamanho * 8 * sample > max_amostras:
+                    continue
+                funcao, amostras = caso.preparar(dados, sample or 8)
+                segundos, repeticoes = medir(funcao, tempo_minimo)
+                resultado: Resultado = Resultado(
+                    caso.nome, tamanho, sample, segundos, repeticoes,
+                    tamanho * 8 / segundos, amostras / segundos if amostras else None,
+                )
+                resultados.append(resultado)
+                if ao_medir is not None:
+                    ao_medir(resultado)
+    return resultados
+
+
+def salvar(resultados: list[Resultado], caminho: str) -> None:
+    """
+    Grava os resultados como uma linha de base em JSON, junto com a identificação do ambiente.
+    """
+    conteudo: dict = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "maquina": platform.machine(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "resultados": [asdict(resultado) for resultado in resultados],
+    }
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(conteudo, arquivo, indent=2)
+
+
+def carregar(caminho: str) -> list[Resultado]:
+    with open(caminho, encoding="utf-8") as arquivo:
+        return [Resultado(**resultado) for resultado in json.load(arquivo)["resultados"]]
+
+
+def comparar(atuais: list[Resultado], base: list[Resultado], limite: float = 0.25) -> list[tuple[Resultado, Resultado, float]]:
+    """
+    Compara os resultados com uma linha de base.
+
+    Args:
+        limite (float): Queda relativa de vazão tolerada (0.25 = até 25% mais lento que a linha de base).
+
+    Returns:
+        list[tuple[Resultado, Resultado, float]]: As regressões: o resultado atual, o da linha de base e a variação
+        relativa da vazão (negativa quando ficou mais lento). Medições sem correspondente na base são ignoradas.
+    """
+    por_chave: dict[tuple, Resultado] = {resultado.chave: resultado for resultado in base}
+    regressoes: list[tuple[Resultado, Resultado, float]] = []
+    for atual in atuais:
+        anterior: Resultado | None = por_chave.get(atual.chave)
+        if anterior is None:
+            continue
+        variacao: float = atual.bits_por_segundo / anterior.bits_por_segundo - 1
+        if variacao < -limite:
+            regressoes.append((atual, anterior, variacao))
+    return regressoes
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Compara os modos de envio da onda no protocolo: bytes na rede contra o custo de codificar e de decodificar.
+
+Para cada combinação de tipo de amostra (float32, float64, int16, int8, simbolos) e compressão (Nenhuma, zlib, lzma),
+uma mensagem gerada pelo Pipeline é serializada, desserializada e recebida (demodulação e decodificação inteiras),
+e a carga útil recebida é comparada com a enviada.
+
+Exemplos:
+    python -m src.benchmark.transporte
+    python -m src.benchmark.transporte --tamanho 4096 --mod-portadora FSK --sample 32
+"""
+
+import argparse
+import itertools
+import time
+from dataclasses import dataclass
+import numpy as np
+from src.comunicacao import COMPRESSOES, TIPOS_AMOSTRA, Mensagem, codificar, decodificar
+from src.pipeline import LinkConfig, Pipeline
+
+
+@dataclass
+class ResultadoTransporte:
+    """
+    Medição de um modo de envio.
+
+    Atributos:
+        bytes_rede: Tamanho da mensagem serializada (cabeçalho e corpo).
+        codificacao: Tempo de codificar() a mensagem, em segundos.
+        decodificacao: Tempo de decodificar() os bytes e receber a mensagem pelo Pipeline, em segundos.
+        correto: Se a carga útil recebida é igual à enviada.
+    """
+    tipo_amostra: str
+    compressao: str
+    bytes_rede: int
+    codificacao: float
+    decodificacao: float
+    correto: bool
+
+
+def _melhor_tempo(funcao, repeticoes: int):
+    """
+    Executa a função `repeticoes` vezes e retorna o menor tempo, em segundos, e o último resultado.
+    """
+    melhor: float = float("inf")
+    for _ in range(repeticoes):
+        inicio: float = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def medir_modos(config: LinkConfig, tamanho: int = 1024, repeticoes: int = 5, semente: int = 0) -> list[ResultadoTransporte]:
+    """
+    Mede todos os modos de envio com uma carga aleatória de `tamanho` bytes.
+
+    Args:
+        config (LinkConfig): A configuração do enlace usada para gerar a onda.
+        tamanho (int): Tamanho da carga útil, em bytes.
+        repeticoes (int): Repetições de cada medição (vale o menor tempo).
+        semente (int): Semente da carga aleatória.
+
+    Returns:
+        list[ResultadoTransporte]: Um resultado por combinação de tipo de amostra e compressão.
+    """
+    carga: bytes = np.random.default_rng(semente).integers(0, 256, tamanho, dtype=np.uint8).tobytes()
+    transmissao = Pipeline(config).transmitir(carga)
+    resultados: list[ResultadoTransporte] = []
+    for tipo_amostra, compressao in itertools.product(TIPOS_AMOSTRA, COMPRESSOES):
+        mensagem: Mensagem = config.para_mensagem(np.asarray(transmissao.wave), transmissao.dig_signal, tipo_amostra, compressao)
+        codificacao, dados = _melhor_tempo(lambda: codificar(mensagem), repeticoes)
+
+        def receber():
+            recebida: Mensagem = decodificar(dados)
+            return Pipeline(LinkConfig.de_mensagem(recebida)).receber_mensagem(recebida)
+
+        decodificacao, recepcao = _melhor_tempo(receber, repeticoes)
+        resultados.append(ResultadoTransporte(tipo_amostra, compressao, len(dados), codificacao, decodificacao,
+                                              recepcao.dados == carga and recepcao.integro))
+    return resultados
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark.transporte", description="Bytes na rede contra custo de decodificação de cada modo de envio da onda.")
+    parser.add_argument("--tamanho", type=int, default=1024, help="Tamanho da carga útil, em bytes")
+    parser.add_argument("--mod-digital", default="NRZ-Polar", choices=["NRZ-Polar", "Manchester", "Bipolar"])
+    parser.add_argument("--mod-portadora", default="ASK", choices=["ASK", "FSK", "8-QAM", "M-FSK"])
+    parser.add_argument("--sample", type=int, default=100, help="Amostras por símbolo")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Repetições de cada medição (vale o menor tempo)")
+    args = parser.parse_args()
+
+    config: LinkConfig = LinkConfig(mod_digital=args.mod_digital, mod_portadora=args.mod_portadora, sample=args.sample)
+    resultados: list[ResultadoTransporte] = medir_modos(config, args.tamanho, args.repeticoes)
+    referencia: int = resultados[0].bytes_rede  # float32 sem compressão, o modo padrão
+    print(f"{'amostras':<9} {'compressão':<10} {'bytes':>11} {'relativo':>9} {'codificação':>12} {'decodificação':>14}  carga")
+    for resultado in resultados:
+        print(f"{resultado.tipo_amostra:<9} {resultado.compressao:<10} {resultado.bytes_rede:>11} {resultado.bytes_rede / referencia:>8.1%} "
+              f"{resultado.codificacao * 1000:>10.2f}ms {resultado.decodificacao * 1000:>12.2f}ms  {'ok' if resultado.correto else 'ERRADA'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from .erros import ModeloErro, CanalBernoulli, CanalGilbertElliott
+from .analogico import CanalAnalogico
+
+__all__ = ["ModeloErro", "CanalBernoulli", "CanalGilbertElliott", "CanalAnalogico"]
\ No newline at end of file
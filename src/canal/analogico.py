@@ -0,0 +1,146 @@
+from typing import Iterable, Iterator
+import numpy as np
+
+
+class CanalAnalogico:
+    """
+    Canal analógico aplicado às amostras da onda, entre a saída do CamadaFisicaTransmissor e a entrada do
+    CamadaFisicaReceptor: atenuação, desvio de fase e de frequência da portadora e ruído branco gaussiano (AWGN).
+
+    Todas as operações são feitas sobre o array inteiro. Os desvios de fase e frequência giram o sinal analítico
+    (obtido pela transformada de Hilbert, via FFT); sem desvios, cada amostra é tratada independentemente.
+
+    O nível de ruído é dado pela SNR (potência do sinal recebido / potência do ruído) ou pela Eb/N0, com
+    N0/2 = variância do ruído e Eb = potência * sample / bits_por_simbolo. A potência do sinal é medida em cada
+    chamada de aplicar() (no fluxo, no primeiro pedaço de cada fluxo), a menos que seja informada em potencia_sinal;
+    assim o mesmo canal pode ser usado com ondas de amplitudes diferentes.
+
+    Args:
+        snr_db (float, opcional): Relação sinal-ruído por amostra, em dB.
+        ebn0_db (float, opcional): Relação energia por bit / densidade de ruído, em dB (ignorada se snr_db for dada).
+        atenuacao_db (float): Perda do canal, em dB (aplicada antes do ruído).
+        desvio_fase (float): Desvio de fase da portadora, em radianos.
+        desvio_frequencia (float): Desvio de frequência da portadora, em ciclos por símbolo (a unidade de `frequencia`).
+        sample (int): Amostras por símbolo, para converter o tempo e a Eb/N0.
+        bits_por_simbolo (float): Bits transmitidos por símbolo da portadora, para a Eb/N0.
+        potencia_sinal (float, opcional): Potência média do sinal transmitido; se omitida, é medida em cada onda.
+        semente (opcional): Semente do gerador do ruído (int, SeedSequence ou Generator), para resultados reproduzíveis.
+
+    Exemplo:
+        canal = CanalAnalogico(ebn0_db=6, sample=100, desvio_fase=0.3, semente=1)
+        recebida = canal.aplicar(transmissao.wave)
+    """
+
+    def __init__(self, snr_db: float | None = None, ebn0_db: float | None = None, atenuacao_db: float = 0.0,
+                 desvio_fase: float = 0.0, desvio_frequencia: float = 0.0, sample: int = 100, bits_por_simbolo: float = 1.0,
+                 potencia_sinal: float | None = None,
+                 semente: int | np.random.SeedSequence | np.random.Generator | None = None) -> None:
+        self.snr_db: float | None = snr_db
+        self.ebn0_db: float | None = ebn0_db
+        self.ganho: float = 10 ** (-atenuacao_db / 20)  # Ganho de amplitude correspondente à perda
+        self.desvio_fase: float = desvio_fase
+        self.desvio_frequencia: float = desvio_frequencia
+        self.sample: int = sample
+        self.bits_por_simbolo: float = bits_por_simbolo
+        self.potencia_sinal: float | None = potencia_sinal
+        self.gerador: np.random.Generator = np.random.default_rng(semente)
+
+    @property
+    def gira_portadora(self) -> bool:
+        return self.desvio_fase != 0 or self.desvio_frequencia != 0
+
+    def desvio_padrao_ruido(self, potencia_recebida: float) -> float:
+        """
+        Desvio padrão do ruído para a potência do sinal já atenuado.
+        """
+        if self.snr_db is not None:
+            return float(np.sqrt(potencia_recebida / 10 ** (self.snr_db / 10)))
+        if self.ebn0_db is not None:
+            eb: float = potencia_recebida * self.sample / self.bits_por_simbolo
+            return float(np.sqrt(eb / (2 * 10 ** (self.ebn0_db / 10))))
+        return 0.0
+
+    def _processar(self, wave: np.ndarray, inicio: int) -> np.ndarray:
+        """
+        Aplica o canal a um trecho sem ruído; `inicio` é o índice absoluto da primeira amostra (para o desvio de
+        frequência continuar em fase entre os pedaços).
+        """
+        if not self.gira_portadora:
+            return wave * self.ganho
+        # Sinal analítico: zera as frequências negativas e dobra as positivas
+        espectro: np.ndarray = np.fft.fft(wave)
+        filtro: np.ndarray = np.zeros(len(wave))
+        filtro[0] = 1
+        filtro[1:(len(wave) + 1) // 2] = 2
+        if len(wave) % 2 == 0 and len(wave):
+            filtro[len(wave) // 2] = 1
+        analitico: np.ndarray = np.fft.ifft(espectro * filtro)
+        t: np.ndarray = (inicio + np.arange(len(wave))) / self.sample
+        rotacao: np.ndarray = np.exp(1j * (self.desvio_fase + 2 * np.pi * self.desvio_frequencia * t))
+        return (analitico * rotacao).real * self.ganho
+
+    def _potencia(self, recebida: np.ndarray) -> float:
+        """
+        Potência do sinal transmitido: a informada ou, se omitida, a medida no trecho já atenuado.
+        """
+        if self.potencia_sinal is not None:
+            return self.potencia_sinal
+        return float(np.mean(np.square(recebida))) / self.ganho**2 if len(recebida) else 0.0
+
+    def _ruido(self, recebida: np.ndarray, potencia: float) -> np.ndarray:
+        sigma: float = self.desvio_padrao_ruido(potencia * self.ganho**2)
+        if sigma > 0:
+            recebida += self.gerador.normal(0.0, sigma, len(recebida))
+        return recebida
+
+    def aplicar(self, wave: list[float] | np.ndarray) -> np.ndarray:
+        """
+        Passa a onda inteira pelo canal.
+
+        Returns:
+            np.ndarray: A onda recebida (float64), do mesmo tamanho da transmitida.
+        """
+        recebida: np.ndarray = self._processar(np.asarray(wave, dtype=np.float64), 0)
+        return self._ruido(recebida, self._potencia(recebida))
+
+    def fluxo(self, pedacos: Iterable[np.ndarray], margem: int = 4096) -> Iterator[np.ndarray]:
+        """
+        Passa uma onda longa pelo canal em pedaços, sem precisar dela inteira na memória.
+
+        Sem desvios de fase/frequência, cada pedaço sai assim que entra. Com desvios, a transformada de Hilbert de cada
+        trecho usa `margem` amostras de contexto de cada lado, então a saída atrasa `margem` amostras em relação à
+        entrada (o restante sai ao fim do fluxo). O resultado difere do de aplicar() só por efeitos de borda da
+        transformada, que diminuem com a margem.
+
+        Args:
+            pedacos (Iterable[np.ndarray]): Os pedaços consecutivos da onda transmitida.
+            margem (int): Amostras de contexto usadas em cada lado do trecho processado.
+
+        Returns:
+            Iterator[np.ndarray]: Os pedaços da onda recebida; concatenados, têm o tamanho da onda transmitida.
+        """
+        potencia: float | None = None  # Medida no primeiro pedaço e mantida no resto do fluxo
+        if not self.gira_portadora:
+            for pedaco in pedacos:
+                recebida: np.ndarray = self._processar(np.asarray(pedaco, dtype=np.float64), 0)
+                potencia = self._potencia(recebida) if potencia is None else potencia
+                yield self._ruido(recebida, potencia)
+            return
+
+        anterior: np.ndarray = np.zeros(0)  # Contexto à esquerda (já emitido)
+        pendente: np.ndarray = np.zeros(0)  # Amostras recebidas e ainda não emitidas
+        inicio: int = 0  # Índice absoluto de pendente[0]
+        for pedaco in pedacos:
+            pendente = np.concatenate([pendente, np.asarray(pedaco, dtype=np.float64)])
+            prontas: int = len(pendente) - margem  # Amostras que já têm `margem` de contexto à direita
+            if prontas <= 0:
+                continue
+            trecho: np.ndarray = self._processar(np.concatenate([anterior, pendente]), inicio - len(anterior))[len(anterior):len(anterior) + prontas]
+            potencia = self._potencia(trecho) if potencia is None else potencia
+            yield self._ruido(trecho, potencia)
+            anterior = np.concatenate([anterior, pendente[:prontas]])[-margem:]
+            pendente = pendente[prontas:]
+            inicio += prontas
+        if len(pendente):
+            trecho = self._processar(np.concatenate([anterior, pendente]), inicio - len(anterior))[len(anterior):]
+            yield self._ruido(trecho, self._potencia(trecho) if potencia is None else potencia)
\ No newline at end of file
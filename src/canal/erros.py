@@ -0,0 +1,178 @@
+from abc import ABC, abstractmethod
+import numpy as np
+from src.utils import BitBuffer
+
+_PERMANENTE: int = 1 << 40  # Duração usada para um estado sem saída (maior que qualquer trem de bits)
+
+
+class ModeloErro(ABC):
+    """
+    Base dos modelos de erro de bit do canal: geram a máscara de inversões e a aplicam ao trem de bits com um XOR.
+
+    O gerador aleatório e o estado do modelo (distância até o próximo erro, estado da rajada) são mantidos entre as
+    chamadas, então um trem longo pode ser passado pelo canal em pedaços sem alterar a estatística dos erros.
+
+    Args:
+        semente (int | np.random.SeedSequence | np.random.Generator, opcional): Semente do gerador aleatório, para
+            que as execuções sejam reproduzíveis. Sem semente, usa a entropia do sistema.
+    """
+
+    def __init__(self, semente: int | np.random.SeedSequence | np.random.Generator | None = None) -> None:
+        self.gerador: np.random.Generator = np.random.default_rng(semente)
+
+    @abstractmethod
+    def posicoes(self, n_bits: int) -> np.ndarray:
+        """
+        Retorna as posições (em ordem crescente) dos bits invertidos nos próximos n_bits. Implementado por cada modelo.
+        """
+
+    def mascara(self, n_bits: int) -> BitBuffer:
+        """
+        Gera a máscara compactada dos próximos n_bits: bit 1 onde o canal inverte o bit transmitido.
+        """
+        posicoes: np.ndarray = self.posicoes(n_bits)
+        dados: np.ndarray = np.zeros((n_bits + 7) // 8, dtype=np.uint8)
+        # Várias posições podem cair no mesmo byte, por isso o OR acumulado (np.bitwise_or.at) em vez de atribuição
+        np.bitwise_or.at(dados, posicoes >> 3, (0x80 >> (posicoes & 7)).astype(np.uint8))
+        return BitBuffer(dados, n_bits)
+
+    def aplicar(self, bits: BitBuffer) -> BitBuffer:
+        """
+        Passa o trem de bits pelo canal, invertendo os bits da máscara em uma única operação.
+        """
+        return bits ^ self.mascara(len(bits))
+
+
+class CanalBernoulli(ModeloErro):
+    """
+    Erros independentes: cada bit é invertido com a mesma probabilidade.
+
+    Em vez de sortear um número por bit, sorteia a distância até o próximo erro (distribuição geométrica), então o
+    custo é proporcional ao número de erros e não ao número de bits.
+
+    Args:
+        probabilidade (float): Probabilidade de inversão de cada bit, entre 0 e 1.
+        semente (opcional): Semente do gerador aleatório (ver ModeloErro).
+
+    Exemplo:
+        canal = CanalBernoulli(1e-3, semente=42)
+        recebido = canal.aplicar(BitBuffer(b"Ola, mundo"))
+    """
+
+    def __init__(self, probabilidade: float, semente: int | np.random.SeedSequence | np.random.Generator | None = None) -> None:
+        if not 0 <= probabilidade <= 1:
+            raise ValueError(f"Probabilidade de erro inválida: {probabilidade}")
+        super().__init__(semente)
+        self.probabilidade: float = probabilidade
+        self._proximo: int = self._distancia()  # Posição do próximo erro, contada a partir do início da próxima chamada
+
+    def _distancia(self) -> int:
+        # Bits até o próximo erro, inclusive (0 quando não há erros: o valor nunca é usado)
+        return int(self.gerador.geometric(self.probabilidade)) - 1 if self.probabilidade > 0 else 0
+
+    def posicoes(self, n_bits: int) -> np.ndarray:
+        if self.probabilidade == 0:
+            return np.zeros(0, dtype=np.int64)
+        partes: list[np.ndarray] = []
+        inicio: int = self._proximo
+        while inicio < n_bits:
+            # Sorteia de uma vez as distâncias para cobrir (com folga) o restante do trem
+            esperados: float = (n_bits - inicio) * self.probabilidade
+            saltos: np.ndarray = self.gerador.geometric(self.probabilidade, int(esperados + 4 * esperados**0.5) + 16)
+            posicoes: np.ndarray = inicio + np.concatenate([[0], np.cumsum(saltos)])
+            # Mantém os erros dentro do trem; o primeiro que passa do fim (ou o último sorteado) é o próximo início
+            corte: int = min(int(np.searchsorted(posicoes, n_bits)), len(posicoes) - 1)
+            partes.append(posicoes[:corte])
+            inicio = int(posicoes[corte])
+        self._proximo = inicio - n_bits
+        return np.concatenate(partes) if partes else np.zeros(0, dtype=np.int64)
+
+
+class CanalGilbertElliott(ModeloErro):
+    """
+    Erros em rajada pelo modelo de Gilbert-Elliott: uma cadeia de Markov com um estado bom e um estado ruim, cada um
+    com a sua probabilidade de erro de bit.
+
+    A duração de cada permanência em um estado é geométrica, então a cadeia é sorteada por trechos (e não bit a bit);
+    os erros dentro de cada trecho são sorteados de uma vez para o trem inteiro.
+
+    Args:
+        p_bom_ruim (float): Probabilidade de passar do estado bom para o ruim a cada bit.
+        p_ruim_bom (float): Probabilidade de voltar do estado ruim para o bom a cada bit (1 / duração média da rajada).
+        erro_bom (float): Probabilidade de erro de bit no estado bom.
+        erro_ruim (float): Probabilidade de erro de bit no estado ruim.
+        semente (opcional): Semente do gerador aleatório (ver ModeloErro).
+
+    Exemplo:
+        canal = CanalGilbertElliott(p_bom_ruim=1e-4, p_ruim_bom=0.1, erro_ruim=0.5, semente=1)
+        canal.taxa_media  # ~5e-4, concentrada em rajadas de ~10 bits
+    """
+
+    def __init__(self, p_bom_ruim: float, p_ruim_bom: float, erro_bom: float = 0.0, erro_ruim: float = 0.5,
+                 semente: int | np.random.SeedSequence | np.random.Generator | None = None) -> None:
+        for nome, valor in (("p_bom_ruim", p_bom_ruim), ("p_ruim_bom", p_ruim_bom), ("erro_bom", erro_bom), ("erro_ruim", erro_ruim)):
+            if not 0 <= valor <= 1:
+                raise ValueError(f"{nome} deve estar entre 0 e 1: {valor}")
+        if p_bom_ruim == 0 and p_ruim_bom == 0:
+            raise ValueError("Pelo menos uma das probabilidades de transição deve ser positiva")
+        super().__init__(semente)
+        self.p_bom_ruim: float = p_bom_ruim
+        self.p_ruim_bom: float = p_ruim_bom
+        self.erro_bom: float = erro_bom
+        self.erro_ruim: float = erro_ruim
+        self.ruim: bool = False  # Estado atual da cadeia
+        self._restante: int = self._permanencia()  # Bits restantes no estado atual
+
+    @property
+    def taxa_media(self) -> float:
+        """
+        Probabilidade de erro de bit no regime estacionário.
+        """
+        fracao_ruim: float = self.p_bom_ruim / (self.p_bom_ruim + self.p_ruim_bom)
+        return (1 - fracao_ruim) * self.erro_bom + fracao_ruim * self.erro_ruim
+
+    def _permanencias(self, ruim: bool, n: int) -> np.ndarray:
+        """
+        Sorteia n durações de permanência no estado indicado (geométricas, com a probabilidade de saída do estado).
+        """
+        saida: float = self.p_ruim_bom if ruim else self.p_bom_ruim
+        if saida == 0:
+            return np.full(n, _PERMANENTE, dtype=np.int64)  # Estado sem saída: permanece até o fim de qualquer trem
+        return self.gerador.geometric(saida, n).astype(np.int64)
+
+    def _permanencia(self) -> int:
+        return int(self._permanencias(self.ruim, 1)[0])
+
+    def posicoes(self, n_bits: int) -> np.ndarray:
+        # Trechos de permanência que cobrem os n_bits: o trecho em andamento e novos pares (outro estado, estado atual)
+        # sorteados em blocos, com tamanho estimado pela duração média de um par
+        duracoes: list[np.ndarray] = [np.array([self._restante], dtype=np.int64)]
+        estados: list[np.ndarray] = [np.array([self.ruim])]
+        total: int = self._restante
+        media_par: float = sum(1 / p if p > 0 else _PERMANENTE for p in (self.p_bom_ruim, self.p_ruim_bom))
+        while total < n_bits:
+            k: int = int((n_bits - total) / media_par) + 1
+            novas: np.ndarray = np.empty(2 * k, dtype=np.int64)
+            novas[0::2] = self._permanencias(not self.ruim, k)
+            novas[1::2] = self._permanencias(self.ruim, k)
+            duracoes.append(novas)
+            estados.append(np.tile([not self.ruim, self.ruim], k))
+            total += int(novas.sum())
+        duracao: np.ndarray = np.concatenate(duracoes)
+        estado: np.ndarray = np.concatenate(estados)
+
+        # O último trecho usado é o que alcança n_bits; o que sobra dele continua na próxima chamada
+        fins: np.ndarray = np.cumsum(duracao)
+        ultimo: int = int(np.searchsorted(fins, n_bits))
+        sobra: int = int(fins[ultimo]) - n_bits
+        self.ruim = bool(estado[ultimo])
+        self._restante = sobra
+        if sobra == 0:
+            self.ruim = not self.ruim
+            self._restante = self._permanencia()
+        duracao = duracao[:ultimo + 1]
+        duracao[-1] -= sobra
+
+        # Probabilidade de erro de cada bit conforme o estado do seu trecho, e os erros sorteados de uma vez
+        probabilidades: np.ndarray = np.repeat(np.where(estado[:ultimo + 1], self.erro_ruim, self.erro_bom), duracao)
+        return np.flatnonzero(self.gerador.random(n_bits) < probabilidades)
\ No newline at end of file
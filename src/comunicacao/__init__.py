@@ -0,0 +1,13 @@
+from .protocolo import TIPOS_AMOSTRA, COMPRESSOES, TAMANHO_MAXIMO, Mensagem, ErroProtocolo, codificar, decodificar, enviar_mensagem, receber_mensagem, MensagemEmPartes, receber_em_partes
+from .sessao import SessaoTransmissor
+from .captura import GravadorCaptura, LeitorCaptura
+
+__all__ = ["TIPOS_AMOSTRA", "COMPRESSOES", "TAMANHO_MAXIMO", "Mensagem", "ErroProtocolo", "codificar", "decodificar", "enviar_mensagem", "receber_mensagem", "MensagemEmPartes", "receber_em_partes", "SessaoTransmissor", "GravadorCaptura", "LeitorCaptura", "ServidorReceptor", "EstatisticasConexao"]
+
+
+def __getattr__(nome: str):
+    # O servidor (threads, selectors) só é importado quando usado: quem apenas decodifica mensagens não paga por ele
+    if nome in ("ServidorReceptor", "EstatisticasConexao"):
+        from . import servidor
+        return getattr(servidor, nome)
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
\ No newline at end of file
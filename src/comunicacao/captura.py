@@ -0,0 +1,202 @@
+"""
+Formato de captura de ondas, para gravar o tráfego e decodificá-lo de novo depois (ver src.pipeline.reproducao).
+
+Um arquivo de captura é uma sequência de registros, um por mensagem, precedida de um cabeçalho de arquivo:
+    [ARQUIVO: mágico "TR1CAP", versão | preenchimento]
+    [REGISTRO: cabeçalho do protocolo | parâmetros extras (float64) | preenchimento | amostras float32 | preenchimento]
+    ...
+
+O cabeçalho de cada registro é o mesmo CABECALHO do protocolo (sempre com amostras float32 sem compressão), então
+a configuração do enlace (e o número de níveis do sinal digital) é lida exatamente como numa mensagem recebida. As amostras começam em um múltiplo de
+ALINHAMENTO bytes, o que permite lê-las do arquivo mapeado em memória (mmap) como um np.ndarray float32 contíguo,
+sem cópia: só as páginas efetivamente acessadas são lidas do disco e, liberando as já processadas
+(LeitorCaptura.liberar), capturas de vários gigabytes são percorridas sem carregá-las na memória.
+"""
+
+import mmap
+import os
+import struct
+from dataclasses import replace
+import numpy as np
+from .protocolo import CABECALHO, Mensagem, ErroProtocolo, codificar, decodificar_cabecalho, _layout, _montar
+
+MAGICO_CAPTURA: bytes = b"TR1CAP"
+VERSAO_CAPTURA: int = 2  # Versão 2: o sinal digital não é gravado, só o seu número de níveis no cabeçalho
+ARQUIVO: struct.Struct = struct.Struct("<6sH")
+ALINHAMENTO: int = 64  # Início das amostras e de cada registro (uma linha de cache)
+
+
+def _alinhar(posicao: int) -> int:
+    return -(-posicao // ALINHAMENTO) * ALINHAMENTO
+
+
+class GravadorCaptura:
+    """
+    Grava mensagens em um arquivo de captura. Cada mensagem pode ser gravada de uma vez (gravar) ou em partes, à
+    medida que a onda é produzida (iniciar, escrever, concluir), como na saída de CanalAnalogico.fluxo.
+
+    Args:
+        caminho (str): O arquivo de captura. É criado se não existir; senão, os registros são acrescentados ao fim.
+
+    Exemplo:
+        with GravadorCaptura("trafego.tr1cap") as gravador:
+            gravador.gravar(config.para_mensagem(wave, dig_signal))
+    """
+
+    def __init__(self, caminho: str) -> None:
+        self.caminho: str = caminho
+        novo: bool = not os.path.exists(caminho) or os.path.getsize(caminho) == 0
+        self._arquivo = open(caminho, "wb" if novo else "r+b")
+        if novo:
+            self._arquivo.write(ARQUIVO.pack(MAGICO_CAPTURA, VERSAO_CAPTURA))
+            self._arquivo.write(bytes(_alinhar(ARQUIVO.size) - ARQUIVO.size))  # O primeiro registro também fica alinhado
+        else:
+            magico, versao = ARQUIVO.unpack(self._arquivo.read(ARQUIVO.size))
+            if magico != MAGICO_CAPTURA or versao != VERSAO_CAPTURA:
+                raise ErroProtocolo(f"{caminho} não é uma captura na versão {VERSAO_CAPTURA}")
+            self._arquivo.seek(0, os.SEEK_END)
+        self.registros: int = 0  # Registros gravados por este gravador
+        self._mensagem: Mensagem | None = None  # Mensagem cujas amostras estão sendo escritas
+        self._n_digital: int = 0  # Nº de níveis do sinal digital da mensagem, gravado no cabeçalho definitivo
+        self._inicio: int = 0  # Posição do cabeçalho do registro em andamento
+        self._amostras: int = 0
+
+    def __enter__(self) -> "GravadorCaptura":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.fechar()
+
+    def fechar(self) -> None:
+        if self._mensagem is not None:
+            self.concluir()
+        self._arquivo.close()
+
+    def gravar(self, mensagem: Mensagem) -> None:
+        """
+        Grava uma mensagem completa (a onda em mensagem.sinal e o número de níveis do sinal digital).
+        """
+        self.iniciar(mensagem)
+        self.escrever(mensagem.sinal)
+        self.concluir()
+
+    def iniciar(self, mensagem: Mensagem) -> None:
+        """
+        Começa o registro de uma mensagem. A onda de `mensagem` é ignorada: as amostras são passadas a escrever().
+        """
+        if self._mensagem is not None:
+            raise RuntimeError("O registro anterior ainda não foi concluído")
+        self._mensagem = replace(mensagem, sinal=np.zeros(0, dtype=np.float32), dig_signal=None, tipo_amostra="float32", compressao="Nenhuma")
+        self._n_digital = len(mensagem.dig_signal) if mensagem.dig_signal is not None else mensagem.n_digital
+        self._inicio = self._arquivo.tell()
+        self._amostras = 0
+        # Cabeçalho provisório (sem amostras), reescrito em concluir()
+        cabecalho_e_parametros: bytes = codificar(self._mensagem)
+        self._arquivo.write(cabecalho_e_parametros)
+        self._arquivo.write(bytes(_alinhar(self._inicio + len(cabecalho_e_parametros)) - self._inicio - len(cabecalho_e_parametros)))
+
+    def escrever(self, amostras: np.ndarray, tamanho_parte: int = 1 << 20) -> None:
+        """
+        Acrescenta amostras ao registro em andamento, convertidas para float32 em partes de `tamanho_parte` amostras.
+        """
+        if self._mensagem is None:
+            raise RuntimeError("Nenhum registro iniciado")
+        amostras = np.asarray(amostras)
+        for inicio in range(0, len(amostras), tamanho_parte):
+            self._arquivo.write(amostras[inicio:inicio + tamanho_parte].astype("<f4", copy=False).tobytes())
+        self._amostras += len(amostras)
+
+    def concluir(self, n_digital: int | None = None) -> None:
+        """
+        Encerra o registro em andamento e atualiza o cabeçalho com o número de amostras e o número de níveis do sinal
+        digital (`n_digital`, ou o da mensagem passada a iniciar()).
+        """
+        if self._mensagem is None:
+            raise RuntimeError("Nenhum registro iniciado")
+        mensagem: Mensagem = self._mensagem
+        self._mensagem = None
+        fim: int = self._arquivo.tell()
+        self._arquivo.write(bytes(_alinhar(fim) - fim))
+
+        # O cabeçalho definitivo tem o mesmo tamanho do provisório: só os contadores mudam
+        digital: int = n_digital if n_digital is not None else self._n_digital
+        definitivo: bytes = codificar(replace(mensagem, sinal=np.zeros(0, dtype=np.float32), n_digital=digital))[:CABECALHO.size]
+        campos: list = list(CABECALHO.unpack(definitivo))
+        campos[-3] = self._amostras
+        campos[-1] += self._amostras * 4
+        self._arquivo.seek(self._inicio)
+        self._arquivo.write(CABECALHO.pack(*campos))
+        self._arquivo.seek(0, os.SEEK_END)
+        self.registros += 1
+
+
+class LeitorCaptura:
+    """
+    Lê um arquivo de captura mapeado em memória. Cada registro é entregue como uma Mensagem cujo `sinal` é uma
+    visão float32 do arquivo mapeado, sem cópia; as amostras só são lidas do disco quando acessadas. As páginas
+    acessadas continuam mapeadas no processo até serem liberadas com liberar(), o que uma leitura sequencial deve
+    fazer com cada parte já processada.
+
+    Args:
+        caminho (str): O arquivo de captura.
+
+    Exemplo:
+        captura = LeitorCaptura("trafego.tr1cap")
+        for mensagem in captura:
+            parte = mensagem.sinal[:1000]  # Só as páginas destas amostras são lidas
+            ...
+            captura.liberar(parte)
+    """
+
+    def __init__(self, caminho: str) -> None:
+        self.caminho: str = caminho
+        if os.path.getsize(caminho) < ARQUIVO.size:
+            raise ErroProtocolo(f"{caminho} não é uma captura")
+        with open(caminho, "rb") as arquivo:
+            self._mmap: mmap.mmap = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._mmap.madvise(mmap.MADV_SEQUENTIAL)  # Leitura antecipada maior: a reprodução percorre o arquivo em ordem
+        self._mapa: np.ndarray = np.frombuffer(self._mmap, dtype=np.uint8)
+        magico, versao = ARQUIVO.unpack(self._mapa[:ARQUIVO.size].tobytes())
+        if magico != MAGICO_CAPTURA or versao != VERSAO_CAPTURA:
+            raise ErroProtocolo(f"{caminho} não é uma captura na versão {VERSAO_CAPTURA}")
+        # Índice dos registros: só os cabeçalhos são lidos, pulando as amostras
+        self._registros: list[tuple[int, tuple]] = []
+        posicao: int = _alinhar(ARQUIVO.size)
+        while posicao + CABECALHO.size <= len(self._mapa):
+            campos: tuple = decodificar_cabecalho(self._mapa[posicao:posicao + CABECALHO.size].tobytes(), len(self._mapa))
+            _, _, _, n_parametros, n_amostras, _, _ = _layout(campos)
+            inicio_amostras: int = _alinhar(posicao + CABECALHO.size + n_parametros * 8)
+            fim: int = inicio_amostras + n_amostras * 4
+            if fim > len(self._mapa):
+                raise ErroProtocolo(f"Registro {len(self._registros)} incompleto em {caminho}")
+            self._registros.append((posicao, campos))
+            posicao = _alinhar(fim)
+
+    def __len__(self) -> int:
+        return len(self._registros)
+
+    def __iter__(self):
+        return (self[indice] for indice in range(len(self)))
+
+    def __getitem__(self, indice: int) -> Mensagem:
+        posicao, campos = self._registros[indice]
+        _, _, _, n_parametros, n_amostras, _, _ = _layout(campos)
+        inicio: int = posicao + CABECALHO.size
+        parametros: np.ndarray = self._mapa[inicio:inicio + n_parametros * 8].view("<f8")
+        inicio = _alinhar(inicio + n_parametros * 8)
+        sinal: np.ndarray = self._mapa[inicio:inicio + n_amostras * 4].view("<f4")
+        return _montar(campos, parametros, sinal, None)
+
+    def liberar(self, visao: np.ndarray) -> None:
+        """
+        Devolve ao sistema as páginas do arquivo ocupadas por `visao` (uma parte de mensagem.sinal já processada).
+        Os dados continuam acessíveis: se forem lidos de novo, voltam do disco.
+        """
+        if not hasattr(mmap, "MADV_DONTNEED") or not visao.nbytes:
+            return
+        inicio: int = visao.ctypes.data - self._mapa.ctypes.data
+        if not 0 <= inicio < len(self._mapa):
+            raise ValueError("A visão não pertence a esta captura")
+        pagina: int = inicio - inicio % mmap.PAGESIZE  # madvise exige o início alinhado à página
+        self._mmap.madvise(mmap.MADV_DONTNEED, pagina, inicio + visao.nbytes - pagina)
@@ -0,0 +1,510 @@
+"""
+Protocolo binário entre o transmissor e o receptor.
+
+Cada mensagem é composta por:
+    1. Um cabeçalho de tamanho fixo (struct little-endian), com os parâmetros da portadora, os códigos das técnicas
+       selecionadas no transmissor e um prefixo com o tamanho do corpo;
+    2. O corpo: parâmetros extras da portadora (float64), as amostras da onda e, no modo simbolos, o sinal digital (int8).
+
+O número de níveis do sinal digital vai sempre no cabeçalho (n_digital): é o que o receptor do 8-QAM e do M-FSK
+precisa para remover o preenchimento do último símbolo, sem que o sinal digital inteiro seja enviado com a onda.
+
+As amostras podem ser enviadas em vários modos, que trocam bytes na rede por custo de decodificação:
+    - float32/float64: as amostras como estão (little-endian);
+    - int16/int8: amostras quantizadas, com a escala (amplitude de um passo) no cabeçalho;
+    - simbolos: nenhuma amostra; só o sinal digital é enviado e o receptor decodifica os níveis diretamente (ou
+      sintetiza a onda de novo, para exibi-la);
+e, independentemente do tipo, comprimidas com zlib ou lzma.
+"""
+
+import socket
+import struct
+from dataclasses import dataclass, field
+from typing import Iterator
+import numpy as np
+
+MAGICO: bytes = b"TR1"
+VERSAO: int = 4  # Versão 2: número de sequência no cabeçalho; versão 3: compressão e escala da quantização;
+                 # versão 4: o sinal digital só vai no corpo no modo simbolos (nos demais, só o seu nº de níveis)
+
+# Cabeçalho: mágico, versão, número de sequência, sample, amplitude, frequência, fase, códigos (modulação digital,
+# modulação por portadora, enquadramento, detecção/correção, tipo da amostra, compressão), escala da quantização,
+# nº de parâmetros extras, nº de amostras, nº de níveis digitais, tamanho do corpo
+CABECALHO: struct.Struct = struct.Struct("<3sBQIdddBBBBBBdBQQQ")
+
+# Tabelas de códigos: o código de cada técnica é a sua posição na tupla. Valores desconhecidos (ex.: "Selecione um item") viram "Nenhum"
+MODULACOES_DIGITAIS: tuple[str, ...] = ("Nenhum", "NRZ-Polar", "Manchester", "Bipolar")
+MODULACOES_PORTADORA: tuple[str, ...] = ("Nenhum", "ASK", "FSK", "8-QAM", "M-FSK")
+ENQUADRAMENTOS: tuple[str, ...] = ("Nenhum", "Contagem de Caracteres", "Insercao de Bytes", "Contagem Varint")
+DETECCOES_CORRECOES: tuple[str, ...] = ("Nenhum", "Bit de Paridade", "CRC-32", "Codigo de Hamming", "Hamming (7,4)", "Hamming (15,11)", "SECDED (72,64)",
+                                          "Paridade por Quadro", "CRC-32 por Quadro")
+TIPOS_AMOSTRA: tuple[str, ...] = ("float32", "float64", "int16", "int8", "simbolos")
+COMPRESSOES: tuple[str, ...] = ("Nenhuma", "zlib", "lzma")
+
+# Tamanho máximo do corpo, e das amostras depois de descomprimidas, aceito na recepção. Os tamanhos vêm do cabeçalho,
+# que não é confiável, e definem quanta memória é alocada antes de o corpo chegar
+TAMANHO_MAXIMO: int = 1 << 30
+
+# Representação de cada tipo de amostra no corpo da mensagem ("simbolos" não envia amostras)
+_DTYPES: dict[str, str] = {"float32": "<f4", "float64": "<f8", "int16": "<i2", "int8": "i1"}
+
+
+class ErroProtocolo(ValueError):
+    """
+    Erro levantado quando os bytes recebidos não formam uma mensagem válida do protocolo.
+    """
+
+
+@dataclass
+class Mensagem:
+    """
+    Uma mensagem trocada entre o transmissor e o receptor.
+
+    Os parâmetros extras dependem da modulação por portadora: (amp_zero, amp_one) no ASK e (freq_zero, freq_one) no FSK.
+
+    `tipo_amostra` e `compressao` definem como a onda é enviada (ver TIPOS_AMOSTRA e COMPRESSOES). Na recepção,
+    `sinal` é sempre de ponto flutuante (as amostras quantizadas já voltam multiplicadas pela escala) e fica vazio no
+    modo "simbolos", que exige o sinal digital. Nos outros modos, só o número de níveis do sinal digital é enviado
+    (`n_digital`, tirado de `dig_signal` se houver) e, na recepção, `dig_signal` fica None.
+    """
+    sample: int
+    amplitude: float
+    frequencia: float
+    fase: float
+    mod_digital: str
+    mod_portadora: str
+    enquadramento: str
+    deteccao_correcao: str
+    sinal: np.ndarray
+    parametros: tuple[float, ...] = ()
+    dig_signal: np.ndarray | None = None
+    n_digital: int = 0  # Nº de níveis do sinal digital transmitido (0 se desconhecido)
+    tipo_amostra: str = "float32"
+    compressao: str = "Nenhuma"
+    sequencia: int = field(default=0, compare=False)  # Número da mensagem na sessão do transmissor
+    versao: int = field(default=VERSAO, compare=False)
+
+
+def _codigo(tabela: tuple[str, ...], valor: str) -> int:
+    return tabela.index(valor) if valor in tabela else 0
+
+
+def _valor(tabela: tuple[str, ...], codigo: int) -> str:
+    if codigo >= len(tabela):
+        raise ErroProtocolo(f"Código desconhecido: {codigo}")
+    return tabela[codigo]
+
+
+def _comprimir(dados: bytes, compressao: str) -> bytes:
+    # Importados só quando usados: quem não comprime não paga pelo lzma
+    if compressao == "zlib":
+        import zlib
+        return zlib.compress(dados)
+    if compressao == "lzma":
+        import lzma
+        return lzma.compress(dados)
+    return dados
+
+
+def _descompressor(compressao: str):
+    """
+    Cria um descompressor incremental (com o método decompress(dados)) para a compressão dada.
+    """
+    if compressao == "zlib":
+        import zlib
+        return zlib.decompressobj()
+    import lzma
+    return lzma.LZMADecompressor()
+
+
+def _descomprimir(descompressor, compressao: str, dados, restantes: int) -> bytes:
+    """
+    Descomprime uma parte das amostras sem produzir mais que os `restantes` bytes ainda anunciados pelo cabeçalho.
+    Um corpo pequeno que se expandiria além disso (bomba de descompressão) é rejeitado antes de ocupar a memória.
+    """
+    import zlib
+    if compressao == "lzma":
+        import lzma
+        erro: type[Exception] = lzma.LZMAError
+    else:
+        erro = zlib.error
+    try:
+        saida: bytes = descompressor.decompress(dados, max_length=restantes + 1)
+    except erro as e:
+        raise ErroProtocolo(f"Amostras comprimidas inválidas: {e}") from e
+    # Entrada não consumida (o limite foi atingido) ou bytes depois do fim do fluxo comprimido
+    if len(saida) > restantes or getattr(descompressor, "unconsumed_tail", b"") or descompressor.unused_data:
+        raise ErroProtocolo("Amostras comprimidas maiores que o indicado no cabeçalho")
+    return saida
+
+
+def _quantizar(sinal: np.ndarray, tipo_amostra: str) -> tuple[np.ndarray, float]:
+    """
+    Converte as amostras para o tipo do corpo. Nos tipos inteiros, o pico do sinal vira o maior inteiro do tipo e a
+    escala (o valor de um passo) é retornada para o receptor desfazer a quantização.
+    """
+    dtype: np.dtype = np.dtype(_DTYPES[tipo_amostra])
+    if dtype.kind == "f":
+        return sinal.astype(dtype, copy=False), 1.0
+    pico: float = float(np.max(np.abs(sinal))) if len(sinal) else 0.0
+    escala: float = pico / np.iinfo(dtype).max if pico > 0 else 1.0
+    return np.rint(sinal / escala).astype(dtype), escala
+
+
+def _amostras(bruto, tipo_amostra: str, escala: float, n_amostras: int) -> np.ndarray:
+    """
+    Interpreta os bytes (já descomprimidos) das amostras. Sem cópia nos tipos de ponto flutuante; os tipos inteiros
+    são convertidos para float32 e multiplicados pela escala.
+    """
+    if tipo_amostra == "simbolos":
+        return np.zeros(0, dtype=np.float32)
+    valores: np.ndarray = np.frombuffer(bruto, dtype=_DTYPES[tipo_amostra], count=n_amostras)
+    if valores.dtype.kind == "f":
+        return valores
+    return np.multiply(valores, np.float32(escala), dtype=np.float32)
+
+
+def codificar(mensagem: Mensagem) -> bytes:
+    """
+    Serializa uma mensagem no formato binário do protocolo.
+
+    Args:
+        mensagem (Mensagem): A mensagem a ser enviada.
+
+    Returns:
+        bytes: O cabeçalho seguido do corpo da mensagem.
+    """
+    if mensagem.tipo_amostra not in TIPOS_AMOSTRA:
+        raise ErroProtocolo(f"Tipo de amostra não suportado: {mensagem.tipo_amostra}")
+    if mensagem.compressao not in COMPRESSOES:
+        raise ErroProtocolo(f"Compressão não suportada: {mensagem.compressao}")
+    if mensagem.tipo_amostra == "simbolos" and mensagem.dig_signal is None:
+        raise ErroProtocolo("O modo simbolos precisa do sinal digital")
+    parametros: bytes = np.asarray(mensagem.parametros, dtype="<f8").tobytes()
+    if mensagem.tipo_amostra == "simbolos":
+        amostras, escala = np.zeros(0, dtype=np.float32), 1.0
+    else:
+        amostras, escala = _quantizar(np.asarray(mensagem.sinal), mensagem.tipo_amostra)
+    sinal: bytes = _comprimir(amostras.tobytes(), mensagem.compressao)
+    # O sinal digital só vai no corpo no modo simbolos; nos demais, o cabeçalho leva apenas o seu número de níveis
+    n_digital: int = len(mensagem.dig_signal) if mensagem.dig_signal is not None else mensagem.n_digital
+    digital: bytes = np.asarray(mensagem.dig_signal, dtype=np.int8).tobytes() if mensagem.tipo_amostra == "simbolos" else b""
+    n_amostras: int = len(amostras)
+
+    cabecalho: bytes = CABECALHO.pack(
+        MAGICO, VERSAO, mensagem.sequencia, mensagem.sample, mensagem.amplitude, mensagem.frequencia, mensagem.fase,
+        _codigo(MODULACOES_DIGITAIS, mensagem.mod_digital),
+        _codigo(MODULACOES_PORTADORA, mensagem.mod_portadora),
+        _codigo(ENQUADRAMENTOS, mensagem.enquadramento),
+        _codigo(DETECCOES_CORRECOES, mensagem.deteccao_correcao),
+        TIPOS_AMOSTRA.index(mensagem.tipo_amostra),
+        COMPRESSOES.index(mensagem.compressao), escala,
+        len(mensagem.parametros), n_amostras, n_digital,
+        len(parametros) + len(sinal) + len(digital),
+    )
+    return b"".join((cabecalho, parametros, sinal, digital))
+
+
+def decodificar_cabecalho(cabecalho: bytes, tamanho_maximo: int = TAMANHO_MAXIMO) -> tuple:
+    """
+    Interpreta e valida o cabeçalho fixo de uma mensagem, antes de qualquer alocação para o corpo.
+
+    Args:
+        cabecalho (bytes): Os primeiros CABECALHO.size bytes da mensagem.
+        tamanho_maximo (int): Tamanho máximo aceito para o corpo e para as amostras descomprimidas, em bytes.
+
+    Returns:
+        tuple: Os campos do cabeçalho, na ordem de CABECALHO, e o tamanho do corpo como último elemento.
+    """
+    campos: tuple = CABECALHO.unpack(cabecalho)
+    if campos[0] != MAGICO:
+        raise ErroProtocolo("Cabeçalho inválido: a mensagem não pertence ao protocolo")
+    if campos[1] != VERSAO:
+        raise ErroProtocolo(f"Versão do protocolo não suportada: {campos[1]}")
+    tipo_amostra, _, _, n_parametros, n_amostras, _, _ = _layout(campos)
+    if campos[-1] > tamanho_maximo or n_amostras * _tamanho_amostra(tipo_amostra) > tamanho_maximo:
+        raise ErroProtocolo(f"Mensagem maior que o máximo de {tamanho_maximo} bytes")
+    # Amostras por símbolo: o receptor divide a onda em símbolos de `sample` amostras
+    if campos[3] < 1:
+        raise ErroProtocolo(f"Número de amostras por símbolo inválido: {campos[3]}")
+    # Parâmetros extras que a configuração do receptor vai desempacotar (ver LinkConfig.de_mensagem)
+    mod_portadora: str = _valor(MODULACOES_PORTADORA, campos[8])
+    if (mod_portadora in ("ASK", "FSK") and n_parametros != 2) or (mod_portadora == "M-FSK" and n_parametros < 2):
+        raise ErroProtocolo(f"Número de parâmetros incorreto para {mod_portadora}: {n_parametros}")
+    if mod_portadora == "M-FSK" and n_parametros & (n_parametros - 1):
+        raise ErroProtocolo(f"O M-FSK precisa de uma quantidade de frequências que seja potência de 2: {n_parametros}")
+    return campos
+
+
+def decodificar(dados: bytes, tamanho_maximo: int = TAMANHO_MAXIMO) -> Mensagem:
+    """
+    Reconstrói uma mensagem a partir dos bytes recebidos. Sem compressão, as amostras em ponto flutuante são lidas
+    diretamente para um np.ndarray, sem cópia.
+
+    Args:
+        dados (bytes): O cabeçalho seguido do corpo da mensagem.
+        tamanho_maximo (int): Tamanho máximo aceito para o corpo e para as amostras descomprimidas, em bytes.
+
+    Returns:
+        Mensagem: A mensagem decodificada.
+    """
+    if len(dados) < CABECALHO.size:
+        raise ErroProtocolo(f"Mensagem menor que o cabeçalho: {len(dados)} bytes")
+    campos: tuple = decodificar_cabecalho(bytes(dados[:CABECALHO.size]), tamanho_maximo)
+    if len(dados) - CABECALHO.size != campos[-1]:
+        raise ErroProtocolo(f"Tamanho do corpo incorreto: esperado {campos[-1]}, recebido {len(dados) - CABECALHO.size}")
+    tipo_amostra, compressao, escala, n_parametros, n_amostras, n_digital, tamanho_sinal = _layout(campos)
+
+    inicio: int = CABECALHO.size
+    parametros: np.ndarray = np.frombuffer(dados, dtype="<f8", count=n_parametros, offset=inicio)
+    inicio += parametros.nbytes
+    bruto = memoryview(dados)[inicio:inicio + tamanho_sinal]
+    if compressao != "Nenhuma":
+        descompressor = _descompressor(compressao)
+        bruto = _descomprimir(descompressor, compressao, bruto, n_amostras * _tamanho_amostra(tipo_amostra))
+        if len(bruto) != n_amostras * _tamanho_amostra(tipo_amostra) or not descompressor.eof:
+            raise ErroProtocolo(f"Amostras comprimidas incorretas: {len(bruto)} bytes para {n_amostras} amostras")
+    sinal: np.ndarray = _amostras(bruto, tipo_amostra, escala, n_amostras)
+    inicio += tamanho_sinal
+    dig_signal: np.ndarray | None = np.frombuffer(dados, dtype=np.int8, count=n_digital, offset=inicio) if tipo_amostra == "simbolos" else None
+
+    return _montar(campos, parametros, sinal, dig_signal)
+
+
+def _tamanho_amostra(tipo_amostra: str) -> int:
+    return np.dtype(_DTYPES[tipo_amostra]).itemsize if tipo_amostra in _DTYPES else 0
+
+
+def _layout(campos: tuple) -> tuple[str, str, float, int, int, int, int]:
+    """
+    Lê do cabeçalho a disposição do corpo e a valida.
+
+    Returns:
+        tuple: O tipo da amostra, a compressão, a escala, o nº de parâmetros extras, o nº de amostras, o nº de
+        níveis digitais e o tamanho em bytes da seção das amostras (comprimida, se houver compressão). Os níveis
+        digitais só ocupam o corpo no modo simbolos.
+    """
+    tipo_codigo, compressao_codigo, escala, n_parametros, n_amostras, n_digital, tamanho = campos[-7:]
+    tipo_amostra: str = _valor(TIPOS_AMOSTRA, tipo_codigo)
+    compressao: str = _valor(COMPRESSOES, compressao_codigo)
+    tamanho_sinal: int = tamanho - n_parametros * 8 - (n_digital if tipo_amostra == "simbolos" else 0)
+    if tamanho_sinal < 0 or (compressao == "Nenhuma" and tamanho_sinal != n_amostras * _tamanho_amostra(tipo_amostra)):
+        raise ErroProtocolo(f"Tamanho do corpo incorreto: {tamanho} bytes para {n_amostras} amostras")
+    if tipo_amostra == "simbolos" and (n_amostras or not n_digital):
+        raise ErroProtocolo("O modo simbolos não leva amostras e precisa do sinal digital")
+    return tipo_amostra, compressao, escala, n_parametros, n_amostras, n_digital, tamanho_sinal
+
+
+def _montar(campos: tuple, parametros: np.ndarray, sinal: np.ndarray, dig_signal: np.ndarray | None) -> Mensagem:
+    """
+    Cria a Mensagem a partir dos campos do cabeçalho e das partes já lidas do corpo.
+    """
+    (_, versao, sequencia, sample, amplitude, frequencia, fase, mod_digital, mod_portadora, enquadramento, deteccao,
+     tipo_amostra, compressao, _, _, _, n_digital, _) = campos
+    return Mensagem(
+        sample=sample, amplitude=amplitude, frequencia=frequencia, fase=fase,
+        mod_digital=_valor(MODULACOES_DIGITAIS, mod_digital),
+        mod_portadora=_valor(MODULACOES_PORTADORA, mod_portadora),
+        enquadramento=_valor(ENQUADRAMENTOS, enquadramento),
+        deteccao_correcao=_valor(DETECCOES_CORRECOES, deteccao),
+        sinal=sinal, parametros=tuple(parametros.tolist()), dig_signal=dig_signal, n_digital=n_digital,
+        tipo_amostra=_valor(TIPOS_AMOSTRA, tipo_amostra), compressao=_valor(COMPRESSOES, compressao), sequencia=sequencia, versao=versao,
+    )
+
+
+def _receber_exato(conn: socket.socket, visao: memoryview) -> bool:
+    """
+    Preenche a memória de `visao` com bytes lidos do socket. Retorna False se a conexão for encerrada antes disso.
+    """
+    recebidos: int = 0
+    while recebidos < len(visao):
+        n: int = conn.recv_into(visao[recebidos:])
+        if n == 0:
+            return False
+        recebidos += n
+    return True
+
+
+def enviar_mensagem(conn: socket.socket, mensagem: Mensagem) -> None:
+    """
+    Envia uma mensagem completa pelo socket.
+    """
+    conn.sendall(codificar(mensagem))
+
+
+def receber_mensagem(conn: socket.socket, tamanho_maximo: int = TAMANHO_MAXIMO) -> Mensagem | None:
+    """
+    Recebe uma mensagem completa do socket, usando o prefixo de tamanho do cabeçalho para alocar o buffer de uma só vez.
+
+    Args:
+        conn (socket.socket): O socket conectado ao transmissor.
+        tamanho_maximo (int): Tamanho máximo aceito para o corpo e para as amostras descomprimidas, em bytes.
+
+    Returns:
+        Mensagem | None: A mensagem recebida, ou None se a conexão foi encerrada antes de uma nova mensagem.
+    """
+    cabecalho: bytearray = bytearray(CABECALHO.size)
+    if not _receber_exato(conn, memoryview(cabecalho)):
+        return None
+    tamanho: int = decodificar_cabecalho(bytes(cabecalho), tamanho_maximo)[-1]
+    dados: bytearray = bytearray(CABECALHO.size + tamanho)
+    dados[:CABECALHO.size] = cabecalho
+    if not _receber_exato(conn, memoryview(dados)[CABECALHO.size:]):
+        raise ErroProtocolo("Conexão encerrada no meio de uma mensagem")
+    return decodificar(dados, tamanho_maximo)
+
+
+
+class MensagemEmPartes:
+    """
+    Mensagem cujo corpo é lido do socket aos poucos, para que o receptor comece a decodificar a onda antes de ela
+    chegar inteira.
+
+    O corpo inteiro é alocado de uma vez (o tamanho vem no cabeçalho, já limitado por decodificar_cabecalho) e
+    preenchido com recv_into. Nas amostras em ponto flutuante sem compressão, `mensagem.sinal` é uma visão desse
+    buffer, que vai sendo preenchida, e cada parte entregue é uma visão das amostras completas recém-chegadas, sem
+    cópia. Nos outros modos, cada parte recebida é descomprimida (com um descompressor incremental) e/ou convertida
+    de volta para ponto flutuante assim que chega, preenchendo `mensagem.sinal`, então a decodificação também começa
+    antes do fim da mensagem. O sinal digital, que vem depois da onda, só está em `mensagem.dig_signal` ao fim da
+    leitura; o seu comprimento já é conhecido pelo cabeçalho (n_digital).
+
+    O corpo pode ser lido de duas formas:
+        - com um socket bloqueante, por amostras(), que lê até o fim da mensagem (use receber_em_partes() para ler
+          o cabeçalho e criar o objeto);
+        - por quem controla a leitura (ex.: um servidor com sockets não bloqueantes), criando o objeto sem socket,
+          gravando os bytes em livre() e registrando-os com receber(), que retorna as amostras completadas.
+
+    Exemplo:
+        partes = receber_em_partes(conn)
+        for amostras in partes.amostras():
+            ...  # Processa as amostras recém-chegadas
+        partes.mensagem  # A mensagem completa
+    """
+
+    def __init__(self, conn: socket.socket | None, campos: tuple) -> None:
+        tipo_amostra, compressao, escala, n_parametros, n_amostras, n_digital, tamanho_sinal = _layout(campos)
+        self.conn: socket.socket | None = conn
+        self.n_digital: int = n_digital
+        self.recebidos: int = 0  # Bytes do corpo já recebidos
+        self._compressao: str = compressao
+        self._descompressor = _descompressor(compressao) if compressao != "Nenhuma" else None
+        self._escala: np.float32 = np.float32(escala)
+        self._tamanho_amostra: int = _tamanho_amostra(tipo_amostra)
+        # np.empty não preenche o buffer com zeros: a alocação não custa proporcionalmente ao tamanho da onda
+        self._corpo: np.ndarray = np.empty(campos[-1], dtype=np.uint8)
+        self._visao: memoryview = memoryview(self._corpo)
+        self._inicio_sinal: int = n_parametros * 8
+        self._fim_sinal: int = self._inicio_sinal + tamanho_sinal
+
+        # Bytes das amostras sem compressão: o próprio corpo, ou um buffer preenchido pelo descompressor
+        if compressao == "Nenhuma":
+            self._bruto: np.ndarray = self._corpo[self._inicio_sinal:self._fim_sinal]
+        else:
+            self._bruto = np.empty(n_amostras * self._tamanho_amostra, dtype=np.uint8)
+        self._prontos: int = 0  # Bytes das amostras já disponíveis (descomprimidos)
+        self._entregues: int = 0  # Amostras já entregues
+        self._quantizado: np.ndarray | None = None  # Amostras inteiras, nos tipos quantizados
+        if tipo_amostra == "simbolos":
+            sinal: np.ndarray = np.zeros(0, dtype=np.float32)
+        elif tipo_amostra.startswith("float"):
+            sinal = self._bruto.view(_DTYPES[tipo_amostra])
+        else:
+            self._quantizado = self._bruto.view(_DTYPES[tipo_amostra])
+            sinal = np.empty(n_amostras, dtype=np.float32)
+        # Os parâmetros extras são preenchidos quando chegam, antes da onda
+        self.mensagem: Mensagem = _montar(campos, np.zeros(0), sinal, None)
+        if conn is not None:
+            # São poucos bytes: com um socket, são lidos já na criação
+            if not _receber_exato(conn, self._visao[:self._inicio_sinal]):
+                raise ErroProtocolo("Conexão encerrada no meio de uma mensagem")
+            self.receber(self._inicio_sinal)
+
+    @property
+    def completa(self) -> bool:
+        """
+        Se o corpo inteiro já foi recebido.
+        """
+        return self.recebidos == len(self._corpo)
+
+    def livre(self, tamanho_parte: int = 1 << 16) -> memoryview:
+        """
+        A parte do corpo que recebe os próximos bytes: no máximo `tamanho_parte` bytes, sem passar do fim da seção
+        atual (parâmetros, amostras ou sinal digital). Depois de gravar n bytes nela, chame receber(n).
+        """
+        if self.recebidos < self._inicio_sinal:
+            fim: int = self._inicio_sinal
+        elif self.recebidos < self._fim_sinal:
+            fim = self._fim_sinal
+        else:
+            fim = len(self._corpo)
+        return self._visao[self.recebidos:min(self.recebidos + tamanho_parte, fim)]
+
+    def receber(self, n: int) -> np.ndarray:
+        """
+        Registra os `n` bytes gravados em livre().
+
+        Returns:
+            np.ndarray: As amostras completadas por estes bytes (uma visão de mensagem.sinal, possivelmente vazia).
+        """
+        inicio: int = self.recebidos
+        self.recebidos += n
+        sinal: np.ndarray = self.mensagem.sinal
+        if self.recebidos <= self._inicio_sinal:
+            if self.recebidos == self._inicio_sinal:
+                self.mensagem.parametros = tuple(self._corpo[:self._inicio_sinal].view("<f8").tolist())
+        elif self.recebidos <= self._fim_sinal:
+            if self._descompressor is None:
+                self._prontos = self.recebidos - self._inicio_sinal
+            else:
+                pedaco: bytes = _descomprimir(self._descompressor, self._compressao, self._visao[inicio:self.recebidos], len(self._bruto) - self._prontos)
+                self._bruto[self._prontos:self._prontos + len(pedaco)] = np.frombuffer(pedaco, dtype=np.uint8)
+                self._prontos += len(pedaco)
+        if self.recebidos == self._fim_sinal:
+            if self._prontos != len(self._bruto) or (self._descompressor is not None and not self._descompressor.eof):
+                raise ErroProtocolo(f"Amostras comprimidas incorretas: {self._prontos} bytes para {len(self._bruto)}")
+        if self.completa and self.n_digital:
+            self.mensagem.dig_signal = self._corpo[self._fim_sinal:].view(np.int8)
+        if not self._tamanho_amostra:
+            return sinal[:0]
+        completas: int = self._prontos // self._tamanho_amostra  # Uma amostra pode chegar pela metade
+        novas: np.ndarray = sinal[self._entregues:completas]
+        if self._quantizado is not None and len(novas):
+            # Amostras quantizadas: convertidas de volta para ponto flutuante só no trecho novo
+            np.multiply(self._quantizado[self._entregues:completas], self._escala, out=novas)
+        self._entregues = max(self._entregues, completas)
+        return novas
+
+    def amostras(self, tamanho_parte: int = 1 << 16) -> Iterator[np.ndarray]:
+        """
+        Lê o restante do corpo do socket, entregando as amostras completas a cada recv_into.
+
+        Args:
+            tamanho_parte (int): Número máximo de bytes pedidos a cada recv_into.
+
+        Returns:
+            Iterator[np.ndarray]: As amostras recém-chegadas, em ordem (visões de mensagem.sinal).
+        """
+        while not self.completa:
+            n: int = self.conn.recv_into(self.livre(tamanho_parte))
+            if n == 0:
+                raise ErroProtocolo("Conexão encerrada no meio de uma mensagem")
+            novas: np.ndarray = self.receber(n)
+            if len(novas):
+                yield novas
+
+
+def receber_em_partes(conn: socket.socket, tamanho_maximo: int = TAMANHO_MAXIMO) -> MensagemEmPartes | None:
+    """
+    Lê o cabeçalho da próxima mensagem do socket e prepara a leitura do corpo em partes (ver MensagemEmPartes).
+
+    Args:
+        conn (socket.socket): O socket conectado ao transmissor.
+        tamanho_maximo (int): Tamanho máximo aceito para o corpo e para as amostras descomprimidas, em bytes.
+
+    Returns:
+        MensagemEmPartes | None: A mensagem a ser lida, ou None se a conexão foi encerrada antes de uma nova mensagem.
+    """
+    cabecalho: bytearray = bytearray(CABECALHO.size)
+    if not _receber_exato(conn, memoryview(cabecalho)):
+        return None
+    return MensagemEmPartes(conn, decodificar_cabecalho(bytes(cabecalho), tamanho_maximo))
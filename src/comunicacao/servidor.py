@@ -0,0 +1,327 @@
+import lzma
+import queue
+import selectors
+import socket
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Callable
+import numpy as np
+from .protocolo import CABECALHO, TAMANHO_MAXIMO, ErroProtocolo, Mensagem, MensagemEmPartes, decodificar_cabecalho
+
+# Erros que invalidam só a conexão que enviou a mensagem: ela é encerrada e as demais continuam sendo atendidas
+ERROS_CONEXAO: tuple[type[Exception], ...] = (ErroProtocolo, ValueError, struct.error, MemoryError, zlib.error, lzma.LZMAError)
+
+# Contadores somados na entrada que resume as conexões encerradas (ver ServidorReceptor.estatisticas)
+_CONTADORES: tuple[str, ...] = ("bytes_recebidos", "mensagens_recebidas", "mensagens_decodificadas", "erros", "pausas", "perdidas")
+
+
+@dataclass
+class EstatisticasConexao:
+    """
+    Contadores de uma conexão aceita pelo servidor.
+    """
+    endereco: tuple
+    conectado_em: float = field(default_factory=time.time)
+    bytes_recebidos: int = 0
+    mensagens_recebidas: int = 0  # Mensagens completas lidas do socket
+    mensagens_decodificadas: int = 0  # Mensagens entregues com sucesso ao callback
+    erros: int = 0
+    pausas: int = 0  # Quantas vezes a leitura foi suspensa por falta de espaço na fila
+    ultima_sequencia: int | None = None  # Número de sequência da última mensagem recebida
+    perdidas: int = 0  # Mensagens que faltaram na numeração de sequência do transmissor
+    ativa: bool = True
+
+
+class _Conexao:
+    """
+    Estado de uma conexão: na thread de E/S, o cabeçalho em leitura ou o corpo da mensagem atual e os eventos que
+    aguardam espaço na fila; na thread trabalhadora que a atende, o estado de quem consome a mensagem atual.
+    """
+
+    def __init__(self, sock: socket.socket, endereco: tuple, fila: queue.Queue) -> None:
+        self.sock: socket.socket = sock
+        self.estatisticas: EstatisticasConexao = EstatisticasConexao(endereco)
+        self.fila: queue.Queue = fila  # Fila da trabalhadora que atende a conexão, para manter a ordem dos eventos
+        self.pendentes: deque[tuple] = deque()
+        self.contexto: object | None = None  # Usado só pela trabalhadora (ex.: o decodificador da mensagem atual)
+        self.preparar_cabecalho()
+
+    def preparar_cabecalho(self) -> None:
+        self.partes: MensagemEmPartes | None = None
+        self.cabecalho: bytearray = bytearray(CABECALHO.size)
+        self.posicao: int = 0
+
+
+class ServidorReceptor:
+    """
+    Servidor do receptor, que aceita várias conexões simultâneas e decodifica cada mensagem de forma independente.
+    Cada conexão permanece aberta enquanto o transmissor quiser, recebendo quantas mensagens ele enviar (ver
+    SessaoTransmissor); os números de sequência das mensagens são acompanhados nas estatísticas da conexão.
+
+    Uma thread de E/S atende todas as conexões com um seletor (sockets não bloqueantes) e lê o corpo de cada
+    mensagem em partes (ver MensagemEmPartes). Os eventos de cada conexão (as amostras de cada parte, assim que
+    chegam, e a mensagem completa) vão, em ordem, para a fila limitada de uma das threads trabalhadoras, que chama
+    `ao_receber` para cada mensagem completa. Quando a fila enche, a conexão deixa de ser lida até haver espaço, o
+    que propaga a contrapressão até o transmissor pelo próprio TCP.
+
+    Subclasses podem consumir as partes antes do fim da mensagem sobrescrevendo _receber_parte e _concluir (ver
+    src.pipeline.ServidorProgressivo, que decodifica a onda enquanto ela chega).
+
+    Uma mensagem inválida (ou maior que `tamanho_maximo`) encerra só a conexão que a enviou; a thread de E/S continua
+    atendendo as outras e aceitando novas conexões.
+
+    Args:
+        ao_receber (Callable[[Mensagem, EstatisticasConexao], None]): Função chamada para cada mensagem recebida.
+        host (str): Endereço em que o servidor escuta.
+        port (int): Porta em que o servidor escuta.
+        tamanho_fila (int): Número máximo de eventos (partes e mensagens) aguardando na fila de cada trabalhadora.
+        n_trabalhadores (int): Número de threads que consomem a fila.
+        tamanho_maximo (int): Tamanho máximo do corpo de uma mensagem (e das amostras descomprimidas), em bytes.
+        tamanho_parte (int): Número máximo de bytes do corpo lidos de uma conexão por vez.
+    """
+
+    # Se as amostras de cada parte são entregues às trabalhadoras (_receber_parte), ou só a mensagem completa
+    entregar_partes: bool = False
+
+    def __init__(self, ao_receber: Callable[[Mensagem, EstatisticasConexao], None], host: str = "127.0.0.1",
+                 port: int = 65432, tamanho_fila: int = 64, n_trabalhadores: int = 2, tamanho_maximo: int = TAMANHO_MAXIMO,
+                 tamanho_parte: int = 1 << 16) -> None:
+        self.ao_receber = ao_receber
+        self.host: str = host
+        self.port: int = port
+        self.n_trabalhadores: int = n_trabalhadores
+        self.tamanho_maximo: int = tamanho_maximo
+        self.tamanho_parte: int = tamanho_parte
+        # Uma fila por trabalhadora: todos os eventos de uma conexão são tratados pela mesma thread, em ordem
+        self._filas: list[queue.Queue] = [queue.Queue(maxsize=tamanho_fila) for _ in range(n_trabalhadores)]
+        self._aceitas: int = 0
+        self._conexoes: list[_Conexao] = []  # As conexões ativas e as encerradas com eventos ainda na fila
+        self._encerradas: EstatisticasConexao = EstatisticasConexao(endereco=(), ativa=False)
+        self._trava: threading.Lock = threading.Lock()  # Protege _conexoes e _encerradas, alterados pelas trabalhadoras
+        self._pausadas: set[_Conexao] = set()
+        self._parar: threading.Event = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._socket: socket.socket | None = None
+        self._seletor: selectors.BaseSelector | None = None
+        self._despertar_leitura: socket.socket | None = None
+        self._despertar_escrita: socket.socket | None = None
+
+    # CICLO DE VIDA
+    def iniciar(self) -> None:
+        """
+        Abre o socket de escuta e inicia as threads de E/S e de decodificação.
+        """
+        self._socket = socket.create_server((self.host, self.port))
+        self._socket.setblocking(False)
+        self.port = self._socket.getsockname()[1]  # Permite usar port=0 para escolher uma porta livre
+        # Par de sockets usado pelos trabalhadores para acordar a thread de E/S quando liberam espaço na fila
+        self._despertar_leitura, self._despertar_escrita = socket.socketpair()
+        self._despertar_leitura.setblocking(False)
+        self._despertar_escrita.setblocking(False)
+        self._seletor = selectors.DefaultSelector()
+        self._seletor.register(self._socket, selectors.EVENT_READ, None)
+        self._seletor.register(self._despertar_leitura, selectors.EVENT_READ, self._despertar_leitura)
+        self._parar.clear()
+        self._threads = [threading.Thread(target=self._laco, daemon=True)]
+        self._threads += [threading.Thread(target=self._trabalhador, args=(fila,), daemon=True) for fila in self._filas]
+        for thread in self._threads:
+            thread.start()
+        print(f"Server started at {self.host}:{self.port}")
+
+    def parar(self) -> None:
+        """
+        Encerra o servidor: fecha as conexões e aguarda as mensagens já enfileiradas serem decodificadas.
+        """
+        self._parar.set()
+        self._threads[0].join()
+        for fila in self._filas:
+            fila.put(None)  # Sinaliza o fim para cada trabalhador
+        for thread in self._threads[1:]:
+            thread.join()
+        self._despertar_leitura.close()
+        self._despertar_escrita.close()
+
+    def estatisticas(self) -> list[EstatisticasConexao]:
+        """
+        Retorna uma cópia das estatísticas das conexões ativas, seguida de uma entrada (com ativa=False) que soma os
+        contadores de todas as conexões já encerradas. Uma conexão encerrada continua na lista, com ativa=False, até
+        que a sua trabalhadora termine os eventos que ela deixou na fila.
+        """
+        with self._trava:
+            return [replace(conexao.estatisticas) for conexao in self._conexoes] + [replace(self._encerradas)]
+
+    # THREAD DE E/S
+    def _laco(self) -> None:
+        try:
+            while not self._parar.is_set():
+                self._retomar_pausadas()
+                for chave, _ in self._seletor.select(timeout=0.1):
+                    if chave.data is None:
+                        self._aceitar()
+                    elif chave.data is self._despertar_leitura:
+                        self._esvaziar_despertador()
+                    else:
+                        self._ler(chave.data)
+        finally:
+            for conexao in list(self._conexoes):
+                if conexao.estatisticas.ativa:
+                    self._fechar(conexao)
+            # Os eventos que esperavam espaço na fila (inclusive o encerramento de cada conexão) ainda são entregues
+            for conexao in list(self._pausadas):
+                for evento in conexao.pendentes:
+                    conexao.fila.put(evento)
+                conexao.pendentes.clear()
+            self._pausadas.clear()
+            self._seletor.close()
+            self._socket.close()
+
+    def _esvaziar_despertador(self) -> None:
+        try:
+            while self._despertar_leitura.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _aceitar(self) -> None:
+        try:
+            sock, endereco = self._socket.accept()
+        except BlockingIOError:
+            return
+        print(f"Connected by {endereco}")
+        sock.setblocking(False)
+        conexao: _Conexao = _Conexao(sock, endereco, self._filas[self._aceitas % len(self._filas)])
+        self._aceitas += 1
+        with self._trava:
+            self._conexoes.append(conexao)
+        self._seletor.register(sock, selectors.EVENT_READ, conexao)
+
+    def _fechar(self, conexao: _Conexao) -> None:
+        if conexao not in self._pausadas:
+            self._seletor.unregister(conexao.sock)
+        conexao.sock.close()
+        conexao.estatisticas.ativa = False
+        # A trabalhadora ainda pode ter mensagens desta conexão na fila: o encerramento vai pela mesma fila, depois
+        # delas, e só então os contadores são somados ao resumo (ver _encerrar)
+        self._enfileirar(conexao, (conexao, None, None))
+
+    def _ler(self, conexao: _Conexao) -> None:
+        partes: MensagemEmPartes | None = conexao.partes
+        destino: memoryview = memoryview(conexao.cabecalho)[conexao.posicao:] if partes is None else partes.livre(self.tamanho_parte)
+        try:
+            n: int = conexao.sock.recv_into(destino)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            n = 0
+        if n == 0:  # Conexão encerrada pelo transmissor
+            self._fechar(conexao)
+            return
+        conexao.estatisticas.bytes_recebidos += n
+
+        try:
+            if partes is None:
+                conexao.posicao += n
+                if conexao.posicao < len(conexao.cabecalho):
+                    return
+                # O cabeçalho está completo: aloca o corpo da mensagem inteira a partir do prefixo de tamanho
+                partes = conexao.partes = MensagemEmPartes(None, decodificar_cabecalho(bytes(conexao.cabecalho), self.tamanho_maximo))
+            else:
+                amostras: np.ndarray = partes.receber(n)
+                if len(amostras) and self.entregar_partes:
+                    self._enfileirar(conexao, (conexao, partes, amostras))
+        except ERROS_CONEXAO as e:
+            print(f"Mensagem inválida de {conexao.estatisticas.endereco}: {e}")
+            conexao.estatisticas.erros += 1
+            self._fechar(conexao)  # Sem o prefixo de tamanho confiável não é possível ressincronizar
+            return
+        if not partes.completa:
+            return
+        estatisticas: EstatisticasConexao = conexao.estatisticas
+        mensagem: Mensagem = partes.mensagem
+        estatisticas.mensagens_recebidas += 1
+        if estatisticas.ultima_sequencia is not None and mensagem.sequencia > estatisticas.ultima_sequencia + 1:
+            estatisticas.perdidas += mensagem.sequencia - estatisticas.ultima_sequencia - 1
+        estatisticas.ultima_sequencia = mensagem.sequencia
+        conexao.preparar_cabecalho()
+        self._enfileirar(conexao, (conexao, partes, None))
+
+    def _enfileirar(self, conexao: _Conexao, evento: tuple) -> None:
+        if not conexao.pendentes:
+            try:
+                conexao.fila.put_nowait(evento)
+                return
+            except queue.Full:
+                pass
+        # Fila cheia (ou eventos anteriores ainda esperando): guarda o evento, mantendo a ordem, e para de ler a
+        # conexão até que a trabalhadora libere espaço
+        conexao.pendentes.append(evento)
+        if conexao not in self._pausadas:
+            conexao.estatisticas.pausas += 1
+            if conexao.estatisticas.ativa:
+                self._seletor.unregister(conexao.sock)
+            self._pausadas.add(conexao)
+
+    def _retomar_pausadas(self) -> None:
+        for conexao in list(self._pausadas):
+            while conexao.pendentes:
+                try:
+                    conexao.fila.put_nowait(conexao.pendentes[0])
+                except queue.Full:
+                    break
+                conexao.pendentes.popleft()
+            if not conexao.pendentes:
+                self._pausadas.discard(conexao)
+                if conexao.estatisticas.ativa:
+                    self._seletor.register(conexao.sock, selectors.EVENT_READ, conexao)
+
+    # THREADS DE DECODIFICAÇÃO
+    def _trabalhador(self, fila: queue.Queue) -> None:
+        while True:
+            evento: tuple[_Conexao, MensagemEmPartes | None, np.ndarray | None] | None = fila.get()
+            if evento is None:
+                break
+            conexao, partes, amostras = evento
+            if self._pausadas:
+                try:
+                    self._despertar_escrita.send(b"\0")  # Há conexões esperando espaço na fila
+                except BlockingIOError:
+                    pass
+            if partes is None:
+                self._encerrar(conexao)
+                continue
+            try:
+                if amostras is None:
+                    self._concluir(conexao, partes)
+                else:
+                    self._receber_parte(conexao, partes, amostras)
+            except Exception as e:
+                conexao.estatisticas.erros += 1
+                print(f"Erro ao decodificar mensagem de {conexao.estatisticas.endereco}: {e}")
+
+    def _encerrar(self, conexao: _Conexao) -> None:
+        """
+        Chamada na trabalhadora da conexão depois do último evento dela: os contadores vão para o resumo das
+        encerradas, para que a lista de conexões não cresça indefinidamente.
+        """
+        conexao.contexto = None
+        with self._trava:
+            self._conexoes.remove(conexao)
+            for contador in _CONTADORES:
+                setattr(self._encerradas, contador, getattr(self._encerradas, contador) + getattr(conexao.estatisticas, contador))
+
+    def _receber_parte(self, conexao: _Conexao, partes: MensagemEmPartes, amostras: np.ndarray) -> None:
+        """
+        Chamada na trabalhadora da conexão com as amostras recém-chegadas de uma mensagem, em ordem (só quando
+        entregar_partes é verdadeiro).
+        """
+
+    def _concluir(self, conexao: _Conexao, partes: MensagemEmPartes) -> None:
+        """
+        Chamada na trabalhadora da conexão quando a mensagem chegou inteira, depois de todas as suas partes.
+        """
+        self.ao_receber(partes.mensagem, conexao.estatisticas)
+        conexao.estatisticas.mensagens_decodificadas += 1
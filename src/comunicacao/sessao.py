@@ -0,0 +1,114 @@
+import select
+import socket
+import time
+from dataclasses import replace
+from .captura import GravadorCaptura
+from .protocolo import Mensagem, codificar
+
+
+class SessaoTransmissor:
+    """
+    Sessão de longa duração do transmissor com o receptor: uma única conexão TCP reaproveitada por todas as mensagens.
+
+    Cada mensagem enviada recebe o próximo número de sequência da sessão, o que permite ao receptor perceber
+    mensagens perdidas. A conexão é aberta no primeiro envio e, se cair, é refeita automaticamente (com espera
+    crescente entre as tentativas), reenviando a mensagem que falhou com o mesmo número de sequência. Como o
+    receptor nunca escreve no socket, qualquer dado disponível para leitura indica que ele encerrou a conexão, o que é
+    verificado antes de cada envio.
+
+    Args:
+        host (str): Endereço do receptor.
+        port (int): Porta do receptor.
+        tentativas (int): Número máximo de tentativas de envio de cada mensagem.
+        espera (float): Espera, em segundos, antes da segunda tentativa; dobra a cada nova tentativa.
+        timeout (float): Tempo máximo, em segundos, para conectar e para cada envio.
+        captura (GravadorCaptura, opcional): Se dado, cada mensagem enviada também é gravada nele, para ser
+            decodificada de novo depois (ver src.pipeline.reproducao).
+
+    Exemplo:
+        with SessaoTransmissor("127.0.0.1", 65432) as sessao:
+            for mensagem in mensagens:
+                sessao.enviar(mensagem)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 65432, tentativas: int = 3, espera: float = 0.2,
+                 timeout: float = 5.0, captura: GravadorCaptura | None = None) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.tentativas: int = tentativas
+        self.espera: float = espera
+        self.timeout: float = timeout
+        self.captura: GravadorCaptura | None = captura
+        self.sequencia: int = 0  # Número de sequência da próxima mensagem
+        self.conexoes: int = 0  # Conexões abertas pela sessão (1 + reconexões)
+        self._socket: socket.socket | None = None
+
+    def __enter__(self) -> "SessaoTransmissor":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.fechar()
+
+    @property
+    def conectada(self) -> bool:
+        return self._socket is not None
+
+    def conectar(self) -> None:
+        """
+        Abre a conexão com o receptor (se ainda não estiver aberta).
+        """
+        if self._socket is not None:
+            return
+        self._socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Mensagens seguidas não esperam o ACK anterior
+        self.conexoes += 1
+
+    def fechar(self) -> None:
+        """
+        Encerra a conexão. Um novo envio abre outra conexão, mantendo a numeração de sequência.
+        """
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _encerrada_pelo_receptor(self) -> bool:
+        legiveis, _, _ = select.select([self._socket], [], [], 0)
+        if not legiveis:
+            return False
+        try:
+            return self._socket.recv(1, socket.MSG_PEEK) == b""
+        except OSError:
+            return True
+
+    def enviar(self, mensagem: Mensagem) -> int:
+        """
+        Envia uma mensagem pela sessão, reconectando se necessário.
+
+        Args:
+            mensagem (Mensagem): A mensagem a ser enviada. O seu campo `sequencia` é preenchido pela sessão.
+
+        Returns:
+            int: O número de sequência atribuído à mensagem.
+
+        Raises:
+            ConnectionError: Se a mensagem não puder ser enviada em nenhuma das tentativas.
+        """
+        sequencia: int = self.sequencia
+        mensagem = replace(mensagem, sequencia=sequencia)
+        dados: bytes = codificar(mensagem)  # Serializada uma vez, mesmo com reenvios
+        for tentativa in range(self.tentativas):
+            try:
+                if self._socket is not None and self._encerrada_pelo_receptor():
+                    self.fechar()
+                self.conectar()
+                self._socket.sendall(dados)
+                break
+            except OSError as e:
+                self.fechar()
+                if tentativa == self.tentativas - 1:
+                    raise ConnectionError(f"Não foi possível enviar a mensagem {sequencia} para {self.host}:{self.port}: {e}") from e
+                time.sleep(self.espera * 2**tentativa)
+        self.sequencia += 1
+        if self.captura is not None:
+            self.captura.gravar(mensagem)
+        return sequencia
@@ -0,0 +1,23 @@
+from .config import LinkConfig
+from .pipeline import Pipeline, Transmissao, Recepcao
+from .progressivo import DecodificadorProgressivo, receber_progressivo
+
+__all__ = ["LinkConfig", "Pipeline", "Transmissao", "Recepcao", "DecodificadorProgressivo", "receber_progressivo", "MODOS_ARQ",
+           "EstatisticasARQ", "TransmissorARQ", "ReceptorARQ", "PipelineParalelo",
+           "ServidorProgressivo"]
+
+
+def __getattr__(nome: str):
+    # O pool de processos e a memória compartilhada só são importados quando usados
+    if nome == "PipelineParalelo":
+        from .paralelo import PipelineParalelo
+        return PipelineParalelo
+    # O servidor (threads, selectors) só é importado quando usado, como em src.comunicacao
+    if nome == "ServidorProgressivo":
+        from .servidor import ServidorProgressivo
+        return ServidorProgressivo
+    # O módulo do ARQ também é executável (python -m src.pipeline.arq), então não é importado junto com o pacote
+    if nome in ("MODOS_ARQ", "EstatisticasARQ", "TransmissorARQ", "ReceptorARQ"):
+        from . import arq
+        return getattr(arq, nome)
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
\ No newline at end of file
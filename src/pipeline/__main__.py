@@ -0,0 +1,94 @@
+"""
+Executa a cadeia de transmissão e recepção pela linha de comando, sem interface gráfica.
+
+Exemplos:
+    python -m src.pipeline --mensagem "Ola, mundo" --mod-digital Manchester --mod-portadora FSK
+    python -m src.pipeline --arquivo dados.bin --deteccao CRC-32 --repeticoes 1000
+    python -m src.pipeline --arquivo video.bin --mod-portadora 8-QAM --processos 8
+    python -m src.pipeline --mensagem "Ola" --saida onda.f32
+    python -m src.pipeline --mensagem "Ola" --captura trafego.tr1cap
+    python -m src.pipeline --mensagem "Ola, mundo" --mod-portadora 8-QAM --ebn0 12 --semente-canal 1
+"""
+
+import argparse
+import time
+import numpy as np
+from src.comunicacao import GravadorCaptura
+from src.comunicacao.protocolo import DETECCOES_CORRECOES, ENQUADRAMENTOS
+from .config import LinkConfig
+from .pipeline import Pipeline
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    padrao: LinkConfig = LinkConfig()
+    parser = argparse.ArgumentParser(prog="python -m src.pipeline", description="Transmite e recebe uma mensagem pelo simulador, sem interface gráfica.")
+    entrada = parser.add_mutually_exclusive_group(required=True)
+    entrada.add_argument("--mensagem", help="Texto ASCII a ser transmitido")
+    entrada.add_argument("--arquivo", help="Arquivo cujo conteúdo será transmitido")
+    parser.add_argument("--mod-digital", default=padrao.mod_digital, choices=["NRZ-Polar", "Manchester", "Bipolar"])
+    parser.add_argument("--mod-portadora", default=padrao.mod_portadora, choices=["ASK", "FSK", "8-QAM", "M-FSK"])
+    parser.add_argument("--enquadramento", default=padrao.enquadramento, choices=list(ENQUADRAMENTOS))
+    parser.add_argument("--mtu", type=int, default=padrao.mtu, help="Tamanho máximo da carga útil de cada quadro, em bytes (até 65536)")
+    parser.add_argument("--deteccao", default=padrao.deteccao_correcao, choices=list(DETECCOES_CORRECOES))
+    parser.add_argument("--sample", type=int, default=padrao.sample)
+    parser.add_argument("--frequencia", type=float, default=padrao.frequencia)
+    parser.add_argument("--amplitude", type=float, default=padrao.amplitude)
+    parser.add_argument("--fase", type=float, default=padrao.fase)
+    parser.add_argument("--amp-zero", type=float, default=padrao.amp_zero)
+    parser.add_argument("--amp-one", type=float, default=padrao.amp_one)
+    parser.add_argument("--freq-zero", type=float, default=padrao.freq_zero)
+    parser.add_argument("--freq-one", type=float, default=padrao.freq_one)
+    parser.add_argument("--frequencias-mfsk", type=float, nargs="+", default=list(padrao.frequencias_mfsk), help="As M frequências do M-FSK (M potência de 2)")
+    parser.add_argument("--backend", default=padrao.backend, choices=["python", "numpy"])
+    parser.add_argument("--ebn0", type=float, help="Eb/N0 do canal AWGN entre a modulação e a demodulação, em dB (omitida: sem ruído)")
+    parser.add_argument("--semente-canal", type=int, help="Semente do ruído do canal, para resultados reproduzíveis")
+    parser.add_argument("--processos", type=int, help="Divide a modulação e a demodulação entre este número de processos (ver PipelineParalelo)")
+    parser.add_argument("--repeticoes", type=int, default=1, help="Número de vezes que a mensagem é transmitida e recebida (para medir a vazão)")
+    parser.add_argument("--saida", help="Grava a onda transmitida neste arquivo, como float32 little-endian")
+    parser.add_argument("--captura", help="Acrescenta a mensagem transmitida a este arquivo de captura (ver src.pipeline.reproducao)")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = criar_parser().parse_args(argv)
+    config: LinkConfig = LinkConfig(
+        mod_digital=args.mod_digital, mod_portadora=args.mod_portadora, enquadramento=args.enquadramento,
+        deteccao_correcao=args.deteccao, mtu=args.mtu, sample=args.sample, frequencia=args.frequencia, amplitude=args.amplitude,
+        fase=args.fase, amp_zero=args.amp_zero, amp_one=args.amp_one, freq_zero=args.freq_zero, freq_one=args.freq_one,
+        frequencias_mfsk=tuple(args.frequencias_mfsk),
+        backend=args.backend, ebn0_db=args.ebn0, semente_canal=args.semente_canal,
+    )
+    if args.mensagem is not None:
+        dados: bytes = args.mensagem.encode("ascii")
+    else:
+        with open(args.arquivo, "rb") as arquivo:
+            dados = arquivo.read()
+
+    if args.processos:
+        from .paralelo import PipelineParalelo
+        pipeline = PipelineParalelo(config, n_processos=args.processos)
+    else:
+        pipeline = Pipeline(config)
+    inicio: float = time.perf_counter()
+    for _ in range(args.repeticoes):
+        transmissao = pipeline.transmitir(dados)
+        recepcao = pipeline.receber(transmissao.wave, len(transmissao.dig_signal))
+    duracao: float = time.perf_counter() - inicio
+    if args.processos:
+        pipeline.fechar()
+
+    if args.saida:
+        np.asarray(transmissao.wave, dtype="<f4").tofile(args.saida)
+    if args.captura:
+        with GravadorCaptura(args.captura) as gravador:
+            gravador.gravar(config.para_mensagem(transmissao.wave, transmissao.dig_signal))
+    print(f"Amostras transmitidas: {len(transmissao.wave)}")
+    print(f"Dados recebidos: {recepcao.dados!r}")
+    print(f"Integridade: {'ok' if recepcao.integro else 'erro detectado'}")
+    print(f"Recuperação: {'ok' if recepcao.dados == dados else 'falhou'}")
+    print(f"{args.repeticoes} mensagens em {duracao:.3f} s ({args.repeticoes / duracao:.1f} mensagens/s)")
+    return 0 if recepcao.dados == dados else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,401 @@
+"""
+Modo de enlace confiável: ARQ de janela deslizante (Go-Back-N ou Selective Repeat) sobre os enquadramentos existentes.
+
+Os dados são divididos em quadros ARQ, cada um com um número de sequência de 16 bits no início:
+    [sequência (2 bytes, big-endian) | carga]
+Cada quadro ARQ é uma mensagem do protocolo, transmitida pela cadeia inteira do Pipeline (enquadramento,
+detecção/correção, codificação de linha e modulação), então passa pelos mesmos erros de canal que uma mensagem
+comum e é verificado no receptor pela técnica de detecção configurada. O receptor responde, pelo mesmo socket, com
+quadros de controle ACK/NAK de tamanho fixo (o canal de volta é considerado sem erros).
+
+    Go-Back-N: o receptor só aceita o próximo quadro esperado e confirma de forma cumulativa (ACK n = todos os
+        quadros antes de n chegaram); um NAK ou o estouro do temporizador do quadro mais antigo faz o transmissor
+        reenviar toda a janela a partir dele.
+    Selective Repeat: o receptor guarda os quadros fora de ordem dentro da janela e confirma cada um; o transmissor
+        mantém um temporizador por quadro e reenvia só os quadros com NAK ou com o temporizador estourado.
+
+Com janela 1, os dois modos se reduzem ao stop-and-wait.
+
+Exemplos:
+    python -m src.pipeline.arq --modo "Selective Repeat" --janela 32 --taxa-erro 0.001
+    python -m src.pipeline.arq --modo Go-Back-N --janela 8 --tamanho 65536 --tamanho-quadro 256
+"""
+
+import argparse
+import select
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass
+import numpy as np
+from src.canal import CanalBernoulli, ModeloErro
+from src.comunicacao import Mensagem, enviar_mensagem, receber_mensagem
+from src.utils import BitBuffer
+from .config import LinkConfig
+from .pipeline import Pipeline
+
+MODOS_ARQ: tuple[str, ...] = ("Go-Back-N", "Selective Repeat")
+MODULO_SEQUENCIA: int = 1 << 16  # Números de sequência de 16 bits
+SEQUENCIA: struct.Struct = struct.Struct(">H")
+# Quadro de controle: mágico, tipo (ACK/NAK), número de sequência
+CONTROLE: struct.Struct = struct.Struct("<3sBH")
+MAGICO_CONTROLE: bytes = b"ARQ"
+ACK: int = 0
+NAK: int = 1
+
+
+@dataclass
+class EstatisticasARQ:
+    """
+    Contadores de uma transferência ARQ.
+
+    Atributos:
+        quadros: Quadros ARQ distintos (dados a entregar).
+        transmissoes: Quadros enviados, contando as retransmissões.
+        retransmissoes: Quadros enviados de novo (por NAK ou por temporizador).
+        estouros: Vezes em que um temporizador de retransmissão estourou.
+        acks, naks: Quadros de controle recebidos pelo transmissor (ou enviados, no receptor).
+        descartados: Quadros recebidos com erro detectado ou fora da janela (no receptor).
+        bytes_carga: Bytes de carga útil entregues.
+        segundos: Duração da transferência.
+    """
+    quadros: int = 0
+    transmissoes: int = 0
+    retransmissoes: int = 0
+    estouros: int = 0
+    acks: int = 0
+    naks: int = 0
+    descartados: int = 0
+    bytes_carga: int = 0
+    segundos: float = 0.0
+
+    @property
+    def eficiencia(self) -> float:
+        """
+        Fração das transmissões que não foram retransmissões.
+        """
+        return self.quadros / self.transmissoes if self.transmissoes else 0.0
+
+    @property
+    def goodput(self) -> float:
+        """
+        Bits de carga útil entregues por segundo.
+        """
+        return 8 * self.bytes_carga / self.segundos if self.segundos else 0.0
+
+
+def _distancia(sequencia: int, base: int) -> int:
+    """
+    Quantos quadros `sequencia` está à frente de `base`, no espaço circular de números de sequência.
+    """
+    return (sequencia - base) % MODULO_SEQUENCIA
+
+
+def _validar_janela(modo: str, janela: int) -> None:
+    if modo not in MODOS_ARQ:
+        raise ValueError(f"Modo de ARQ desconhecido: {modo}")
+    # A janela precisa ser menor que o espaço de sequência (Go-Back-N) ou que a metade dele (Selective Repeat) para
+    # que um quadro novo nunca seja confundido com a retransmissão de um antigo
+    limite: int = MODULO_SEQUENCIA - 1 if modo == "Go-Back-N" else MODULO_SEQUENCIA // 2
+    if not 1 <= janela <= limite:
+        raise ValueError(f"A janela do {modo} deve estar entre 1 e {limite}")
+
+
+class TransmissorARQ:
+    """
+    Lado transmissor do ARQ: envia os quadros pela janela deslizante e trata os ACK/NAK e os temporizadores.
+
+    Args:
+        conn (socket.socket): Socket conectado ao ReceptorARQ (usado nos dois sentidos).
+        config (LinkConfig): Configuração do enlace. Precisa de uma técnica de detecção/correção de erros.
+        modo (str): "Go-Back-N" ou "Selective Repeat".
+        janela (int): Número máximo de quadros enviados e ainda não confirmados.
+        tamanho_quadro (int): Bytes de carga útil por quadro ARQ.
+        temporizador (float): Tempo, em segundos, sem confirmação até reenviar um quadro.
+        canal (ModeloErro, opcional): Modelo de erro aplicado ao trem de bits de cada quadro antes da codificação de
+            linha (o mesmo ponto em que a interface insere erros).
+        tipo_amostra (str): Como a onda de cada quadro é enviada (ver src.comunicacao.TIPOS_AMOSTRA).
+
+    Exemplo:
+        transmissor = TransmissorARQ(conn, LinkConfig(deteccao_correcao="CRC-32"), "Selective Repeat", janela=16)
+        estatisticas = transmissor.enviar(dados)
+    """
+
+    def __init__(self, conn: socket.socket, config: LinkConfig, modo: str = "Selective Repeat", janela: int = 16,
+                 tamanho_quadro: int = 64, temporizador: float = 0.2, canal: ModeloErro | None = None,
+                 tipo_amostra: str = "float32") -> None:
+        _validar_janela(modo, janela)
+        if config.deteccao_correcao == "Nenhum":
+            raise ValueError("O ARQ precisa de uma técnica de detecção de erros para saber quais quadros reenviar")
+        self.conn: socket.socket = conn
+        self.config: LinkConfig = config
+        self.pipeline: Pipeline = Pipeline(config)
+        self.modo: str = modo
+        self.janela: int = janela
+        self.tamanho_quadro: int = tamanho_quadro
+        self.temporizador: float = temporizador
+        self.canal: ModeloErro | None = canal
+        self.tipo_amostra: str = tipo_amostra
+        self.estatisticas: EstatisticasARQ = EstatisticasARQ()
+        self._controle: bytearray = bytearray()  # Bytes de quadros de controle ainda incompletos
+
+    def _enviar_quadro(self, indice: int, carga: bytes) -> None:
+        """
+        Passa o quadro pela cadeia de transmissão (com os erros do canal) e o envia como uma mensagem do protocolo.
+        """
+        bit_stream: BitBuffer = self.pipeline.codificar_enlace(SEQUENCIA.pack(indice % MODULO_SEQUENCIA) + carga)
+        if self.canal is not None:
+            bit_stream = self.canal.aplicar(bit_stream)
+        dig_signal: np.ndarray = self.pipeline.codificar_linha(bit_stream)
+        mensagem: Mensagem = self.config.para_mensagem(self.pipeline.modular(dig_signal), dig_signal, self.tipo_amostra)
+        enviar_mensagem(self.conn, mensagem)
+        self.estatisticas.transmissoes += 1
+
+    def _ler_controle(self, espera: float) -> list[tuple[int, int]]:
+        """
+        Aguarda até `espera` segundos por quadros de controle e retorna os (tipo, sequência) completos recebidos.
+        """
+        legiveis, _, _ = select.select([self.conn], [], [], max(espera, 0.0))
+        if legiveis:
+            dados: bytes = self.conn.recv(1 << 16)
+            if not dados:
+                raise ConnectionError("O receptor encerrou a conexão no meio da transferência")
+            self._controle += dados
+        controles: list[tuple[int, int]] = []
+        while len(self._controle) >= CONTROLE.size:
+            magico, tipo, sequencia = CONTROLE.unpack_from(self._controle)
+            del self._controle[:CONTROLE.size]
+            if magico != MAGICO_CONTROLE:
+                raise ConnectionError("Quadro de controle inválido")
+            controles.append((tipo, sequencia))
+            self.estatisticas.acks += tipo == ACK
+            self.estatisticas.naks += tipo == NAK
+        return controles
+
+    def enviar(self, dados: bytes) -> EstatisticasARQ:
+        """
+        Transfere os dados de forma confiável e, ao fim, encerra o sentido de envio do socket (o que sinaliza o fim
+        da transferência ao receptor).
+
+        Returns:
+            EstatisticasARQ: Os contadores da transferência.
+        """
+        quadros: list[bytes] = [dados[i:i + self.tamanho_quadro] for i in range(0, len(dados), self.tamanho_quadro)]
+        self.estatisticas = EstatisticasARQ(quadros=len(quadros), bytes_carga=len(dados))
+        inicio: float = time.perf_counter()
+        if self.modo == "Go-Back-N":
+            self._go_back_n(quadros)
+        else:
+            self._selective_repeat(quadros)
+        self.conn.shutdown(socket.SHUT_WR)
+        self.estatisticas.segundos = time.perf_counter() - inicio
+        return self.estatisticas
+
+    def _go_back_n(self, quadros: list[bytes]) -> None:
+        base: int = 0  # Quadro mais antigo ainda não confirmado
+        proximo: int = 0  # Próximo quadro a enviar
+        limite: float = 0.0  # Instante em que o temporizador do quadro `base` estoura
+        while base < len(quadros):
+            while proximo < min(base + self.janela, len(quadros)):
+                if proximo == base:
+                    limite = time.perf_counter() + self.temporizador
+                self._enviar_quadro(proximo, quadros[proximo])
+                proximo += 1
+            for tipo, sequencia in self._ler_controle(limite - time.perf_counter()):
+                distancia: int = _distancia(sequencia, base)
+                if tipo == ACK and 0 < distancia <= proximo - base:
+                    # ACK cumulativo: todos os quadros antes de `sequencia` chegaram
+                    base += distancia
+                    limite = time.perf_counter() + self.temporizador
+                elif tipo == NAK and distancia == 0 and proximo > base:
+                    # O receptor ainda espera `base`: volta e reenvia a janela inteira
+                    self.estatisticas.retransmissoes += proximo - base
+                    proximo = base
+            if base < proximo and time.perf_counter() >= limite:
+                self.estatisticas.estouros += 1
+                self.estatisticas.retransmissoes += proximo - base
+                proximo = base
+
+    def _selective_repeat(self, quadros: list[bytes]) -> None:
+        base: int = 0
+        proximo: int = 0
+        confirmados: set[int] = set()
+        limites: dict[int, float] = {}  # Instante em que o temporizador de cada quadro pendente estoura
+        while base < len(quadros):
+            while proximo < min(base + self.janela, len(quadros)):
+                self._enviar_quadro(proximo, quadros[proximo])
+                limites[proximo] = time.perf_counter() + self.temporizador
+                proximo += 1
+            espera: float = min(limites.values()) - time.perf_counter() if limites else self.temporizador
+            for tipo, sequencia in self._ler_controle(espera):
+                distancia: int = _distancia(sequencia, base)
+                if distancia >= proximo - base:
+                    continue  # Controle de um quadro já confirmado (ou ainda não enviado)
+                indice: int = base + distancia
+                if tipo == ACK:
+                    confirmados.add(indice)
+                    limites.pop(indice, None)
+                elif indice not in confirmados:
+                    self._enviar_quadro(indice, quadros[indice])
+                    self.estatisticas.retransmissoes += 1
+                    limites[indice] = time.perf_counter() + self.temporizador
+            while base in confirmados:
+                confirmados.discard(base)
+                base += 1
+            agora: float = time.perf_counter()
+            for indice in [indice for indice, limite in limites.items() if limite <= agora]:
+                self.estatisticas.estouros += 1
+                self.estatisticas.retransmissoes += 1
+                self._enviar_quadro(indice, quadros[indice])
+                limites[indice] = time.perf_counter() + self.temporizador
+
+
+class ReceptorARQ:
+    """
+    Lado receptor do ARQ: decodifica cada quadro pelo Pipeline, confirma (ou pede de novo) os quadros e entrega a
+    carga útil na ordem.
+
+    Args:
+        conn (socket.socket): Socket conectado ao TransmissorARQ.
+        modo (str): "Go-Back-N" ou "Selective Repeat" (o mesmo do transmissor).
+        janela (int): Tamanho da janela de recepção no Selective Repeat (o mesmo do transmissor).
+
+    Exemplo:
+        dados = ReceptorARQ(conn, "Selective Repeat", janela=16).receber()
+    """
+
+    def __init__(self, conn: socket.socket, modo: str = "Selective Repeat", janela: int = 16) -> None:
+        _validar_janela(modo, janela)
+        self.conn: socket.socket = conn
+        self.modo: str = modo
+        self.janela: int = janela
+        self.estatisticas: EstatisticasARQ = EstatisticasARQ()
+
+    def _responder(self, tipo: int, indice: int) -> None:
+        self.conn.sendall(CONTROLE.pack(MAGICO_CONTROLE, tipo, indice % MODULO_SEQUENCIA))
+        self.estatisticas.acks += tipo == ACK
+        self.estatisticas.naks += tipo == NAK
+
+    def receber(self) -> bytes:
+        """
+        Recebe quadros até o transmissor encerrar a transferência.
+
+        Returns:
+            bytes: A carga útil entregue, na ordem.
+        """
+        entregues: list[bytes] = []
+        esperado: int = 0  # Próximo quadro a entregar
+        guardados: dict[int, bytes] = {}  # Quadros fora de ordem (Selective Repeat)
+        pedidos: set[int] = set()  # Quadros já pedidos com NAK: cada um é pedido uma vez, para não provocar retransmissões repetidas
+        inicio: float = time.perf_counter()
+        while (mensagem := receber_mensagem(self.conn)) is not None:
+            recepcao = Pipeline(LinkConfig.de_mensagem(mensagem)).receber_mensagem(mensagem)
+            if not recepcao.integro or len(recepcao.dados) < SEQUENCIA.size:
+                # Quadro danificado: a sequência não é confiável, então só o quadro esperado pode ser pedido
+                self.estatisticas.descartados += 1
+                if esperado not in pedidos:
+                    self._responder(NAK, esperado)
+                    pedidos.add(esperado)
+                continue
+            distancia: int = _distancia(SEQUENCIA.unpack_from(recepcao.dados)[0], esperado)
+            carga: bytes = recepcao.dados[SEQUENCIA.size:]
+
+            if self.modo == "Go-Back-N":
+                if distancia == 0:
+                    entregues.append(carga)
+                    pedidos.discard(esperado)
+                    esperado += 1
+                else:
+                    self.estatisticas.descartados += 1
+                self._responder(ACK, esperado)  # Cumulativo (repetido, se o quadro não era o esperado)
+                continue
+
+            if distancia < self.janela:
+                guardados.setdefault(esperado + distancia, carga)
+                self._responder(ACK, esperado + distancia)
+                for faltando in range(esperado, esperado + distancia):
+                    # Quadros anteriores que faltaram: pede cada um assim que a lacuna aparece
+                    if faltando not in guardados and faltando not in pedidos:
+                        self._responder(NAK, faltando)
+                        pedidos.add(faltando)
+                while esperado in guardados:
+                    entregues.append(guardados.pop(esperado))
+                    pedidos.discard(esperado)
+                    esperado += 1
+            elif distancia >= MODULO_SEQUENCIA - self.janela:
+                self._responder(ACK, esperado + distancia - MODULO_SEQUENCIA)  # Retransmissão de um quadro já entregue: o ACK se perdeu
+            else:
+                self.estatisticas.descartados += 1
+        dados: bytes = b"".join(entregues)
+        self.estatisticas.quadros = len(entregues)
+        self.estatisticas.bytes_carga = len(dados)
+        self.estatisticas.segundos = time.perf_counter() - inicio
+        return dados
+
+
+def _atrasar(origem: socket.socket, destino: socket.socket, atraso: float) -> None:
+    """
+    Repassa os bytes de `origem` para `destino` `atraso` segundos depois de chegarem, simulando o atraso de
+    propagação do enlace (vários quadros podem estar a caminho ao mesmo tempo).
+    """
+    pendentes: list[tuple[float, bytes]] = []
+    aberto: bool = True
+    while aberto or pendentes:
+        espera: float = pendentes[0][0] - time.perf_counter() if pendentes else 1.0
+        if aberto:
+            legiveis, _, _ = select.select([origem], [], [], max(espera, 0.0))
+            if legiveis:
+                dados: bytes = origem.recv(1 << 16)
+                if dados:
+                    pendentes.append((time.perf_counter() + atraso, dados))
+                else:
+                    aberto = False
+        elif espera > 0:
+            time.sleep(espera)
+        while pendentes and pendentes[0][0] <= time.perf_counter():
+            destino.sendall(pendentes.pop(0)[1])
+    destino.shutdown(socket.SHUT_WR)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.pipeline.arq", description="Transfere dados aleatórios por ARQ em um canal com erros (transmissor e receptor no mesmo processo).")
+    parser.add_argument("--modo", default="Selective Repeat", choices=list(MODOS_ARQ))
+    parser.add_argument("--janela", type=int, default=16, help="Tamanho da janela (1: stop-and-wait)")
+    parser.add_argument("--tamanho", type=int, default=16384, help="Bytes de carga útil transferidos")
+    parser.add_argument("--tamanho-quadro", type=int, default=64, help="Bytes de carga útil por quadro ARQ")
+    parser.add_argument("--taxa-erro", type=float, default=1e-3, help="Probabilidade de inversão de cada bit no canal")
+    parser.add_argument("--temporizador", type=float, default=0.2, help="Temporizador de retransmissão, em segundos")
+    parser.add_argument("--atraso", type=float, default=0.005, help="Atraso de propagação em cada sentido, em segundos")
+    parser.add_argument("--deteccao", default="CRC-32", choices=["Bit de Paridade", "CRC-32"])
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    dados: bytes = np.random.default_rng(args.semente).integers(0, 256, args.tamanho, dtype=np.uint8).tobytes()
+    config: LinkConfig = LinkConfig(deteccao_correcao=args.deteccao, sample=8)
+    # Transmissor e receptor ligados por dois repetidores que atrasam os bytes em cada sentido
+    lado_transmissor, ida_entrada = socket.socketpair()
+    ida_saida, lado_receptor = socket.socketpair()
+    threading.Thread(target=_atrasar, args=(ida_entrada, ida_saida, args.atraso), daemon=True).start()
+    threading.Thread(target=_atrasar, args=(ida_saida, ida_entrada, args.atraso), daemon=True).start()
+    receptor: ReceptorARQ = ReceptorARQ(lado_receptor, args.modo, args.janela)
+    recebidos: list[bytes] = []
+    thread = threading.Thread(target=lambda: recebidos.append(receptor.receber()))
+    thread.start()
+    transmissor: TransmissorARQ = TransmissorARQ(lado_transmissor, config, args.modo, args.janela, args.tamanho_quadro,
+                                                 args.temporizador, CanalBernoulli(args.taxa_erro, args.semente), "simbolos")
+    estatisticas: EstatisticasARQ = transmissor.enviar(dados)
+    thread.join()
+    lado_transmissor.close()
+    lado_receptor.close()
+
+    print(f"{args.modo}, janela {args.janela}: {estatisticas.quadros} quadros em {estatisticas.transmissoes} transmissões "
+          f"({estatisticas.retransmissoes} retransmissões, {estatisticas.estouros} estouros de temporizador, "
+          f"{estatisticas.naks} NAKs)")
+    print(f"Eficiência: {estatisticas.eficiencia:.1%} | goodput: {estatisticas.goodput / 1000:.1f} kbit/s em {estatisticas.segundos:.2f} s")
+    print(f"Recuperação: {'ok' if recebidos[0] == dados else 'falhou'}")
+    return 0 if recebidos[0] == dados else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
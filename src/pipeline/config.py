@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from src.comunicacao import Mensagem
+from src.transmissor import MTU_MAXIMO
+from src.utils import VERIFICACOES_QUADRO
+
+
+@dataclass
+class LinkConfig:
+    """
+    Configuração completa de um enlace: as técnicas de cada camada e os parâmetros da portadora.
+
+    Os nomes das técnicas são os mesmos exibidos nas interfaces gráficas (ex.: "NRZ-Polar", "Insercao de Bytes").
+    """
+    mod_digital: str = "NRZ-Polar"
+    mod_portadora: str = "ASK"
+    enquadramento: str = "Contagem de Caracteres"
+    deteccao_correcao: str = "Nenhum"
+    mtu: int = 4  # Tamanho máximo da carga útil de cada quadro, em bytes (até 64 KB; 255 na contagem de caracteres)
+    sample: int = 100
+    frequencia: float = 1.0
+    amplitude: float = 1.0
+    fase: float = 0.0
+    amp_zero: float = 0.0
+    amp_one: float = 1.0
+    freq_zero: float = 0.0
+    freq_one: float = 1.0
+    frequencias_mfsk: tuple[float, ...] = (1.0, 2.0, 3.0, 4.0)  # Uma frequência por símbolo do M-FSK (M potência de 2)
+    backend: str = "numpy"
+    ebn0_db: float | None = None  # Eb/N0 do canal AWGN entre a modulação e a demodulação (None: sem canal analógico)
+    semente_canal: int | None = None  # Semente do ruído do canal, para resultados reproduzíveis
+
+    @property
+    def niveis_por_simbolo(self) -> int:
+        """
+        Níveis do sinal digital levados por cada símbolo da portadora: 3 no 8-QAM, log2(M) no M-FSK e 1 nas demais.
+        """
+        return {"8-QAM": 3, "M-FSK": len(self.frequencias_mfsk).bit_length() - 1}.get(self.mod_portadora, 1)
+
+    @property
+    def mtu_maximo(self) -> int:
+        """
+        O maior MTU aceito pelo enquadramento: na contagem de caracteres, a carga útil e o trailer da verificação por
+        quadro precisam caber no byte de tamanho; nos demais, o limite é MTU_MAXIMO.
+        """
+        if self.enquadramento == "Contagem de Caracteres":
+            verificacao = VERIFICACOES_QUADRO.get(self.deteccao_correcao)
+            return 255 - (verificacao.tamanho if verificacao is not None else 0)
+        return MTU_MAXIMO
+
+    @property
+    def parametros_portadora(self) -> tuple[float, ...]:
+        """
+        Os parâmetros específicos da modulação por portadora, na ordem em que são enviados ao receptor.
+        """
+        if self.mod_portadora == "ASK":
+            return (self.amp_zero, self.amp_one)
+        if self.mod_portadora == "FSK":
+            return (self.freq_zero, self.freq_one)
+        if self.mod_portadora == "M-FSK":
+            return tuple(self.frequencias_mfsk)
+        return ()
+
+    def para_mensagem(self, wave, dig_signal=None, tipo_amostra: str = "float32", compressao: str = "Nenhuma") -> Mensagem:
+        """
+        Cria a mensagem do protocolo que leva a onda (e, opcionalmente, o sinal digital) com esta configuração.
+        O tipo da amostra e a compressão definem como a onda é enviada (no modo "simbolos", só o sinal digital vai;
+        nos demais, só o número de níveis do sinal digital, que o 8-QAM e o M-FSK precisam na recepção).
+        """
+        return Mensagem(
+            sample=self.sample, amplitude=self.amplitude, frequencia=self.frequencia, fase=self.fase,
+            mod_digital=self.mod_digital, mod_portadora=self.mod_portadora,
+            enquadramento=self.enquadramento, deteccao_correcao=self.deteccao_correcao,
+            sinal=wave, parametros=self.parametros_portadora, dig_signal=dig_signal,
+            tipo_amostra=tipo_amostra, compressao=compressao,
+        )
+
+    @classmethod
+    def de_mensagem(cls, mensagem: Mensagem, **extras) -> "LinkConfig":
+        """
+        Reconstrói, no receptor, a configuração usada pelo transmissor a partir do cabeçalho de uma mensagem.
+        """
+        config: LinkConfig = cls(
+            mod_digital=mensagem.mod_digital, mod_portadora=mensagem.mod_portadora,
+            enquadramento=mensagem.enquadramento, deteccao_correcao=mensagem.deteccao_correcao,
+            sample=mensagem.sample, frequencia=mensagem.frequencia, amplitude=mensagem.amplitude, fase=mensagem.fase,
+            **extras,
+        )
+        if mensagem.mod_portadora == "ASK":
+            config.amp_zero, config.amp_one = mensagem.parametros
+        elif mensagem.mod_portadora == "FSK":
+            config.freq_zero, config.freq_one = mensagem.parametros
+        elif mensagem.mod_portadora == "M-FSK":
+            config.frequencias_mfsk = tuple(mensagem.parametros)
+        return config
@@ -0,0 +1,195 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from src.utils import BitBuffer
+from .config import LinkConfig
+from .pipeline import Pipeline, Recepcao, Transmissao
+
+_pipeline: Pipeline | None = None  # Pipeline de cada processo trabalhador, criado uma vez por processo
+
+
+def _iniciar_trabalhador(config: LinkConfig) -> None:
+    global _pipeline
+    _pipeline = Pipeline(config)
+
+
+def _modular_parte(entrada: str, n_niveis: int, saida: str, n_amostras: int, inicio: int, fim: int, niveis_por_simbolo: int) -> None:
+    """
+    Modula os níveis [inicio, fim) do sinal digital em memória compartilhada, escrevendo as amostras na posição
+    correspondente da onda, também em memória compartilhada.
+    """
+    memoria_entrada = shared_memory.SharedMemory(entrada)
+    memoria_saida = shared_memory.SharedMemory(saida)
+    try:
+        niveis: np.ndarray = np.ndarray((n_niveis,), dtype=np.int8, buffer=memoria_entrada.buf)
+        wave: np.ndarray = np.ndarray((n_amostras,), dtype=np.float64, buffer=memoria_saida.buf)
+        parte = _pipeline.modular(niveis[inicio:fim])
+        deslocamento: int = inicio // niveis_por_simbolo * _pipeline.config.sample
+        wave[deslocamento:deslocamento + len(parte)] = parte
+        del niveis, wave  # As visões precisam ser liberadas antes de fechar a memória compartilhada
+    finally:
+        memoria_entrada.close()
+        memoria_saida.close()
+
+
+def _demodular_parte(entrada: str, n_amostras: int, saida: str, n_niveis: int, inicio: int, fim: int, niveis_por_simbolo: int) -> int:
+    """
+    Demodula os símbolos [inicio, fim) da onda em memória compartilhada, escrevendo os níveis na posição
+    correspondente do sinal digital. Retorna quantos níveis não nulos a parte tem (para a alternância do Bipolar).
+    """
+    config: LinkConfig = _pipeline.config
+    memoria_entrada = shared_memory.SharedMemory(entrada)
+    memoria_saida = shared_memory.SharedMemory(saida)
+    try:
+        wave: np.ndarray = np.ndarray((n_amostras,), dtype=np.float64, buffer=memoria_entrada.buf)
+        niveis: np.ndarray = np.ndarray((n_niveis,), dtype=np.int8, buffer=memoria_saida.buf)
+        parte: np.ndarray = wave[inicio * config.sample:fim * config.sample]
+        # Sem n_niveis: o preenchimento do 8-QAM e do M-FSK está só no início do sinal e é removido no processo principal
+        if config.mod_portadora == "8-QAM":
+            resultado: np.ndarray = _pipeline.fisica_rx.decodificar_qam8(parte, config.mod_digital)
+        elif config.mod_portadora == "M-FSK":
+            resultado = _pipeline.fisica_rx.decodificar_mfsk(parte, config.mod_digital, config.frequencias_mfsk)
+        else:
+            resultado = np.asarray(_pipeline.demodular(parte), dtype=np.int8)
+        niveis[inicio * niveis_por_simbolo:inicio * niveis_por_simbolo + len(resultado)] = resultado
+        del wave, niveis, parte
+        return int(np.count_nonzero(resultado))
+    finally:
+        memoria_entrada.close()
+        memoria_saida.close()
+
+
+class PipelineParalelo:
+    """
+    Pipeline que divide a modulação e a demodulação de sinais grandes entre processos.
+
+    O sinal digital é cortado em fronteiras de símbolo da portadora (grupos de 3 níveis no 8-QAM e de log2(M) no
+    M-FSK, depois do preenchimento à esquerda) e a onda em janelas de `sample` amostras por símbolo; cada parte é
+    independente das outras, então é processada em um ProcessPoolExecutor. As entradas e as saídas ficam em
+    memória compartilhada (multiprocessing.shared_memory): os processos recebem só os nomes e os limites da sua
+    parte e escrevem o resultado diretamente na posição final, então o resultado já sai na ordem, sem serializar os
+    sinais. A alternância do Bipolar, que depende dos bits 1 anteriores, é corrigida depois, no processo principal.
+
+    A camada de enlace (enquadramento, detecção/correção) continua no processo principal: o Bit de Paridade, o
+    CRC-32 e o Código de Hamming cobrem a mensagem inteira, a verificação por quadro já confere todos os quadros
+    de uma vez com o NumPy, e ela custa pouco perto das camadas que geram e analisam as amostras. Sinais menores que `minimo_amostras` são processados sem o pool, para não pagar o custo
+    de distribuir as partes.
+
+    Args:
+        config (LinkConfig): A configuração do enlace.
+        n_processos (int, opcional): Número de processos do pool. Padrão: um por CPU.
+        simbolos_por_parte (int): Número de símbolos da portadora em cada parte.
+        minimo_amostras (int): Tamanho mínimo da onda, em amostras, para usar o pool.
+
+    Exemplo:
+        with PipelineParalelo(LinkConfig(mod_portadora="FSK")) as pipeline:
+            transmissao = pipeline.transmitir(dados)
+            pipeline.receber(transmissao.wave).dados  # dados
+    """
+
+    def __init__(self, config: LinkConfig, n_processos: int | None = None, simbolos_por_parte: int = 1 << 14,
+                 minimo_amostras: int = 1 << 20) -> None:
+        self.config: LinkConfig = config
+        self.pipeline: Pipeline = Pipeline(config)
+        self.simbolos_por_parte: int = simbolos_por_parte
+        self.minimo_amostras: int = minimo_amostras
+        self._executor: ProcessPoolExecutor = ProcessPoolExecutor(n_processos, initializer=_iniciar_trabalhador, initargs=(config,))
+        self.niveis_por_simbolo: int = config.niveis_por_simbolo
+
+    def __enter__(self) -> "PipelineParalelo":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.fechar()
+
+    def fechar(self) -> None:
+        self._executor.shutdown()
+
+    def _partes(self, n_simbolos: int) -> list[tuple[int, int]]:
+        return [(inicio, min(inicio + self.simbolos_por_parte, n_simbolos)) for inicio in range(0, n_simbolos, self.simbolos_por_parte)]
+
+    # TRANSMISSÃO
+    def modular(self, dig_signal: np.ndarray) -> np.ndarray:
+        """
+        Modula o sinal digital, com as mesmas amostras de Pipeline.modular.
+        """
+        niveis: np.ndarray = np.asarray(dig_signal, dtype=np.int8)
+        preenchimento: int = -len(niveis) % self.niveis_por_simbolo  # Zeros à esquerda, como faz o transmissor
+        n_simbolos: int = (len(niveis) + preenchimento) // self.niveis_por_simbolo
+        n_amostras: int = n_simbolos * self.config.sample
+        if n_amostras < self.minimo_amostras:
+            return np.asarray(self.pipeline.modular(niveis), dtype=np.float64)
+
+        entrada = shared_memory.SharedMemory(create=True, size=max(len(niveis) + preenchimento, 1))
+        saida = shared_memory.SharedMemory(create=True, size=n_amostras * 8)
+        try:
+            compartilhados: np.ndarray = np.ndarray((len(niveis) + preenchimento,), dtype=np.int8, buffer=entrada.buf)
+            compartilhados[:preenchimento] = 0
+            compartilhados[preenchimento:] = niveis
+            futuros = [
+                self._executor.submit(_modular_parte, entrada.name, len(compartilhados), saida.name, n_amostras,
+                                      inicio * self.niveis_por_simbolo, fim * self.niveis_por_simbolo, self.niveis_por_simbolo)
+                for inicio, fim in self._partes(n_simbolos)
+            ]
+            for futuro in futuros:
+                futuro.result()
+            wave: np.ndarray = np.ndarray((n_amostras,), dtype=np.float64, buffer=saida.buf).copy()
+            del compartilhados
+            return wave
+        finally:
+            for memoria in (entrada, saida):
+                memoria.close()
+                memoria.unlink()
+
+    def transmitir(self, dados: bytes) -> Transmissao:
+        bit_stream: BitBuffer = self.pipeline.codificar_enlace(dados)
+        dig_signal: np.ndarray = self.pipeline.codificar_linha(bit_stream)
+        return Transmissao(bit_stream, dig_signal, self.pipeline.canal(self.modular(dig_signal)))
+
+    # RECEPÇÃO
+    def demodular(self, wave: list[float] | np.ndarray, n_digital: int | None = None) -> np.ndarray:
+        """
+        Recupera o sinal digital a partir da onda, com os mesmos níveis de Pipeline.demodular.
+        """
+        amostras: np.ndarray = np.asarray(wave, dtype=np.float64)
+        if len(amostras) < self.minimo_amostras:
+            return np.asarray(self.pipeline.demodular(amostras, n_digital), dtype=np.int8)
+        if self.config.mod_portadora in ("8-QAM", "M-FSK") and n_digital is None:
+            raise ValueError(f"O {self.config.mod_portadora} precisa do número de níveis do sinal digital")
+
+        n_simbolos: int = -(-len(amostras) // self.config.sample)  # O último símbolo pode estar incompleto
+        n_niveis: int = n_simbolos * self.niveis_por_simbolo
+        if n_digital is not None and n_digital > n_niveis:
+            raise ValueError(f"Onda com {n_niveis} níveis, menos que os {n_digital} anunciados")
+        entrada = shared_memory.SharedMemory(create=True, size=max(amostras.nbytes, 1))
+        saida = shared_memory.SharedMemory(create=True, size=max(n_niveis, 1))
+        try:
+            compartilhadas: np.ndarray = np.ndarray(amostras.shape, dtype=np.float64, buffer=entrada.buf)
+            compartilhadas[:] = amostras
+            partes: list[tuple[int, int]] = self._partes(n_simbolos)
+            futuros = [
+                self._executor.submit(_demodular_parte, entrada.name, len(amostras), saida.name, n_niveis, inicio, fim, self.niveis_por_simbolo)
+                for inicio, fim in partes
+            ]
+            uns: list[int] = [futuro.result() for futuro in futuros]
+            niveis: np.ndarray = np.ndarray((n_niveis,), dtype=np.int8, buffer=saida.buf).copy()
+            del compartilhadas
+        finally:
+            for memoria in (entrada, saida):
+                memoria.close()
+                memoria.unlink()
+
+        if self.config.mod_digital == "Bipolar":
+            # Cada parte foi demodulada começando em +1: inverte as que vêm depois de um número ímpar de bits 1
+            anteriores: np.ndarray = np.cumsum([0] + uns[:-1])
+            for (inicio, fim), total in zip(partes, anteriores):
+                if total % 2:
+                    niveis[inicio * self.niveis_por_simbolo:fim * self.niveis_por_simbolo] *= -1
+        if n_digital is not None and self.config.mod_portadora in ("8-QAM", "M-FSK"):
+            niveis = niveis[len(niveis) - n_digital:]  # Remove o preenchimento à esquerda
+        return niveis
+
+    def receber(self, wave: list[float] | np.ndarray, n_digital: int | None = None) -> Recepcao:
+        dig_signal: np.ndarray = self.demodular(wave, n_digital)
+        byte_stream, integro = self.pipeline.verificar(self.pipeline.decodificar_linha(dig_signal))
+        return self.pipeline.entregar(byte_stream, dig_signal, integro)
@@ -0,0 +1,264 @@
+from dataclasses import dataclass, field
+import numpy as np
+from src.canal import CanalAnalogico
+from src.transmissor import CamadaEnlaceTransmissor, CamadaFisicaTransmissor
+from src.receptor import CamadaEnlaceReceptor, CamadaFisicaReceptor
+from src.comunicacao import Mensagem
+from src.receptor import DesenquadradorContagem, DesenquadradorInsercao, DesenquadradorVarint
+from src.utils import BitBuffer, CODIGOS_HAMMING, VERIFICACOES_QUADRO
+from .config import LinkConfig
+
+
+@dataclass
+class Transmissao:
+    """
+    Resultado de cada etapa da transmissão de uma mensagem.
+    """
+    bit_stream: BitBuffer
+    dig_signal: np.ndarray
+    wave: list[float] | np.ndarray
+
+
+@dataclass
+class Recepcao:
+    """
+    Resultado da recepção de uma onda: os dados desenquadrados e se a verificação de erros passou.
+
+    Com verificação por quadro, os quadros danificados são descartados de `dados` e os seus índices (na ordem de
+    chegada) ficam em `quadros_descartados`.
+    """
+    dados: bytes
+    dig_signal: list[int] | np.ndarray
+    integro: bool
+    quadros_descartados: list[int] = field(default_factory=list)
+
+
+class Pipeline:
+    """
+    Cadeia completa de transmissão e recepção, sem depender da interface gráfica.
+
+    Compõe as classes CamadaEnlace* e CamadaFisica* na ordem usada pelas interfaces:
+        transmissão: enquadramento -> detecção/correção de erros -> modulação digital -> modulação por portadora;
+        recepção: demodulação por portadora -> decodificação digital -> verificação/correção de erros -> desenquadramento.
+
+    Cada etapa também é exposta separadamente, para que erros possam ser inseridos entre elas. Com verificação por
+    quadro ("Paridade por Quadro", "CRC-32 por Quadro"), o trailer de cada quadro é anexado no enquadramento e
+    conferido depois do desenquadramento, quadro a quadro, no lugar da verificação da mensagem inteira.
+
+    Exemplo:
+        pipeline = Pipeline(LinkConfig(mod_digital="Manchester", mod_portadora="FSK"))
+        transmissao = pipeline.transmitir(b"Ola")
+        pipeline.receber(transmissao.wave).dados  # b"Ola"
+    """
+
+    def __init__(self, config: LinkConfig) -> None:
+        self.config: LinkConfig = config
+        self.enlace_tx: CamadaEnlaceTransmissor = CamadaEnlaceTransmissor()
+        self.fisica_tx: CamadaFisicaTransmissor = CamadaFisicaTransmissor(config.sample, config.frequencia, config.amplitude, config.fase, backend=config.backend)
+        self.enlace_rx: CamadaEnlaceReceptor = CamadaEnlaceReceptor()
+        self.fisica_rx: CamadaFisicaReceptor = CamadaFisicaReceptor(config.sample, config.amplitude, config.frequencia, config.fase)
+        self.canal_analogico: CanalAnalogico | None = None
+        if config.ebn0_db is not None:
+            # Bits por símbolo da portadora, para a Eb/N0: no Manchester cada bit ocupa dois níveis
+            bits_por_simbolo: float = config.niveis_por_simbolo / (2 if config.mod_digital == "Manchester" else 1)
+            self.canal_analogico = CanalAnalogico(ebn0_db=config.ebn0_db, sample=config.sample,
+                                                  bits_por_simbolo=bits_por_simbolo, semente=config.semente_canal)
+
+    # TRANSMISSÃO
+    @property
+    def verificacao_por_quadro(self) -> bool:
+        return self.config.deteccao_correcao in VERIFICACOES_QUADRO
+
+    def enquadrar(self, dados: bytes) -> bytes:
+        verificacao: str | None = self.config.deteccao_correcao if self.verificacao_por_quadro else None
+        if self.config.enquadramento == "Contagem de Caracteres":
+            return self.enlace_tx.contagem_de_caracteres(dados, self.config.mtu, verificacao)
+        if self.config.enquadramento == "Contagem Varint":
+            return self.enlace_tx.contagem_varint(dados, self.config.mtu, verificacao)
+        if self.config.enquadramento == "Insercao de Bytes":
+            return self.enlace_tx.insercao_de_bytes(dados, self.config.mtu, verificacao)
+        if verificacao is not None:
+            return VERIFICACOES_QUADRO[verificacao].anexar([dados])[0]  # Sem enquadramento, a mensagem é um único quadro
+        return dados
+
+    def proteger(self, byte_stream: bytes) -> BitBuffer:
+        """
+        Aplica a detecção/correção de erros selecionada, retornando a sequência de bits a transmitir.
+        """
+        if self.config.deteccao_correcao == "Bit de Paridade":
+            return self.enlace_tx.bit_de_paridade(byte_stream)
+        if self.config.deteccao_correcao == "CRC-32":
+            return self.enlace_tx.crc32(byte_stream)
+        if self.config.deteccao_correcao == "Codigo de Hamming":
+            return self.enlace_tx.hamming(byte_stream)
+        if self.config.deteccao_correcao in CODIGOS_HAMMING:
+            return self.enlace_tx.hamming_em_blocos(byte_stream, self.config.deteccao_correcao)
+        return BitBuffer(byte_stream)
+
+    def codificar_enlace(self, dados: bytes) -> BitBuffer:
+        """
+        Executa toda a camada de enlace do transmissor, retornando o trem de bits entregue à camada física.
+        """
+        return self.fisica_tx.gerador_bit_stream(self.proteger(self.enquadrar(dados)))
+
+    def codificar_linha(self, bit_stream: BitBuffer) -> np.ndarray:
+        if self.config.mod_digital == "NRZ-Polar":
+            return self.fisica_tx.nrz_polar(bit_stream)
+        if self.config.mod_digital == "Manchester":
+            return self.fisica_tx.manchester(bit_stream)
+        if self.config.mod_digital == "Bipolar":
+            return self.fisica_tx.bipolar(bit_stream)
+        raise ValueError(f"Modulação digital desconhecida: {self.config.mod_digital}")
+
+    def modular(self, dig_signal: np.ndarray) -> list[float] | np.ndarray:
+        if self.config.mod_portadora == "ASK":
+            return self.fisica_tx.ask(dig_signal, self.config.mod_digital, self.config.amp_zero, self.config.amp_one)
+        if self.config.mod_portadora == "FSK":
+            return self.fisica_tx.fsk(dig_signal, self.config.mod_digital, self.config.freq_zero, self.config.freq_one)
+        if self.config.mod_portadora == "M-FSK":
+            return self.fisica_tx.mfsk(dig_signal, self.config.mod_digital, self.config.frequencias_mfsk)
+        if self.config.mod_portadora == "8-QAM":
+            return self.fisica_tx.qam8_modulation(list(dig_signal), self.config.mod_digital)  # Cópia: o backend em Python puro altera a lista
+        raise ValueError(f"Modulação por portadora desconhecida: {self.config.mod_portadora}")
+
+    def canal(self, wave: list[float] | np.ndarray) -> list[float] | np.ndarray:
+        """
+        Passa a onda modulada pelo canal analógico (ruído gaussiano com a Eb/N0 da configuração). Sem ebn0_db, a
+        onda passa sem alteração.
+        """
+        if self.canal_analogico is None:
+            return wave
+        return self.canal_analogico.aplicar(wave)
+
+    def transmitir(self, dados: bytes) -> Transmissao:
+        """
+        Executa toda a cadeia de transmissão. Com um canal analógico configurado, a onda da Transmissao é a que sai do
+        canal, ou seja, a que chega ao receptor.
+        """
+        bit_stream: BitBuffer = self.codificar_enlace(dados)
+        dig_signal: np.ndarray = self.codificar_linha(bit_stream)
+        return Transmissao(bit_stream, dig_signal, self.canal(self.modular(dig_signal)))
+
+    # RECEPÇÃO
+    def demodular(self, wave: list[float] | np.ndarray, n_digital: int | None = None) -> list[int] | np.ndarray:
+        """
+        Recupera o sinal digital a partir da onda. No 8-QAM e no M-FSK, `n_digital` é o número de níveis do sinal
+        digital transmitido (o n_digital do cabeçalho da mensagem), já que o transmissor completa o sinal com zeros
+        até fechar o último símbolo.
+        """
+        if self.config.mod_portadora == "ASK":
+            return self.fisica_rx.decodificar_ask(wave, self.config.mod_digital, self.config.amp_zero, self.config.amp_one)
+        if self.config.mod_portadora == "FSK":
+            return self.fisica_rx.decodificar_fsk(wave, self.config.mod_digital, self.config.freq_zero, self.config.freq_one)
+        if self.config.mod_portadora in ("8-QAM", "M-FSK") and n_digital is None:
+            raise ValueError(f"O {self.config.mod_portadora} precisa do número de níveis do sinal digital")
+        if self.config.mod_portadora == "8-QAM":
+            return self.fisica_rx.decodificar_qam8(wave, self.config.mod_digital, n_digital)
+        if self.config.mod_portadora == "M-FSK":
+            return self.fisica_rx.decodificar_mfsk(wave, self.config.mod_digital, self.config.frequencias_mfsk, n_digital)
+        raise ValueError(f"Modulação por portadora desconhecida: {self.config.mod_portadora}")
+
+    def decodificar_linha(self, dig_signal: list[int] | np.ndarray) -> BitBuffer:
+        if self.config.mod_digital == "NRZ-Polar":
+            return self.fisica_rx.decodificar_nrz_polar(dig_signal)
+        if self.config.mod_digital == "Manchester":
+            return self.fisica_rx.decodificar_manchester(dig_signal)
+        if self.config.mod_digital == "Bipolar":
+            return self.fisica_rx.decodificar_bipolar(dig_signal)
+        raise ValueError(f"Modulação digital desconhecida: {self.config.mod_digital}")
+
+    def verificar(self, bit_stream: BitBuffer) -> tuple[bytes, bool]:
+        """
+        Aplica a verificação/correção de erros selecionada, retornando os bytes e se nenhum erro foi detectado.
+        Sem técnica selecionada, os dados são considerados íntegros.
+        """
+        if self.config.deteccao_correcao == "Codigo de Hamming":
+            byte_stream, erro_detectado = self.enlace_rx.corrigir_hamming(bit_stream)
+            return byte_stream, not erro_detectado
+        if self.config.deteccao_correcao == "Bit de Paridade":
+            return self.enlace_rx.verificar_bits_de_paridade(bit_stream)
+        if self.config.deteccao_correcao == "CRC-32":
+            return self.enlace_rx.verificar_crc32(bit_stream)
+        if self.config.deteccao_correcao in CODIGOS_HAMMING:
+            return self.enlace_rx.corrigir_hamming_em_blocos(bit_stream, self.config.deteccao_correcao)
+        return bit_stream.to_bytes(), True
+
+    def criar_desenquadrador(self) -> DesenquadradorContagem | DesenquadradorVarint | DesenquadradorInsercao | None:
+        """
+        Um desenquadrador incremental novo para o enquadramento configurado (None sem enquadramento).
+        """
+        if self.config.enquadramento == "Contagem de Caracteres":
+            return DesenquadradorContagem()
+        if self.config.enquadramento == "Contagem Varint":
+            return DesenquadradorVarint()
+        if self.config.enquadramento == "Insercao de Bytes":
+            return DesenquadradorInsercao(self.enlace_rx.FLAG, self.enlace_rx.ESC)
+        return None
+
+    def separar_quadros(self, byte_stream: bytes) -> list[bytes]:
+        """
+        Desenquadra o fluxo mantendo os quadros separados. Sem enquadramento, o fluxo inteiro é um único quadro.
+        """
+        desenquadrador = self.criar_desenquadrador()
+        if desenquadrador is None:
+            return [byte_stream] if byte_stream else []
+        return desenquadrador.alimentar(byte_stream) + desenquadrador.finalizar()
+
+    def verificar_quadros(self, quadros: list[bytes]) -> tuple[list[bytes], list[int]]:
+        """
+        Aplica a verificação por quadro selecionada a quadros já desenquadrados. Cada quadro é conferido sozinho, então
+        os quadros podem ser verificados à medida que saem do desenquadrador.
+
+        Returns:
+            tuple[list[bytes], list[int]]: As cargas úteis dos quadros íntegros e os índices (em `quadros`) dos
+            danificados. Sem verificação por quadro, os quadros passam sem alteração.
+        """
+        if not self.verificacao_por_quadro:
+            return list(quadros), []
+        cargas, integros = self.enlace_rx.verificar_quadros(quadros, self.config.deteccao_correcao)
+        return ([carga for carga, integro in zip(cargas, integros) if integro],
+                [indice for indice, integro in enumerate(integros) if not integro])
+
+    def desenquadrar(self, byte_stream: bytes) -> bytes:
+        if self.verificacao_por_quadro:
+            return b"".join(self.verificar_quadros(self.separar_quadros(byte_stream))[0])
+        if self.config.enquadramento == "Contagem de Caracteres":
+            return self.enlace_rx.desenquadramento_contagem_de_caracteres(byte_stream)
+        if self.config.enquadramento == "Contagem Varint":
+            return self.enlace_rx.desenquadramento_contagem_varint(byte_stream)
+        if self.config.enquadramento == "Insercao de Bytes":
+            return self.enlace_rx.desenquadramento_insercao_de_bytes(byte_stream)
+        return byte_stream
+
+    def entregar(self, byte_stream: bytes, dig_signal: list[int] | np.ndarray, integro: bool) -> Recepcao:
+        """
+        Desenquadra os bytes já verificados e monta a recepção. Com verificação por quadro, só os quadros íntegros
+        são entregues e a recepção é íntegra se nenhum quadro foi descartado.
+        """
+        if not self.verificacao_por_quadro:
+            return Recepcao(self.desenquadrar(byte_stream), dig_signal, integro)
+        cargas, descartados = self.verificar_quadros(self.separar_quadros(byte_stream))
+        return Recepcao(b"".join(cargas), dig_signal, integro and not descartados, descartados)
+
+    def receber(self, wave: list[float] | np.ndarray, n_digital: int | None = None) -> Recepcao:
+        dig_signal: list[int] | np.ndarray = self.demodular(wave, n_digital)
+        byte_stream, integro = self.verificar(self.decodificar_linha(dig_signal))
+        return self.entregar(byte_stream, dig_signal, integro)
+
+    def receber_mensagem(self, mensagem: Mensagem) -> Recepcao:
+        """
+        Recebe uma mensagem do protocolo. No modo "simbolos" a onda não é enviada: os níveis do sinal digital já são
+        os símbolos do transmissor e vão direto para a decodificação digital, sem demodulação.
+        """
+        if mensagem.tipo_amostra != "simbolos":
+            return self.receber(mensagem.sinal, mensagem.n_digital or None)
+        byte_stream, integro = self.verificar(self.decodificar_linha(mensagem.dig_signal))
+        return self.entregar(byte_stream, mensagem.dig_signal, integro)
+
+    def sintetizar(self, mensagem: Mensagem) -> np.ndarray:
+        """
+        A onda de uma mensagem: a recebida ou, no modo "simbolos", a sintetizada de novo a partir do sinal digital.
+        """
+        if mensagem.tipo_amostra != "simbolos":
+            return np.asarray(mensagem.sinal)
+        return np.asarray(self.modular(mensagem.dig_signal))
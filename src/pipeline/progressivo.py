@@ -0,0 +1,233 @@
+import socket
+from typing import Callable
+import numpy as np
+from src.comunicacao import Mensagem, MensagemEmPartes, receber_em_partes
+from src.utils import BitBuffer, CODIGOS_HAMMING
+from .config import LinkConfig
+from .pipeline import Pipeline, Recepcao
+
+
+class DecodificadorProgressivo:
+    """
+    Recepção incremental: decodifica a onda à medida que as amostras chegam, em vez de esperar a mensagem inteira.
+
+    Cada pedaço passa por toda a cadeia de recepção do Pipeline assim que completa símbolos inteiros:
+        demodulação por portadora -> decodificação digital -> verificação/correção -> desenquadramento.
+    O que não completa uma unidade de alguma etapa (um símbolo, o par de níveis do Manchester, um byte, uma palavra
+    do código de Hamming) fica guardado para o próximo pedaço, então o trabalho feito por pedaço é proporcional ao
+    pedaço e o tempo até o primeiro quadro não depende do tamanho da mensagem.
+
+    A verificação define até onde a decodificação é progressiva:
+        - sem técnica, ou com os códigos de Hamming em blocos, cada bloco é verificado sozinho e os quadros são
+          entregues assim que chegam (a última palavra, que tem o preenchimento, espera o fim da mensagem);
+        - com verificação por quadro, cada quadro é conferido assim que sai do desenquadrador e só os danificados
+          são descartados (sem enquadramento, a mensagem é um único quadro e espera o fim);
+        - Bit de Paridade, CRC-32 e o Código de Hamming da mensagem inteira só podem ser verificados com a mensagem
+          completa, então os quadros são entregues em finalizar().
+
+    Args:
+        pipeline (Pipeline): O pipeline com a configuração do enlace.
+        n_digital (int, opcional): O número de níveis do sinal digital transmitido (obrigatório no 8-QAM e no M-FSK,
+            para remover o preenchimento que o transmissor coloca no início do sinal).
+
+    Exemplo:
+        decodificador = DecodificadorProgressivo(Pipeline(config))
+        for pedaco in pedacos:
+            quadros = decodificador.alimentar(pedaco)
+        quadros = decodificador.finalizar()
+        decodificador.resultado().dados
+    """
+
+    def __init__(self, pipeline: Pipeline, n_digital: int | None = None) -> None:
+        config: LinkConfig = pipeline.config
+        if config.mod_portadora in ("8-QAM", "M-FSK") and n_digital is None:
+            raise ValueError(f"O {config.mod_portadora} precisa do número de níveis do sinal digital")
+        self.pipeline: Pipeline = pipeline
+        self.sample: int = config.sample
+
+        # Preenchimento à esquerda feito pelo transmissor para completar o último símbolo da portadora
+        self._preenchimento: int = -n_digital % config.niveis_por_simbolo if n_digital is not None else 0
+        self._niveis_por_bit: int = 2 if config.mod_digital == "Manchester" else 1
+
+        self._codigo = CODIGOS_HAMMING.get(config.deteccao_correcao)
+        self._desenquadrador = pipeline.criar_desenquadrador()
+        self._progressivo: bool = (config.deteccao_correcao == "Nenhum" or self._codigo is not None
+                                   or (pipeline.verificacao_por_quadro and self._desenquadrador is not None))
+
+        # Restos de cada etapa, à espera de completar a sua unidade
+        self._amostras: np.ndarray = np.zeros(0)
+        self._niveis: np.ndarray = np.zeros(0, dtype=np.int8)
+        self._bits: np.ndarray = np.zeros(0, dtype=np.uint8)  # Bits do trem recebido (palavras, se houver código)
+        self._trem: list[np.ndarray] = []  # Partes do trem inteiro, quando a verificação precisa da mensagem completa
+        self._dados: np.ndarray = np.zeros(0, dtype=np.uint8)  # Bits de dados já verificados, ainda sem formar um byte
+        self._uns: int = 0  # Bits 1 já recebidos no Bipolar, para continuar a alternância entre os pedaços
+
+        self._sinal_digital: list[np.ndarray] = []
+        self._quadros: list[bytes] = []
+        self._recebidos: int = 0  # Quadros que já saíram do desenquadrador, íntegros ou não
+        self._descartados: list[int] = []  # Índices dos quadros descartados pela verificação por quadro
+        self._integro: bool = True
+        self._recepcao: Recepcao | None = None
+
+    def alimentar(self, amostras: np.ndarray) -> list[bytes]:
+        """
+        Acrescenta as próximas amostras da onda recebida.
+
+        Returns:
+            list[bytes]: Os quadros (cargas úteis) completados por estas amostras.
+        """
+        if len(self._amostras):
+            amostras = np.concatenate([self._amostras, amostras])
+        completas: int = len(amostras) - len(amostras) % self.sample
+        self._amostras = np.array(amostras[completas:], dtype=np.float64)  # Cópia: o resto pode ser uma visão do buffer
+        if completas == 0:
+            return []
+        return self._processar(self._demodular(amostras[:completas]), final=False)
+
+    def alimentar_niveis(self, niveis: np.ndarray) -> list[bytes]:
+        """
+        Acrescenta níveis do sinal digital já decididos (o modo "simbolos" do protocolo), pulando a demodulação.
+
+        Returns:
+            list[bytes]: Os quadros (cargas úteis) completados por estes níveis.
+        """
+        niveis = np.asarray(niveis, dtype=np.int8)
+        self._sinal_digital.append(niveis)
+        return self._processar(niveis, final=False)
+
+    def finalizar(self) -> list[bytes]:
+        """
+        Encerra a mensagem: processa o resto das amostras e a última palavra, e faz as verificações que dependem da
+        mensagem inteira.
+
+        Returns:
+            list[bytes]: Os quadros entregues só agora.
+        """
+        niveis: np.ndarray = self._demodular(self._amostras) if len(self._amostras) else np.zeros(0, dtype=np.int8)
+        self._amostras = np.zeros(0)
+        quadros: list[bytes] = self._processar(niveis, final=True)
+        dig_signal: np.ndarray = np.concatenate(self._sinal_digital) if self._sinal_digital else np.zeros(0, dtype=np.int8)
+        self._recepcao = Recepcao(b"".join(self._quadros), dig_signal, self._integro, self._descartados)
+        return quadros
+
+    def resultado(self) -> Recepcao:
+        """
+        A recepção completa, igual à de Pipeline.receber. Disponível depois de finalizar().
+        """
+        if self._recepcao is None:
+            raise RuntimeError("A mensagem ainda não foi finalizada")
+        return self._recepcao
+
+    def _demodular(self, amostras: np.ndarray) -> np.ndarray:
+        """
+        Demodula símbolos inteiros, removendo o preenchimento do início do sinal e mantendo a alternância do Bipolar.
+        """
+        config: LinkConfig = self.pipeline.config
+        # Sem n_niveis: o preenchimento está só no início da mensagem e é removido abaixo
+        if config.mod_portadora == "8-QAM":
+            niveis: np.ndarray = self.pipeline.fisica_rx.decodificar_qam8(amostras, config.mod_digital)
+        elif config.mod_portadora == "M-FSK":
+            niveis = self.pipeline.fisica_rx.decodificar_mfsk(amostras, config.mod_digital, config.frequencias_mfsk)
+        else:
+            niveis = np.asarray(self.pipeline.demodular(amostras), dtype=np.int8)
+        if self._preenchimento:
+            descartados: int = min(self._preenchimento, len(niveis))
+            niveis = niveis[descartados:]
+            self._preenchimento -= descartados
+        if config.mod_digital == "Bipolar":
+            # Cada pedaço é demodulado começando em +1; inverte se o último bit 1 do pedaço anterior foi +1
+            if self._uns % 2:
+                niveis = -niveis
+            self._uns += int(np.count_nonzero(niveis))
+        self._sinal_digital.append(niveis)
+        return niveis
+
+    def _processar(self, niveis: np.ndarray, final: bool) -> list[bytes]:
+        """
+        Leva os novos níveis pela decodificação digital, pela verificação e pelo desenquadramento.
+        """
+        # Decodificação digital: só pares completos no Manchester
+        niveis = np.concatenate([self._niveis, niveis])
+        usados: int = len(niveis) - len(niveis) % self._niveis_por_bit
+        self._niveis = niveis[usados:]
+        bits: np.ndarray = self.pipeline.decodificar_linha(niveis[:usados]).unpack()
+
+        # Verificação/correção
+        if not self._progressivo:
+            # As partes são concatenadas uma única vez, no fim: acumular a cada parte custaria O(n²)
+            self._trem.append(bits)
+            if not final:
+                return []
+            byte_stream, self._integro = self.pipeline.verificar(BitBuffer.pack(np.concatenate(self._trem)))
+            self._trem = []
+            return self._desenquadrar(byte_stream, final)
+        self._bits = np.concatenate([self._bits, bits])  # O resto guardado é menor que uma palavra
+        if self._codigo is None:
+            self._dados = np.concatenate([self._dados, self._bits])
+            self._bits = self._bits[:0]
+        else:
+            # Decodifica as palavras completas, menos a última enquanto a mensagem não termina (ela tem o preenchimento)
+            palavras: int = len(self._bits) // self._codigo.n if final else max(len(self._bits) // self._codigo.n - 1, 0)
+            if palavras or final:
+                dados, _, nao_corrigiveis = self._codigo.decodificar(BitBuffer.pack(self._bits[:palavras * self._codigo.n]), final)
+                self._integro &= nao_corrigiveis == 0
+                self._dados = np.concatenate([self._dados, dados.unpack()])
+                self._bits = self._bits[palavras * self._codigo.n:]
+
+        # Só bytes completos seguem para o desenquadramento (no fim, o último byte é completado com zeros)
+        completos: int = len(self._dados) if final else len(self._dados) - len(self._dados) % 8
+        byte_stream = BitBuffer.pack(self._dados[:completos]).to_bytes()
+        self._dados = self._dados[completos:]
+        return self._desenquadrar(byte_stream, final)
+
+    def _desenquadrar(self, byte_stream: bytes, final: bool) -> list[bytes]:
+        if self._desenquadrador is None:
+            quadros: list[bytes] = [byte_stream] if byte_stream else []  # Sem enquadramento, cada trecho é entregue como chegou
+        else:
+            quadros = self._desenquadrador.alimentar(byte_stream)
+            if final:
+                quadros += self._desenquadrador.finalizar()
+        if self.pipeline.verificacao_por_quadro:
+            # Cada quadro é conferido pelo seu trailer assim que sai do desenquadrador; só os danificados são descartados
+            recebidos: int = len(quadros)
+            quadros, descartados = self.pipeline.verificar_quadros(quadros)
+            self._descartados += [self._recebidos + indice for indice in descartados]
+            self._recebidos += recebidos
+            self._integro &= not descartados
+        self._quadros += quadros
+        return quadros
+
+
+def receber_progressivo(conn: socket.socket, ao_receber_quadro: Callable[[bytes], None] | None = None,
+                        tamanho_parte: int = 1 << 16) -> tuple[Mensagem, Recepcao] | None:
+    """
+    Recebe a próxima mensagem do socket decodificando-a enquanto chega: cada quadro é passado a `ao_receber_quadro`
+    assim que é desenquadrado, antes de o restante da onda ser lido.
+
+    Args:
+        conn (socket.socket): O socket conectado ao transmissor.
+        ao_receber_quadro (Callable[[bytes], None], opcional): Chamada com a carga útil de cada quadro.
+        tamanho_parte (int): Número máximo de bytes lidos do socket por vez.
+
+    Returns:
+        tuple[Mensagem, Recepcao] | None: A mensagem completa e a sua recepção, ou None se a conexão foi encerrada
+        antes de uma nova mensagem.
+    """
+    partes: MensagemEmPartes | None = receber_em_partes(conn)
+    if partes is None:
+        return None
+    config: LinkConfig = LinkConfig.de_mensagem(partes.mensagem)
+    decodificador: DecodificadorProgressivo = DecodificadorProgressivo(Pipeline(config), partes.n_digital or None)
+    for amostras in partes.amostras(tamanho_parte):
+        for quadro in decodificador.alimentar(amostras):
+            if ao_receber_quadro is not None:
+                ao_receber_quadro(quadro)
+    if partes.mensagem.tipo_amostra == "simbolos":
+        # Sem onda: os níveis chegam prontos no fim da mensagem
+        for quadro in decodificador.alimentar_niveis(partes.mensagem.dig_signal):
+            if ao_receber_quadro is not None:
+                ao_receber_quadro(quadro)
+    for quadro in decodificador.finalizar():
+        if ao_receber_quadro is not None:
+            ao_receber_quadro(quadro)
+    return partes.mensagem, decodificador.resultado()
@@ -0,0 +1,81 @@
+"""
+Reprodução de capturas: decodifica de novo as ondas gravadas por GravadorCaptura, opcionalmente com outra
+configuração no receptor.
+
+As amostras de cada registro são lidas do arquivo mapeado em memória e entregues ao DecodificadorProgressivo (e,
+por ele, à CamadaFisicaReceptor) em partes de tamanho fixo, então a memória usada depende do tamanho da parte, e
+não do tamanho da captura.
+
+Exemplos:
+    python -m src.pipeline.reproducao trafego.tr1cap
+    python -m src.pipeline.reproducao trafego.tr1cap --amp-zero 0.1 --amp-one 0.9 --tamanho-parte 65536
+"""
+
+import argparse
+from dataclasses import replace
+from typing import Callable, Iterator
+from src.comunicacao import LeitorCaptura, Mensagem
+from .config import LinkConfig
+from .pipeline import Pipeline, Recepcao
+from .progressivo import DecodificadorProgressivo
+
+
+def reproduzir(caminho: str, tamanho_parte: int = 1 << 20, ao_receber_quadro: Callable[[bytes], None] | None = None,
+               **alteracoes) -> Iterator[tuple[Mensagem, Recepcao]]:
+    """
+    Decodifica cada mensagem de uma captura, em ordem.
+
+    Args:
+        caminho (str): O arquivo de captura.
+        tamanho_parte (int): Número de amostras entregues por vez ao decodificador.
+        ao_receber_quadro (Callable[[bytes], None], opcional): Chamada com a carga útil de cada quadro, assim que ele
+            é desenquadrado.
+        **alteracoes: Campos do LinkConfig que substituem os gravados (ex.: amp_zero=0.1), para decodificar com outra
+            configuração no receptor.
+
+    Returns:
+        Iterator[tuple[Mensagem, Recepcao]]: Cada mensagem gravada (com a onda ainda no arquivo mapeado) e a sua recepção.
+    """
+    captura: LeitorCaptura = LeitorCaptura(caminho)
+    for mensagem in captura:
+        config: LinkConfig = replace(LinkConfig.de_mensagem(mensagem), **alteracoes)
+        decodificador: DecodificadorProgressivo = DecodificadorProgressivo(Pipeline(config), mensagem.n_digital or None)
+        for inicio in range(0, len(mensagem.sinal) + 1, tamanho_parte):
+            # Só esta parte do arquivo é lida do disco, e é liberada em seguida; a última iteração encerra a mensagem
+            fim: bool = inicio + tamanho_parte > len(mensagem.sinal)
+            parte = mensagem.sinal[inicio:inicio + tamanho_parte]
+            quadros: list[bytes] = decodificador.alimentar(parte)
+            captura.liberar(parte)
+            if fim:
+                quadros += decodificador.finalizar()
+            if ao_receber_quadro is not None:
+                for quadro in quadros:
+                    ao_receber_quadro(quadro)
+        yield mensagem, decodificador.resultado()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.pipeline.reproducao", description="Decodifica de novo as ondas de uma captura.")
+    parser.add_argument("captura", help="Arquivo gravado por GravadorCaptura")
+    parser.add_argument("--tamanho-parte", type=int, default=1 << 20, help="Amostras entregues por vez ao receptor")
+    # Configuração alternativa do receptor (omitida: vale a gravada)
+    for campo in ("amplitude", "frequencia", "fase", "amp_zero", "amp_one", "freq_zero", "freq_one"):
+        parser.add_argument(f"--{campo.replace('_', '-')}", type=float, help=f"Substitui o {campo} gravado")
+    args = parser.parse_args(argv)
+    alteracoes: dict = {campo: valor for campo, valor in vars(args).items()
+                        if valor is not None and campo not in ("captura", "tamanho_parte")}
+
+    integras: int = 0
+    total: int = 0
+    for indice, (mensagem, recepcao) in enumerate(reproduzir(args.captura, args.tamanho_parte, **alteracoes)):
+        total += 1
+        integras += recepcao.integro
+        dados: str = repr(recepcao.dados[:40]) + ("..." if len(recepcao.dados) > 40 else "")
+        print(f"#{indice} seq {mensagem.sequencia} {mensagem.mod_digital}/{mensagem.mod_portadora} "
+              f"{len(mensagem.sinal)} amostras: {len(recepcao.dados)} B {'ok' if recepcao.integro else 'erro detectado'} {dados}")
+    print(f"{total} mensagens, {integras} íntegras")
+    return 0 if integras == total else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
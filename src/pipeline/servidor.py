@@ -0,0 +1,74 @@
+from typing import Callable
+import numpy as np
+from src.comunicacao import Mensagem, MensagemEmPartes, ServidorReceptor, EstatisticasConexao
+from .config import LinkConfig
+from .pipeline import Pipeline, Recepcao
+from .progressivo import DecodificadorProgressivo
+
+
+class ServidorProgressivo(ServidorReceptor):
+    """
+    Servidor do receptor que decodifica cada mensagem enquanto ela chega: as amostras de cada parte lida do socket
+    vão para um DecodificadorProgressivo, na trabalhadora da conexão, e cada quadro é entregue a `ao_receber_quadro`
+    assim que é desenquadrado, antes do fim da onda. Com a mensagem completa, `ao_receber` recebe também a recepção,
+    sem que a onda seja decodificada de novo.
+
+    O restante (conexões simultâneas, fila limitada com contrapressão, estatísticas) é o do ServidorReceptor.
+
+    Args:
+        ao_receber (Callable[[Mensagem, Recepcao, EstatisticasConexao], None]): Função chamada para cada mensagem
+            completa, com a sua recepção.
+        ao_receber_quadro (Callable[[bytes, EstatisticasConexao], None], opcional): Função chamada com a carga útil
+            de cada quadro, assim que ele é desenquadrado.
+        **opcoes: Os demais argumentos do ServidorReceptor (host, port, tamanho_fila, ...).
+
+    Exemplo:
+        servidor = ServidorProgressivo(lambda mensagem, recepcao, estatisticas: print(recepcao.dados), port=65432)
+        servidor.iniciar()
+    """
+
+    entregar_partes: bool = True
+
+    def __init__(self, ao_receber: Callable[[Mensagem, Recepcao, EstatisticasConexao], None],
+                 ao_receber_quadro: Callable[[bytes, EstatisticasConexao], None] | None = None, **opcoes) -> None:
+        super().__init__(ao_receber, **opcoes)
+        self.ao_receber_quadro: Callable[[bytes, EstatisticasConexao], None] | None = ao_receber_quadro
+
+    def _decodificador(self, conexao, partes: MensagemEmPartes) -> DecodificadorProgressivo | None:
+        """
+        O decodificador da mensagem atual da conexão, criado na sua primeira parte. None se a mensagem já falhou.
+        """
+        if conexao.contexto is None or conexao.contexto[0] is not partes:
+            conexao.contexto = (partes, None)  # Se a criação falhar, as outras partes da mensagem são ignoradas
+            pipeline: Pipeline = Pipeline(LinkConfig.de_mensagem(partes.mensagem))
+            conexao.contexto = (partes, DecodificadorProgressivo(pipeline, partes.n_digital or None))
+        return conexao.contexto[1]
+
+    def _entregar(self, quadros: list[bytes], conexao) -> None:
+        if self.ao_receber_quadro is not None:
+            for quadro in quadros:
+                self.ao_receber_quadro(quadro, conexao.estatisticas)
+
+    def _receber_parte(self, conexao, partes: MensagemEmPartes, amostras: np.ndarray) -> None:
+        decodificador: DecodificadorProgressivo | None = self._decodificador(conexao, partes)
+        if decodificador is None:
+            return
+        try:
+            quadros: list[bytes] = decodificador.alimentar(amostras)
+        except Exception:
+            conexao.contexto = (partes, None)
+            raise
+        self._entregar(quadros, conexao)
+
+    def _concluir(self, conexao, partes: MensagemEmPartes) -> None:
+        if conexao.contexto is not None and conexao.contexto[0] is partes and conexao.contexto[1] is None:
+            return  # A decodificação desta mensagem já falhou (e foi contada como erro)
+        decodificador: DecodificadorProgressivo = self._decodificador(conexao, partes)
+        conexao.contexto = None
+        mensagem: Mensagem = partes.mensagem
+        if mensagem.tipo_amostra == "simbolos":
+            # Sem onda: os níveis chegam prontos no fim da mensagem
+            self._entregar(decodificador.alimentar_niveis(mensagem.dig_signal), conexao)
+        self._entregar(decodificador.finalizar(), conexao)
+        self.ao_receber(mensagem, decodificador.resultado(), conexao.estatisticas)
+        conexao.estatisticas.mensagens_decodificadas += 1
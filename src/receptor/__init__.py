@@ -1,4 +1,5 @@
 from .camada_fisica import CamadaFisicaReceptor
 from .camada_enlace import CamadaEnlaceReceptor
+from .desenquadradores import DesenquadradorContagem, DesenquadradorVarint, DesenquadradorInsercao
 
-__all__ = ["CamadaFisicaReceptor", "CamadaEnlaceReceptor"]
\ No newline at end of file
+__all__ = ["CamadaFisicaReceptor", "CamadaEnlaceReceptor", "DesenquadradorContagem", "DesenquadradorVarint", "DesenquadradorInsercao"]
\ No newline at end of file
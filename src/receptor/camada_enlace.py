@@ -1,8 +1,6 @@
-from math import log2
-import sys
-import os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from src.utils import bytes_to_string
+import numpy as np
+from src.utils import BitBuffer, CRC32, CODIGOS_HAMMING, VERIFICACOES_QUADRO
+from .desenquadradores import DesenquadradorContagem, DesenquadradorInsercao, DesenquadradorVarint
 
 class CamadaEnlaceReceptor:
     def __init__(self):
@@ -24,20 +22,22 @@ class CamadaEnlaceReceptor:
         Retorna:
             bytes: Mensagem reconstruída após a remoção dos cabeçalhos de tamanho dos quadros.
         """
-        pacote: bytearray = bytearray()  # Inicializa um buffer para armazenar os dados reconstruídos
-        while byte_stream:
-            # Lê o cabeçalho do quadro, que indica o tamanho da carga útil
-            length: int = int(byte_stream[0])
-            # Remove o byte do cabeçalho (tamanho) do fluxo de bytes
-            byte_stream = byte_stream[1:]
-            # Obtém a carga útil do quadro com base no tamanho especificado
-            frame = byte_stream[:length]
-            # Remove o quadro processado do fluxo de bytes
-            byte_stream = byte_stream[length:]
-            # Adiciona a carga útil extraída ao pacote final
-            pacote.extend(frame)
-        # Retorna os dados reconstruídos sem os cabeçalhos de tamanho
-        return bytes(pacote)
+        # O desenquadrador incremental percorre o fluxo uma única vez, sem refatiar o restante a cada quadro
+        desenquadrador: DesenquadradorContagem = DesenquadradorContagem()
+        return b"".join(desenquadrador.alimentar(byte_stream) + desenquadrador.finalizar())
+    
+    def desenquadramento_contagem_varint(self, byte_stream: bytes) -> bytes:
+        """
+        Realiza o desenquadramento de um fluxo de bytes enquadrado por contagem com cabeçalho varint.
+
+        Parâmetros:
+            byte_stream (bytes): Fluxo de bytes contendo quadros precedidos pelo tamanho em varint.
+
+        Retorna:
+            bytes: Mensagem reconstruída após a remoção dos cabeçalhos dos quadros.
+        """
+        desenquadrador: DesenquadradorVarint = DesenquadradorVarint()
+        return b"".join(desenquadrador.alimentar(byte_stream) + desenquadrador.finalizar())
     
     def desenquadramento_insercao_de_bytes(self, byte_stream: bytes) -> bytes:
         """
@@ -51,122 +51,103 @@ class CamadaEnlaceReceptor:
         Retorna:
             bytes: Mensagem reconstruída após a remoção dos bytes de flag e escape.
         """
-        pacote: bytearray = bytearray()  # Inicializa um buffer para armazenar os dados reconstruídos
-        esc: bool = False  # Flag para indicar se o byte anterior era um ESC
-        while byte_stream:
-            byte_atual = byte_stream[:1]  # Pega o primeiro byte
-            byte_stream = byte_stream[1:]  # Remove o byte processado
-            
-            if byte_atual == self.FLAG and not esc:
-                # Se for uma FLAG e não for precedida de ESC, ignora
-                continue
-            elif byte_atual == self.ESC and not esc:
-                # Se for um ESC, ativa a flag e continua para o próximo byte
-                esc = True
-                continue
-            else:
-                # Se for um byte normal ou um byte após ESC, adiciona ao pacote
-                pacote.extend(byte_atual)
-                esc = False  # Reseta a flag ESC
-        # Retorna os dados reconstruídos sem os bytes de flag e escape
-        return bytes(pacote)
+        # Os trechos entre FLAGs e ESCs são copiados em bloco, em tempo linear
+        desenquadrador: DesenquadradorInsercao = DesenquadradorInsercao(self.FLAG, self.ESC)
+        return b"".join(desenquadrador.alimentar(byte_stream) + desenquadrador.finalizar())
 
     # MÉTODOS DE VERIFICAÇÃO DE ERROS
-    def verificar_bits_de_paridade(self, byte_stream: bytes) -> tuple[bytes, bool]:
+    def verificar_bits_de_paridade(self, bit_stream: BitBuffer | bytes) -> tuple[bytes, bool]:
         """
         Verifica os bits de paridade dos dados fornecidos.
         
         Args:
-            byte_stream (bytes): Os dados para os quais os bits de paridade serão verificados.
+            bit_stream (BitBuffer | bytes): Os bits recebidos (dados seguidos do bit de paridade).
         
         Returns:
-            bool: True se os bits de paridade forem válidos, False caso contrário.
+            tuple[bytes, bool]: Os dados sem o bit de paridade e True se a paridade (par) for válida, False caso contrário.
         """
-        bit_stream: list[int] = [int(x) for x in bytes_to_string(byte_stream)]
-        paridade = 0
-        bit_stream_util = bit_stream[:-1]
-        for bit in bit_stream_util:
-            paridade ^= bit
-            
-        byte_stream_saida = bytes(int("".join(str(bit) for bit in bit_stream_util[i:i+8]), 2)   for i in range(0, len(bit_stream_util), 8))
+        bit_stream = BitBuffer.wrap(bit_stream)
+        # Com paridade par, o XOR de todos os bits (dados e paridade) é 0
+        paridade_valida: bool = bit_stream.popcount() % 2 == 0
+        return bit_stream[:-1].to_bytes(), paridade_valida
         
-        return byte_stream_saida, paridade == bit_stream[-1]
-        
-    def verificar_crc32(self, byte_stream: bytes) -> tuple[bytes, bool]:
+    def verificar_crc32(self, bit_stream: BitBuffer | bytes) -> tuple[bytes, bool]:
         """
         Verifica o CRC-32 dos dados fornecidos.
 
         Args:
-            byte_stream (bytes): Os dados para os quais o CRC-32 será verificado.
-            tuple[bytes, bool]: A tupla contendo os dados sem o CRC-32 e um booleano indicando se o CRC-32 é válido.
+            bit_stream (BitBuffer | bytes): Os dados recebidos, seguidos dos 32 bits do CRC.
+
         Returns:
-            
+            tuple[bytes, bool]: A tupla contendo os dados sem o CRC-32 e um booleano indicando se o CRC-32 é válido.
         """
+        byte_stream: bytes = BitBuffer.wrap(bit_stream).to_bytes()
         # Extrai o CRC dos últimos 4 bytes do byte_stream
         crc_recebido: int = int.from_bytes(byte_stream[-4:], byteorder="big")
         byte_stream = byte_stream[:-4]
 
-        crc_calculado: int = int.from_bytes(byte_stream, byteorder="big") << 32
-        
-        while crc_calculado.bit_length() >= 32:
-            bytes_a_processar = (crc_calculado >> (crc_calculado.bit_length() - 32)) & 0xFFFFFFFF  
-            if bytes_a_processar & 0x80000000:
-                bytes_a_processar ^= self.CRC32_POLY
-            else:
-                bytes_a_processar ^= 0
-            crc_calculado = ((bytes_a_processar & 0x7FFFFFFF) << (crc_calculado.bit_length() - 32)) | (crc_calculado & ((1 << (crc_calculado.bit_length() - 32)) - 1))
+        crc_calculado: int = CRC32(byte_stream, self.CRC32_POLY).intdigest()  # Mesmo motor por tabelas usado pelo transmissor
 
         return byte_stream, crc_calculado == crc_recebido
 
+    def verificar_quadros(self, quadros: list[bytes], verificacao: str = "CRC-32 por Quadro") -> tuple[list[bytes], list[bool]]:
+        """
+        Confere o trailer de cada quadro desenquadrado, independentemente dos outros quadros.
+
+        Args:
+            quadros (list[bytes]): Os quadros recebidos, cada um com a carga útil seguida do trailer.
+            verificacao (str): A verificação usada pelo transmissor: "Paridade por Quadro" ou "CRC-32 por Quadro".
+
+        Returns:
+            tuple[list[bytes], list[bool]]: As cargas úteis sem o trailer e, para cada quadro, se ele está íntegro.
+        """
+        return VERIFICACOES_QUADRO[verificacao].verificar(quadros)
+
     # MÉTODOS DE CORREÇÃO DE ERROS
-    def corrigir_hamming(self, encoded_bytes: bytes) -> tuple[bytes, bool]:
+    def corrigir_hamming(self, encoded_bits: BitBuffer | bytes) -> tuple[bytes, bool]:
         """
-        Decodifica uma sequência de bytes codificada com código de Hamming, detectando e corrigindo erros.
+        Decodifica uma sequência de bits codificada com código de Hamming, detectando e corrigindo erros.
         
         Args:
-            encoded_bytes (bytes): A sequência de bytes codificada com código de Hamming.
+            encoded_bits (BitBuffer | bytes): A sequência de bits codificada com código de Hamming.
         
         Returns:
-            tuple[bool, bytes]: Uma tupla contendo:
-                - Um booleano indicando se um erro foi detectado.
+            tuple[bytes, bool]: Uma tupla contendo:
                 - A mensagem decodificada em bytes.
+                - Um booleano indicando se um erro foi detectado.
         """
-        # Converte a sequência de bytes em uma lista de bits
-        hamming_code: list[int] = [int(bit) for bit in ''.join(f'{byte:08b}' for byte in encoded_bytes)]
-        
-        r: int = 0  # Número de bits de paridade
+        hamming_code: np.ndarray = BitBuffer.wrap(encoded_bits).unpack()
         n: int = len(hamming_code)  # Número total de bits no código de Hamming
-        print(n)
-        # Calcula o número de bits de paridade
-        while (2**r) < n:
-            r += 1
+        r: int = n.bit_length()  # Número de bits de paridade: uma por potência de 2 até n
+        posicoes: np.ndarray = np.arange(1, n + 1)
         
-        # Verifica se há erros e corrige, se necessário
+        # A síndrome é a soma das posições de paridade que não conferem, ou seja, a posição (1-based) do bit errado
         error_position = 0
         for i in range(r):
             pos = 2**i # Posição do bit de paridade (1-based index)
-            paridade = 0
-            for j in range(n):
-                if j + 1 & pos:  # Se o bit pos está ativado em j
-                    paridade ^= hamming_code[j]
-            if paridade != 0:
-                error_position += pos - 1
+            if hamming_code[(posicoes & pos) != 0].sum() & 1:
+                error_position += pos
         
-        # Se houver um erro, corrige o bit correspondente
+        # Se houver um erro em uma posição válida, corrige o bit correspondente
         error_detected = error_position != 0
-        if error_detected:
-            print(len(hamming_code))
-            print(f"Erro detectado na posição {error_position}. Corrigindo...")
-            hamming_code[error_position] ^= 1  # Inverte o bit errado
-        
-        # Remove os bits de paridade para obter a sequência de bits original
-        original_bits = []
-        for i in range(1, n + 1):
-            if not log2(i).is_integer():  # Ignora os bits de paridade
-                original_bits.append(str(hamming_code[i - 1]))
+        if error_detected and error_position <= n:
+            hamming_code[error_position - 1] ^= 1  # Inverte o bit errado
         
-        # Converte a lista de bits de volta para bytes
-        decoded_bits = ''.join(original_bits)
-        decoded_bytes = bytes(int(decoded_bits[i:i+8], 2) for i in range(0, len(decoded_bits), 8))
-        
-        return decoded_bytes, error_detected
\ No newline at end of file
+        # Remove os bits de paridade (posições que são potências de 2) para obter a sequência de bits original
+        original_bits: np.ndarray = hamming_code[(posicoes & (posicoes - 1)) != 0]
+        return BitBuffer.pack(original_bits).to_bytes(), error_detected
+
+    def corrigir_hamming_em_blocos(self, encoded_bits: BitBuffer | bytes, codigo: str = "Hamming (7,4)") -> tuple[bytes, bool]:
+        """
+        Decodifica uma sequência codificada com um código de Hamming em blocos, corrigindo até um erro por bloco.
+
+        Args:
+            encoded_bits (BitBuffer | bytes): As palavras recebidas.
+            codigo (str): O código usado pelo transmissor: "Hamming (7,4)", "Hamming (15,11)" ou "SECDED (72,64)".
+
+        Returns:
+            tuple[bytes, bool]: A mensagem decodificada e False se algum bloco tiver um erro detectado que não pôde ser
+            corrigido (só identificável no SECDED ou por síndromes inválidas), True caso contrário.
+        """
+        dados, _, nao_corrigiveis = CODIGOS_HAMMING[codigo].decodificar(BitBuffer.wrap(encoded_bits))
+        return dados.to_bytes(), nao_corrigiveis == 0
@@ -1,161 +1,217 @@
+import numpy as np
+from src.utils import BitBuffer
+
 class CamadaFisicaReceptor:
     def __init__(self, sample, amplitude, frequencia, fase) -> None:
         self.sample = sample
         self.amplitude = amplitude
         self.frequencia = frequencia
         self.fase = fase
+        # Constelação 8-QAM, na mesma ordem do transmissor (o índice de cada ponto é o valor do trio de bits)
+        self.CONSTELACAO_QAM8: dict[str, complex] = {
+            "000": 1 + 1j, "001": 1 - 1j, "010": -1 + 1j,
+            "011": -1 - 1j, "100": 1/3 + 1/3j, "101": 1/3 - 1/3j,
+            "110": -1/3 + 1/3j, "111": -1/3 - 1/3j
+        }
+        self._constelacao: np.ndarray = np.array(list(self.CONSTELACAO_QAM8.values()))
+        self._portadoras: dict[tuple, np.ndarray | tuple] = {}  # Portadoras de referência já calculadas, por parâmetros
     
-    def decodificar_nrz_polar(self, dig_signal: list[int]) -> list[bool]:
+    def decodificar_nrz_polar(self, dig_signal: list[int] | np.ndarray) -> BitBuffer:
         """
         Decodifica um sinal NRZ-Polar (Non-Return-to-Zero) para um trem de bits.
         Converte 1 para True e -1 para False.
         Args:
-            dig_signal (list[int]): O sinal NRZ-Polar a ser decodificado.
+            dig_signal (list[int] | np.ndarray): O sinal NRZ-Polar a ser decodificado.
         Returns:
-            list[bool]: O trem de bits decodificado.
+            BitBuffer: O trem de bits decodificado.
         """
-        return [False if bit == -1 else True for bit in dig_signal]
+        return BitBuffer.pack(np.asarray(dig_signal) != -1)
     
-    def decodificar_manchester(self, dig_signal: list[int]) -> list[bool]:
+    def decodificar_manchester(self, dig_signal: list[int] | np.ndarray) -> BitBuffer:
         """
         Decodifica um sinal Manchester para um trem de bits.
-        Realiza o XOR entre o bit e o clock para decodificar.
+        Como a primeira metade de cada bit é o XOR com o clock em baixa, ela é o próprio bit.
         Args:
-            dig_signal (list[int]): O sinal Manchester a ser decodificado.
+            dig_signal (list[int] | np.ndarray): O sinal Manchester a ser decodificado.
         Returns:
-            list[bool]: O trem de bits decodificado.
-        """
-        bit_stream: list[bool] = []
-        i: int = 0
-        while i < len(dig_signal):
-            bit_stream.append(True if dig_signal[i] == 1 else False)  # Adiciona o bit atual ao bit stream
-            i += 2
-        return bit_stream
+            BitBuffer: O trem de bits decodificado.
+        """
+        return BitBuffer.pack(np.asarray(dig_signal)[0::2] == 1)
     
-    def decodificar_bipolar(self, dig_signal: list[int]) -> list[bool]:
+    def decodificar_bipolar(self, dig_signal: list[int] | np.ndarray) -> BitBuffer:
         """
         Decodifica um sinal bipolar para um trem de bits.
-        Converte 0 para False e -1 para True.
+        Converte 0 para False e +1/-1 para True.
         Args:
-            dig_signal (list[int]): O sinal bipolar a ser decodificado.
+            dig_signal (list[int] | np.ndarray): O sinal bipolar a ser decodificado.
         Returns:
-            list[bool]: O trem de bits decodificado.
+            BitBuffer: O trem de bits decodificado.
         """
-        return [False if bit == 0 else True for bit in dig_signal]
+        return BitBuffer.pack(np.asarray(dig_signal) != 0)
     
     # ASK decoding
-    def decodificar_ask(self, signal: list[float], mod_digital: str, amp_zero: float = 0, amp_one: float = 1) -> list[int]:
+    def decodificar_ask(self, signal: list[float] | np.ndarray, mod_digital: str, amp_zero: float = 0, amp_one: float = 1) -> np.ndarray:
         """
         Decodifica um sinal de Chaveamento por Amplitude (ASK) em uma sequência binária.
 
+        O sinal é organizado em uma matriz (símbolos x sample) e a amplitude de cada símbolo é estimada de uma vez, pela
+        correlação com a portadora de referência (projeção de mínimos quadrados). A decisão usa o limiar entre as duas
+        amplitudes.
+
         Args:
-            signal (list[float]): O sinal ASK de entrada como uma lista de valores float.
+            signal (list[float] | np.ndarray): O sinal ASK de entrada.
             mod_digital (str): O tipo de modulação digital (NRZ-Polar, Bipolar, etc.).
             amp_zero (float, opcional): A amplitude que representa o binário 0. Padrão é 0.
             amp_one (float, opcional): A amplitude que representa o binário 1. Padrão é 1.
 
         Returns:
-            list[int]: A sequência binária decodificada como uma lista de inteiros (0s e 1s).
+            np.ndarray: O sinal digital decodificado (níveis da modulação digital informada).
         """
-        if mod_digital == "NRZ-Polar":
-            return [1 if max(signal[i:i+self.sample]) > (amp_zero + amp_one) / 2 else -1 for i in range(0, len(signal), self.sample)]
-        elif mod_digital == "Bipolar":
-            dig_signal: list[int] = []
-            last_one = -1
-            for i in range(0, len(signal), self.sample):
-                if (max(signal[i:i+self.sample]) > (amp_zero + amp_one) / 2):
-                    last_one = -last_one
-                    dig_signal.append(last_one)
-                else:
-                    dig_signal.append(0)
-            return dig_signal
+        simbolos: np.ndarray = self._simbolos(signal)
+        projecao: np.ndarray = self._projecao((self.frequencia,), (np.sin,), self.fase)
+        if np.any(projecao):
+            amplitudes: np.ndarray = (simbolos @ projecao.T)[:, 0]
         else:
-            return [1 if max(signal[i:i+self.sample]) > (amp_zero + amp_one) / 2 else 0 for i in range(0, len(signal), self.sample)]
+            amplitudes = simbolos.max(axis=1)  # Portadora sem energia nas amostras: usa a envoltória, como antes
+        if amp_one < amp_zero:  # Mantém a decisão correta quando o bit 1 usa a amplitude menor
+            amplitudes, amp_zero, amp_one = -amplitudes, -amp_zero, -amp_one
+        return self._niveis(amplitudes > (amp_zero + amp_one) / 2, mod_digital)
     
     # FSK decoding function
-    def decodificar_fsk(self, mod_signal: list[float], mod_digital: str, f_zero: float = 0.0, f_one: float = 1.0) -> list[int]:
+    def decodificar_fsk(self, mod_signal: list[float] | np.ndarray, mod_digital: str, f_zero: float = 0.0, f_one: float = 1.0) -> np.ndarray:
         """
-        Decodifica um sinal FSK modulado analisando a quantidade de cruzamentos de zero.
+        Decodifica um sinal FSK binário com o banco de filtros de _detectar_tons.
 
         Args:
-            mod_signal (list[float]): O sinal FSK modulado.
+            mod_signal (list[float] | np.ndarray): O sinal FSK modulado.
+            mod_digital (str): O tipo de modulação digital (NRZ-Polar, Bipolar, etc.).
             f_zero (float): A frequência usada para representar o bit 0.
             f_one (float): A frequência usada para representar o bit 1.
-            sample (int): Número de amostras por bit.
 
         Returns:
-            list[int]: O trem de bits decodificado.
-        """
-        bit_stream: list[int] = []
-        # Percorre o sinal em janelas do tamanho de um bit
-        for i in range(0, len(mod_signal), self.sample):
-            janela: list[float] = mod_signal[i:i + self.sample]  # Extrai o trecho do sinal correspondente a um bit
-            # Conta quantas vezes o sinal cruza o zero
-            cruzamentos: int = 0
-            for j in range(1, len(janela)):
-                if (janela[j-1] < 0 and janela[j] > 0) or (janela[j-1] > 0 and janela[j] < 0):
-                    cruzamentos += 1
-            # Decide se o bit era 0 ou 1 baseado na frequência estimada
-            if mod_digital == "NRZ-Polar":
-                bit_stream.append(-1 if abs(cruzamentos - f_zero) < abs(cruzamentos - f_one) else 1)
-            elif mod_digital == "Bipolar":
-                last_one = -1
-                if abs(cruzamentos - f_zero) < abs(cruzamentos - f_one):
-                    bit_stream.append(0)
-                else:
-                    last_one = -last_one
-                    bit_stream.append(last_one)
-            else:
-                bit_stream.append(0 if abs(cruzamentos - f_zero) < abs(cruzamentos - f_one) else 1) # Se a frequência estimada está mais próxima de f_zero, o bit é 0; caso contrário, é 1
-
-        return bit_stream
-
-
-    """ Não funciona essa desgraça
+            np.ndarray: O sinal digital decodificado.
+        """
+        return self._niveis(self._detectar_tons(mod_signal, (f_zero, f_one)) == 1, mod_digital)
+
+    def decodificar_mfsk(self, mod_signal: list[float] | np.ndarray, mod_digital: str, frequencias: list[float], n_niveis: int | None = None) -> np.ndarray:
+        """
+        Decodifica um sinal M-FSK: cada símbolo detectado vira os log2(M) bits do seu índice.
+
+        Args:
+            mod_signal (list[float] | np.ndarray): O sinal M-FSK recebido.
+            mod_digital (str): O tipo de modulação digital (NRZ-Polar, Bipolar, etc.).
+            frequencias (list[float]): As M frequências, na ordem usada pelo transmissor.
+            n_niveis (int, opcional): O número de níveis do sinal digital transmitido, para remover o preenchimento com
+                zeros à esquerda feito pelo transmissor. ValueError se a onda tiver menos símbolos que os necessários.
+
+        Returns:
+            np.ndarray: O sinal digital decodificado.
+        """
+        M: int = len(frequencias)
+        if M < 2 or M & (M - 1):
+            raise ValueError(f"O M-FSK precisa de uma quantidade de frequências que seja potência de 2 (recebeu {M})")
+        k: int = M.bit_length() - 1  # Bits por símbolo
+        indices: np.ndarray = self._detectar_tons(mod_signal, tuple(frequencias))
+        bits: np.ndarray = ((indices[:, None] >> np.arange(k - 1, -1, -1)) & 1).ravel().astype(bool)
+        if n_niveis is not None:
+            if n_niveis > len(bits):
+                raise ValueError(f"Sinal M-FSK com {len(bits)} níveis, menos que os {n_niveis} anunciados")
+            bits = bits[len(bits) - n_niveis:]
+        return self._niveis(bits, mod_digital)
+
     # 8-QAM decoding
-    def decodificar_qam8(self, mod_signal: list[float], dig_modulation: str) -> list[int]:
-    
-        # Define a constelação 8-QAM
-        constellation: dict[complex, str] = {
-            1 + 1j: "000",  1 - 1j:     "001",    -1 + 1j: "010",
-            -1 - 1j: "011", 1/3 + 1/3j: "100", 1/3 - 1/3j: "101",
-            -1/3 + 1/3j: "110",               -1/3 - 1/3j: "111"
-        }
+    def decodificar_qam8(self, mod_signal: list[float] | np.ndarray, mod_digital: str, n_niveis: int | None = None) -> np.ndarray:
+        """
+        Decodifica um sinal 8-QAM em um sinal digital.
+
+        As componentes I (cosseno) e Q (seno) de todos os símbolos são estimadas em um único produto de matrizes com as
+        portadoras de referência, e cada símbolo é levado ao ponto mais próximo da constelação de uma vez.
+
+        Args:
+            mod_signal (list[float] | np.ndarray): O sinal 8-QAM recebido.
+            mod_digital (str): O tipo de modulação digital (NRZ-Polar, Bipolar, etc.).
+            n_niveis (int, opcional): O número de níveis do sinal digital transmitido. O transmissor completa o sinal
+                com zeros à esquerda até um múltiplo de 3; com n_niveis, esse preenchimento é removido. ValueError se
+                a onda tiver menos símbolos que os necessários para n_niveis.
+
+        Returns:
+            np.ndarray: O sinal digital decodificado.
+        """
+        simbolos: np.ndarray = self._simbolos(mod_signal)
+        # Componentes I e Q de cada símbolo: S(t) = I*cos(2πft) + Q*sin(2πft)
+        iq: np.ndarray = simbolos @ self._projecao((self.frequencia, self.frequencia), (np.cos, np.sin), 0.0).T
+        estimados: np.ndarray = iq[:, 0] + 1j * iq[:, 1]
+        # Índice do ponto mais próximo da constelação; a ordem ("000" a "111") coincide com o valor do trio de bits
+        indices: np.ndarray = np.abs(estimados[:, None] - self._constelacao[None, :]).argmin(axis=1)
+        bits: np.ndarray = ((indices[:, None] >> np.array([2, 1, 0])) & 1).ravel().astype(bool)
+        if n_niveis is not None:
+            if n_niveis > len(bits):
+                raise ValueError(f"Sinal 8-QAM com {len(bits)} níveis, menos que os {n_niveis} anunciados")
+            bits = bits[len(bits) - n_niveis:]
+        return self._niveis(bits, mod_digital)
+
+    # Auxiliares vetorizados (NumPy)
+    def _simbolos(self, signal: list[float] | np.ndarray) -> np.ndarray:
+        """
+        Organiza o sinal em uma matriz (símbolos x sample), completando o último símbolo com zeros se necessário.
+        """
+        amostras: np.ndarray = np.asarray(signal, dtype=np.float64)
+        if len(amostras) % self.sample:
+            amostras = np.concatenate([amostras, np.zeros(-len(amostras) % self.sample)])
+        return amostras.reshape(-1, self.sample)
+
+    def _projecao(self, frequencias: tuple[float, ...], funcoes: tuple, fase: float) -> np.ndarray:
+        """
+        Retorna a pseudoinversa das portadoras de referência (uma linha por portadora), guardada em cache.
+        Multiplicar a matriz de símbolos pela sua transposta dá, para cada símbolo, o coeficiente de cada portadora.
+        """
+        chave: tuple = (frequencias, tuple(f.__name__ for f in funcoes), fase, self.sample)
+        if chave not in self._portadoras:
+            t: np.ndarray = np.arange(self.sample) / self.sample
+            base: np.ndarray = np.stack([f(2*np.pi*freq*t + fase) for freq, f in zip(frequencias, funcoes)], axis=1)
+            self._portadoras[chave] = np.linalg.pinv(base)
+        return self._portadoras[chave]
 
-        # Lista de símbolos QAM
-        symbols = list(constellation.keys())
-
-        bit_stream: str = ""
-
-        # Processa o sinal em blocos correspondentes a um símbolo
-        for i in range(0, len(mod_signal), self.sample):
-            bloco: list[float] = mod_signal[i:i + self.sample]  # Extrai um bloco de amostras
-            
-            # Estima os valores I e Q usando correlação
-            I: float = sum(bloco[j] * cos(2 * pi * self.frequencia * (j / self.sample)) for j in range(len(bloco))) / self.sample # I (in-phase) é o valor médio de cada I em uma sample, em que I = S(t) * cos(2πft)
-            Q: float = sum(bloco[j] * sin(2 * pi * self.frequencia * (j / self.sample)) for j in range(len(bloco))) / self.sample # Q (quadrature) é o valor médio de cada Q em uma sample, em que Q = S(t) * sin(2πft)
-            simbolo_estimado: complex = complex(round(I, 1), round(Q, 1))  # round(x, 1) arredonda para 1 casa decimal
-
-            # Encontra o símbolo da constelação mais próximo do estimado usando a distância euclidiana e lambda function
-            simbolo_mais_proximo: complex = min(symbols, key=lambda s: abs(s - simbolo_estimado))
-            
-            # Converte o símbolo de volta para bits
-            bit_stream += constellation[simbolo_mais_proximo]
-
-        # Converte a string de bits para uma lista de inteiros (0s e 1s)
-        bit_stream: list[bool] = [True if bit == '1' else False for bit in bit_stream]
-        if dig_modulation == "NRZ-Polar":
-            return [1 if bit else -1 for bit in bit_stream]
-        elif dig_modulation == "Bipolar":
-            last_one: int = 1  # Último valor usado para bit 1 (+1 ou -1)
-            dig_signal: list[int] = []
-
-            for bit in bit_stream:
-                if not bit:
-                    dig_signal.append(0)  # Adiciona 0 para bits 0
-                else:
-                    last_one = -last_one  # Alterna o valor de last_one
-                    dig_signal.append(last_one)  # Adiciona +1 ou -1 para bits 1
-            return dig_signal
-        return [1 if bit else 0 for bit in bit_stream]
-    """
\ No newline at end of file
+    def _detectar_tons(self, signal: list[float] | np.ndarray, frequencias: tuple[float, ...]) -> np.ndarray:
+        """
+        Detecta qual das frequências foi transmitida em cada símbolo, com um banco de filtros aplicado a todas as janelas
+        de uma vez.
+
+        Para cada tom, a janela é projetada no par seno/cosseno daquela frequência (equivalente ao filtro de Goertzel, ou
+        a um bin da DFT, quando a frequência tem um número inteiro de ciclos por símbolo), o que não depende da fase
+        recebida. O tom escolhido é o de menor distância entre a janela e um sinal daquele tom com a energia esperada
+        (amplitude do transmissor): a energia fora do tom mais a diferença entre as amplitudes. Assim um tom de
+        frequência 0 (sinal nulo) também é reconhecido, o que não seria possível comparando só as energias.
+
+        Returns:
+            np.ndarray: O índice da frequência detectada em cada símbolo.
+        """
+        chave: tuple = ("tons", frequencias, self.amplitude, self.fase, self.sample)
+        if chave not in self._portadoras:
+            t: np.ndarray = np.arange(self.sample) / self.sample
+            bases: list[np.ndarray] = [np.stack([np.cos(2*np.pi*f*t), np.sin(2*np.pi*f*t)], axis=1) for f in frequencias]
+            projecoes: np.ndarray = np.concatenate([np.linalg.pinv(base) for base in bases])  # (2M x sample)
+            grams: np.ndarray = np.stack([base.T @ base for base in bases])  # (M x 2 x 2)
+            # Energia de cada tom como o transmissor o gera: A * sen(2πft + ø)
+            esperadas: np.ndarray = np.array([np.sum((self.amplitude * np.sin(2*np.pi*f*t + self.fase))**2) for f in frequencias])
+            self._portadoras[chave] = (projecoes, grams, esperadas)
+        projecoes, grams, esperadas = self._portadoras[chave]
+
+        simbolos: np.ndarray = self._simbolos(signal)
+        coeficientes: np.ndarray = (simbolos @ projecoes.T).reshape(len(simbolos), len(frequencias), 2)
+        energias: np.ndarray = np.einsum("nmi,mij,nmj->nm", coeficientes, grams, coeficientes)  # Energia em cada tom
+        total: np.ndarray = np.einsum("ns,ns->n", simbolos, simbolos)[:, None]
+        distancias: np.ndarray = (total - energias) + (np.sqrt(np.maximum(energias, 0)) - np.sqrt(esperadas))**2
+        return distancias.argmin(axis=1)
+
+    def _niveis(self, bits: np.ndarray, mod_digital: str) -> np.ndarray:
+        """
+        Converte os bits decididos nos níveis da modulação digital (como o transmissor os gera).
+        """
+        if mod_digital == "NRZ-Polar":
+            return np.where(bits, 1, -1).astype(np.int8)
+        if mod_digital == "Bipolar":
+            # Os bits 1 alternam entre +1 e -1, começando por +1
+            alternancia: np.ndarray = np.where(np.cumsum(bits) % 2 == 1, 1, -1)
+            return np.where(bits, alternancia, 0).astype(np.int8)
+        return bits.astype(np.int8)
@@ -0,0 +1,188 @@
+import re
+
+
+class DesenquadradorContagem:
+    """
+    Desenquadrador incremental por contagem de caracteres.
+
+    Recebe o fluxo em pedaços de qualquer tamanho (o cabeçalho e a carga de um quadro podem chegar em pedaços
+    diferentes) e devolve a carga útil de cada quadro assim que ela está completa. Cada byte é processado uma vez.
+
+    Exemplo:
+        desenquadrador = DesenquadradorContagem()
+        desenquadrador.alimentar(b"\\x04Ola")    # []
+        desenquadrador.alimentar(b",\\x02do")    # [b"Ola,", b"do"]
+    """
+
+    def __init__(self) -> None:
+        self._restante: int | None = None  # Bytes que faltam para completar o quadro atual (None: aguardando o cabeçalho)
+        self._quadro: bytearray = bytearray()
+
+    def alimentar(self, dados: bytes | bytearray | memoryview) -> list[bytes]:
+        """
+        Acrescenta um pedaço do fluxo recebido.
+
+        Args:
+            dados (bytes): O próximo pedaço do fluxo de bytes enquadrado.
+
+        Returns:
+            list[bytes]: As cargas úteis dos quadros completados por este pedaço.
+        """
+        visao: memoryview = memoryview(dados).cast("B")
+        cargas: list[bytes] = []
+        i: int = 0
+        while i < len(visao):
+            if self._restante is None:
+                # Lê o cabeçalho do quadro, que indica o tamanho da carga útil
+                self._restante = visao[i]
+                i += 1
+            n: int = min(self._restante, len(visao) - i)
+            self._quadro += visao[i:i + n]
+            self._restante -= n
+            i += n
+            if self._restante == 0:
+                cargas.append(bytes(self._quadro))
+                self._quadro = bytearray()
+                self._restante = None
+        return cargas
+
+    def finalizar(self) -> list[bytes]:
+        """
+        Encerra o fluxo. Um quadro truncado (cabeçalho maior que os dados recebidos) é devolvido como chegou.
+        """
+        carga: bytes = bytes(self._quadro)
+        self._quadro = bytearray()
+        self._restante = None
+        return [carga] if carga else []
+
+
+class DesenquadradorVarint:
+    """
+    Desenquadrador incremental por contagem com cabeçalho varint (ver EnquadradorVarint).
+
+    O cabeçalho também pode chegar dividido entre pedaços: os seus bytes são acumulados até o byte sem o bit de
+    continuação. Um cabeçalho corrompido é encerrado no terceiro byte, que é o maior cabeçalho possível.
+
+    Exemplo:
+        desenquadrador = DesenquadradorVarint()
+        desenquadrador.alimentar(b"\x04Ola,\xdc")  # [b"Ola,"]
+        desenquadrador.alimentar(b"\x0b" + carga)   # [carga], com len(carga) == 1500
+    """
+
+    def __init__(self, bytes_maximos: int = 3) -> None:
+        self.bytes_maximos: int = bytes_maximos
+        self._tamanho: int = 0  # Valor parcial do cabeçalho
+        self._deslocamento: int = 0  # Bits do cabeçalho já lidos
+        self._restante: int | None = None  # Bytes que faltam para completar o quadro atual (None: lendo o cabeçalho)
+        self._quadro: bytearray = bytearray()
+
+    def alimentar(self, dados: bytes | bytearray | memoryview) -> list[bytes]:
+        """
+        Acrescenta um pedaço do fluxo recebido.
+
+        Args:
+            dados (bytes): O próximo pedaço do fluxo de bytes enquadrado.
+
+        Returns:
+            list[bytes]: As cargas úteis dos quadros completados por este pedaço.
+        """
+        visao: memoryview = memoryview(dados).cast("B")
+        cargas: list[bytes] = []
+        i: int = 0
+        while i < len(visao):
+            if self._restante is None:
+                byte: int = visao[i]
+                i += 1
+                self._tamanho |= (byte & 0x7F) << self._deslocamento
+                self._deslocamento += 7
+                if byte & 0x80 and self._deslocamento < 7 * self.bytes_maximos:
+                    continue  # O cabeçalho continua no próximo byte
+                self._restante, self._tamanho, self._deslocamento = self._tamanho, 0, 0
+            n: int = min(self._restante, len(visao) - i)
+            self._quadro += visao[i:i + n]
+            self._restante -= n
+            i += n
+            if self._restante == 0:
+                cargas.append(bytes(self._quadro))
+                self._quadro = bytearray()
+                self._restante = None
+        return cargas
+
+    def finalizar(self) -> list[bytes]:
+        """
+        Encerra o fluxo. Um quadro truncado (cabeçalho maior que os dados recebidos) é devolvido como chegou.
+        """
+        carga: bytes = bytes(self._quadro)
+        self._quadro = bytearray()
+        self._restante, self._tamanho, self._deslocamento = None, 0, 0
+        return [carga] if carga else []
+
+
+class DesenquadradorInsercao:
+    """
+    Desenquadrador incremental por inserção de bytes.
+
+    Toda FLAG não escapada delimita um quadro, e um ESC no fim de um pedaço fica pendente até o próximo pedaço. A
+    busca pelos bytes especiais é feita por uma expressão regular sobre o pedaço inteiro, e os trechos entre eles são
+    copiados em bloco, o que mantém o tempo linear.
+
+    Exemplo:
+        desenquadrador = DesenquadradorInsercao()
+        desenquadrador.alimentar(b"\\x16Ol\\x1b")       # []
+        desenquadrador.alimentar(b"\\x16a\\x16\\x16d")  # [b"Ol\\x16a"]
+    """
+
+    def __init__(self, flag: bytes = bytes([22]), esc: bytes = bytes([27])) -> None:
+        self.FLAG: int = flag[0]
+        self.ESC: int = esc[0]
+        self._especiais: re.Pattern = re.compile(b"[" + re.escape(flag) + re.escape(esc) + b"]")
+        self._quadro: bytearray = bytearray()
+        self._esc: bool = False  # O último byte recebido foi um ESC ainda não aplicado
+
+    def alimentar(self, dados: bytes | bytearray | memoryview) -> list[bytes]:
+        """
+        Acrescenta um pedaço do fluxo recebido.
+
+        Args:
+            dados (bytes): O próximo pedaço do fluxo de bytes enquadrado.
+
+        Returns:
+            list[bytes]: As cargas úteis dos quadros fechados por uma FLAG neste pedaço.
+        """
+        dados = bytes(dados)
+        cargas: list[bytes] = []
+        i: int = 0
+        if self._esc and dados:
+            # O ESC pendente do pedaço anterior torna o primeiro byte deste pedaço um dado comum
+            self._quadro.append(dados[0])
+            self._esc = False
+            i = 1
+        while True:
+            especial: re.Match | None = self._especiais.search(dados, i)
+            if especial is None:
+                self._quadro += dados[i:]
+                return cargas
+            j: int = especial.start()
+            self._quadro += dados[i:j]
+            if dados[j] == self.FLAG:
+                # FLAG sem ESC: fecha o quadro atual (FLAGs seguidas não geram quadros vazios)
+                if self._quadro:
+                    cargas.append(bytes(self._quadro))
+                    self._quadro = bytearray()
+                i = j + 1
+            elif j + 1 < len(dados):
+                # ESC: o byte seguinte é dado, mesmo que seja uma FLAG ou um ESC
+                self._quadro.append(dados[j + 1])
+                i = j + 2
+            else:
+                self._esc = True
+                return cargas
+
+    def finalizar(self) -> list[bytes]:
+        """
+        Encerra o fluxo, devolvendo os dados recebidos após a última FLAG, se houver.
+        """
+        carga: bytes = bytes(self._quadro)
+        self._quadro = bytearray()
+        self._esc = False
+        return [carga] if carga else []
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .simulacao import Cenario, Contagem, ResultadoCenario, criar_cenarios, simular, simular_lote
+
+__all__ = ["Cenario", "Contagem", "ResultadoCenario", "criar_cenarios", "simular", "simular_lote"]
\ No newline at end of file
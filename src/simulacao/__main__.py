@@ -0,0 +1,70 @@
+"""
+Simulação de Monte Carlo das configurações de enlace sob erros de bit, sem interface gráfica.
+
+Exemplos:
+    python -m src.simulacao --taxas 0 0.001 0.01 --mensagens 2000
+    python -m src.simulacao --deteccao CRC-32 "Hamming (7,4)" --mod-portadora ASK --saida resultados.csv
+"""
+
+import argparse
+import csv
+import json
+import time
+from src.comunicacao.protocolo import DETECCOES_CORRECOES, ENQUADRAMENTOS
+from src.pipeline import LinkConfig
+from .simulacao import ResultadoCenario, criar_cenarios, simular
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.simulacao", description="Mede BER, FER, erro residual e goodput de cada configuração de enlace.")
+    parser.add_argument("--enquadramento", nargs="+", default=["Contagem de Caracteres", "Insercao de Bytes"], choices=list(ENQUADRAMENTOS))
+    parser.add_argument("--mtu", type=int, default=4, help="Tamanho máximo da carga útil de cada quadro, em bytes (até 65536)")
+    parser.add_argument("--deteccao", nargs="+", default=["Nenhum", "Bit de Paridade", "CRC-32", "Hamming (7,4)"], choices=list(DETECCOES_CORRECOES))
+    parser.add_argument("--mod-digital", nargs="+", default=["NRZ-Polar"], choices=["NRZ-Polar", "Manchester", "Bipolar"])
+    parser.add_argument("--mod-portadora", nargs="+", default=["ASK"], choices=["ASK", "FSK", "8-QAM", "M-FSK"])
+    parser.add_argument("--taxas", type=float, nargs="+", default=[0.0, 0.001, 0.01], help="Probabilidades de erro de bit no canal")
+    parser.add_argument("--rajada", type=float, default=0.0, help="Duração média das rajadas de erro em bits (modelo de Gilbert-Elliott); 0 para erros independentes")
+    parser.add_argument("--ebn0", type=float, nargs="+", default=[None], help="Valores de Eb/N0 (dB) do ruído gaussiano somado à onda; omitido, não há ruído analógico")
+    parser.add_argument("--mensagens", type=int, default=1000, help="Mensagens aleatórias por cenário")
+    parser.add_argument("--tamanho", type=int, default=32, help="Tamanho de cada mensagem, em bytes")
+    parser.add_argument("--sample", type=int, default=8)
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--processos", type=int, default=None, help="Número de processos (padrão: um por CPU)")
+    parser.add_argument("--saida", help="Grava os resultados em um arquivo .json ou .csv")
+    return parser
+
+
+def gravar(resultados: list[ResultadoCenario], caminho: str) -> None:
+    linhas: list[dict] = [resultado.como_dict() for resultado in resultados]
+    with open(caminho, "w", encoding="utf-8", newline="") as arquivo:
+        if caminho.endswith(".csv"):
+            escritor = csv.DictWriter(arquivo, fieldnames=list(linhas[0]))
+            escritor.writeheader()
+            escritor.writerows(linhas)
+        else:
+            json.dump(linhas, arquivo, indent=2)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = criar_parser().parse_args(argv)
+    cenarios = criar_cenarios(LinkConfig(sample=args.sample, freq_one=2.0, mtu=args.mtu), args.enquadramento, args.deteccao,
+                              args.mod_digital, args.mod_portadora, args.taxas, args.rajada, args.ebn0)
+    inicio: float = time.perf_counter()
+    resultados: list[ResultadoCenario] = simular(cenarios, args.mensagens, args.tamanho, args.semente, args.processos)
+    duracao: float = time.perf_counter() - inicio
+
+    print(f"{'enquadramento':24} {'detecção':18} {'linha':11} {'portadora':9} {'p':>8} {'Eb/N0':>6} {'BER canal':>10} {'BER':>10} {'FER':>8} {'residual':>9} {'goodput':>8}")
+    for resultado in resultados:
+        config: LinkConfig = resultado.cenario.config
+        print(f"{config.enquadramento:24} {config.deteccao_correcao:18} {config.mod_digital:11} {config.mod_portadora:9} "
+              f"{resultado.cenario.taxa_erro:8.4g} {'-' if resultado.cenario.ebn0_db is None else f'{resultado.cenario.ebn0_db:g}':>6} {resultado.ber_canal:10.3e} {resultado.ber:10.3e} {resultado.fer:8.4f} "
+              f"{resultado.erro_residual:9.4f} {resultado.goodput:8.4f}")
+    print(f"{len(cenarios)} cenários x {args.mensagens} mensagens em {duracao:.1f} s")
+    if args.saida:
+        gravar(resultados, args.saida)
+        print(f"Resultados gravados em {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,202 @@
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+import numpy as np
+from src.canal import CanalBernoulli, CanalGilbertElliott, ModeloErro
+from src.pipeline import LinkConfig, Pipeline
+from src.utils import BitBuffer
+
+
+@dataclass
+class Cenario:
+    """
+    Uma configuração de enlace simulada com uma taxa de erro de bit no canal.
+    """
+    config: LinkConfig
+    taxa_erro: float  # Probabilidade de inversão de cada bit entregue à camada física
+    rajada: float = 0.0  # Duração média das rajadas de erro, em bits (0: erros independentes)
+    ebn0_db: float | None = None  # Eb/N0 do ruído gaussiano somado à onda (None: sem canal analógico)
+
+    def criar_canal(self, semente: np.random.Generator) -> ModeloErro:
+        """
+        Cria o modelo de erro do cenário. Com rajadas, usa o Gilbert-Elliott com 50% de erro no estado ruim e a
+        probabilidade de entrar nele ajustada para que a taxa média seja taxa_erro.
+        """
+        if self.rajada <= 0 or self.taxa_erro == 0:
+            return CanalBernoulli(self.taxa_erro, semente)
+        fracao_ruim: float = min(2 * self.taxa_erro, 0.999)  # Fração do tempo no estado ruim
+        p_ruim_bom: float = 1 / self.rajada
+        return CanalGilbertElliott(min(fracao_ruim * p_ruim_bom / (1 - fracao_ruim), 1.0), p_ruim_bom, 0.0, 0.5, semente)
+
+
+@dataclass
+class Contagem:
+    """
+    Contadores acumulados de um lote de mensagens (somados entre os processos).
+    """
+    mensagens: int = 0
+    bits_carga: int = 0  # Bits de carga útil transmitidos
+    bits_canal: int = 0  # Bits entregues à camada física (com enquadramento e redundância)
+    erros_canal: int = 0  # Bits invertidos pelo canal
+    erros_bit: int = 0  # Bits errados na carga útil recebida
+    erros_quadro: int = 0  # Mensagens recebidas diferentes da enviada
+    erros_residuais: int = 0  # Mensagens erradas que passaram pela verificação (erro não detectado)
+    descartadas: int = 0  # Mensagens em que a verificação acusou erro
+    bits_uteis: int = 0  # Bits de carga útil entregues corretamente e aceitos pela verificação
+    segundos: float = 0.0  # Tempo de processamento somado dos trabalhadores
+
+    def __add__(self, outra: "Contagem") -> "Contagem":
+        return Contagem(*(a + b for a, b in zip(vars(self).values(), vars(outra).values())))
+
+
+@dataclass
+class ResultadoCenario:
+    """
+    Métricas de um cenário.
+
+    Atributos:
+        ber_canal: Taxa de erro de bit efetivamente aplicada pelo canal.
+        ber: Taxa de erro de bit da carga útil entregue ao destino (após correção e desenquadramento).
+        fer: Taxa de erro de quadro: fração das mensagens recebidas com qualquer diferença.
+        erro_residual: Fração das mensagens erradas que a verificação (CRC, paridade, Hamming) não detectou.
+        goodput: Bits úteis entregues corretamente por bit transmitido no canal (eficiência do enlace).
+        vazao: Bits de carga útil simulados por segundo de processamento.
+    """
+    cenario: Cenario
+    contagem: Contagem = field(repr=False)
+    ber_canal: float = 0.0
+    ber: float = 0.0
+    fer: float = 0.0
+    erro_residual: float = 0.0
+    goodput: float = 0.0
+    vazao: float = 0.0
+
+    @classmethod
+    def de_contagem(cls, cenario: Cenario, contagem: Contagem) -> "ResultadoCenario":
+        return cls(
+            cenario, contagem,
+            ber_canal=contagem.erros_canal / max(contagem.bits_canal, 1),
+            ber=contagem.erros_bit / max(contagem.bits_carga, 1),
+            fer=contagem.erros_quadro / max(contagem.mensagens, 1),
+            erro_residual=contagem.erros_residuais / max(contagem.erros_quadro, 1),
+            goodput=contagem.bits_uteis / max(contagem.bits_canal, 1),
+            vazao=contagem.bits_carga / contagem.segundos if contagem.segundos else 0.0,
+        )
+
+    def como_dict(self) -> dict:
+        """
+        Linha plana com a configuração e as métricas, para gravar em JSON ou CSV.
+        """
+        config: LinkConfig = self.cenario.config
+        return {
+            "enquadramento": config.enquadramento, "deteccao_correcao": config.deteccao_correcao,
+            "mod_digital": config.mod_digital, "mod_portadora": config.mod_portadora, "taxa_erro": self.cenario.taxa_erro, "rajada": self.cenario.rajada, "ebn0_db": self.cenario.ebn0_db,
+            "mensagens": self.contagem.mensagens, "ber_canal": self.ber_canal, "ber": self.ber, "fer": self.fer,
+            "erro_residual": self.erro_residual, "goodput": self.goodput, "vazao": self.vazao,
+        }
+
+
+def _bits_diferentes(enviado: bytes, recebido: bytes) -> int:
+    """
+    Conta os bits diferentes entre a carga enviada e a recebida; bytes faltando ou sobrando contam como 8 erros.
+    """
+    n: int = min(len(enviado), len(recebido))
+    diferentes: int = (BitBuffer(enviado[:n]) ^ BitBuffer(recebido[:n])).popcount()
+    return diferentes + 8 * abs(len(enviado) - len(recebido))
+
+
+def simular_lote(cenario: Cenario, n_mensagens: int, tamanho: int, semente: np.random.SeedSequence) -> Contagem:
+    """
+    Transmite n_mensagens cargas aleatórias de `tamanho` bytes pelo cenário, invertendo cada bit do trem de bits com
+    probabilidade média taxa_erro (em rajadas, se configurado) antes da codificação de linha (o mesmo ponto em que a
+    interface insere erros) e, se ebn0_db for dada, somando ruído gaussiano à onda modulada.
+
+    Executado nos processos trabalhadores; o resultado só depende da semente.
+    """
+    gerador: np.random.Generator = np.random.default_rng(semente)
+    canal: ModeloErro = cenario.criar_canal(gerador)  # Compartilha o gerador: o lote continua dependendo só da semente
+    # O canal analógico é o do Pipeline, com a semente tirada do mesmo gerador
+    pipeline: Pipeline = Pipeline(replace(cenario.config, ebn0_db=cenario.ebn0_db, semente_canal=int(gerador.integers(1 << 62))))
+    contagem: Contagem = Contagem()
+    inicio: float = time.perf_counter()
+    for _ in range(n_mensagens):
+        carga: bytes = gerador.integers(0, 256, tamanho, dtype=np.uint8).tobytes()
+        bit_stream: BitBuffer = pipeline.codificar_enlace(carga)
+        mascara: BitBuffer = canal.mascara(len(bit_stream))
+        dig_signal: np.ndarray = pipeline.codificar_linha(bit_stream ^ mascara)
+        # Ruído na própria onda, se houver Eb/N0: exercita os limiares e a detecção dos demoduladores do receptor
+        wave = pipeline.canal(pipeline.modular(dig_signal))
+        recepcao = pipeline.receber(wave, len(dig_signal))
+
+        erros: int = _bits_diferentes(carga, recepcao.dados)
+        contagem.mensagens += 1
+        contagem.bits_carga += 8 * tamanho
+        contagem.bits_canal += len(bit_stream)
+        contagem.erros_canal += mascara.popcount()
+        contagem.erros_bit += erros
+        contagem.erros_quadro += erros > 0
+        contagem.erros_residuais += erros > 0 and recepcao.integro
+        contagem.descartadas += not recepcao.integro
+        contagem.bits_uteis += 8 * tamanho if erros == 0 and recepcao.integro else 0
+        if recepcao.quadros_descartados:
+            # Verificação por quadro: os quadros íntegros foram entregues e contam como úteis se estiverem corretos
+            descartados: set[int] = set(recepcao.quadros_descartados)
+            cargas, _ = pipeline.verificar_quadros(pipeline.separar_quadros(pipeline.enquadrar(carga)))
+            esperado: bytes = b"".join(carga_quadro for indice, carga_quadro in enumerate(cargas) if indice not in descartados)
+            contagem.bits_uteis += 8 * len(esperado) if recepcao.dados == esperado else 0
+    contagem.segundos = time.perf_counter() - inicio
+    return contagem
+
+
+def criar_cenarios(base: LinkConfig, enquadramentos: list[str], deteccoes: list[str], mods_digitais: list[str],
+                   mods_portadora: list[str], taxas_erro: list[float], rajada: float = 0.0,
+                   ebn0s_db: list[float | None] = (None,)) -> list[Cenario]:
+    """
+    Gera o produto cartesiano enquadramento x detecção/correção x codificação de linha x portadora x taxa de erro x
+    Eb/N0, a partir dos parâmetros de portadora de `base`.
+    """
+    return [
+        Cenario(replace(base, enquadramento=enquadramento, deteccao_correcao=deteccao, mod_digital=mod_digital, mod_portadora=mod_portadora), taxa, rajada, ebn0)
+        for enquadramento, deteccao, mod_digital, mod_portadora, taxa, ebn0
+        in itertools.product(enquadramentos, deteccoes, mods_digitais, mods_portadora, taxas_erro, ebn0s_db)
+    ]
+
+
+def simular(cenarios: list[Cenario], n_mensagens: int = 1000, tamanho: int = 32, semente: int = 0,
+            n_processos: int | None = None, tamanho_lote: int = 100) -> list[ResultadoCenario]:
+    """
+    Executa a simulação de Monte Carlo de todos os cenários em um pool de processos.
+
+    Cada cenário é dividido em lotes de até tamanho_lote mensagens. As sementes dos lotes são derivadas de `semente`
+    com SeedSequence.spawn, na ordem dos cenários e dos lotes, então os resultados são os mesmos para qualquer número
+    de processos.
+
+    Args:
+        cenarios (list[Cenario]): Os cenários a simular (ver criar_cenarios).
+        n_mensagens (int): Número de mensagens aleatórias por cenário.
+        tamanho (int): Tamanho de cada mensagem, em bytes.
+        semente (int): Semente da simulação.
+        n_processos (int, opcional): Número de processos do pool. Padrão: um por CPU. Com 1, executa no próprio processo.
+        tamanho_lote (int): Número máximo de mensagens por tarefa enviada a um processo.
+
+    Returns:
+        list[ResultadoCenario]: Um resultado por cenário, na mesma ordem.
+    """
+    tarefas: list[tuple[int, Cenario, int, np.random.SeedSequence]] = []
+    for indice, (cenario, semente_cenario) in enumerate(zip(cenarios, np.random.SeedSequence(semente).spawn(len(cenarios)))):
+        lotes: list[int] = [min(tamanho_lote, n_mensagens - i) for i in range(0, n_mensagens, tamanho_lote)]
+        for n, semente_lote in zip(lotes, semente_cenario.spawn(len(lotes))):
+            tarefas.append((indice, cenario, n, semente_lote))
+
+    contagens: list[Contagem] = [Contagem() for _ in cenarios]
+    if n_processos == 1:
+        parciais = (simular_lote(cenario, n, tamanho, semente_lote) for _, cenario, n, semente_lote in tarefas)
+        for (indice, *_), parcial in zip(tarefas, parciais):
+            contagens[indice] += parcial
+    else:
+        with ProcessPoolExecutor(max_workers=n_processos) as executor:
+            futuros = [executor.submit(simular_lote, cenario, n, tamanho, semente_lote) for _, cenario, n, semente_lote in tarefas]
+            for (indice, *_), futuro in zip(tarefas, futuros):
+                contagens[indice] += futuro.result()
+    return [ResultadoCenario.de_contagem(cenario, contagem) for cenario, contagem in zip(cenarios, contagens)]
\ No newline at end of file
@@ -1,4 +1,6 @@
 from .camada_fisica import CamadaFisicaTransmissor
 from .camada_enlace import CamadaEnlaceTransmissor
+from .enquadradores import Enquadrador, EnquadradorContagem, EnquadradorVarint, EnquadradorInsercao, MTU_MAXIMO, varint
 
-__all__ = ["CamadaFisicaTransmissor", "CamadaEnlaceTransmissor"]
\ No newline at end of file
+__all__ = ["CamadaFisicaTransmissor", "CamadaEnlaceTransmissor", "Enquadrador", "EnquadradorContagem", "EnquadradorVarint", "EnquadradorInsercao",
+           "MTU_MAXIMO", "varint"]
\ No newline at end of file
@@ -1,64 +1,74 @@
 from math import sin, cos, ceil, pi
+import numpy as np
+from src.utils import BitBuffer
 
 class CamadaFisicaTransmissor:
-    def __init__(self, sample: int = 100, frequencia: float = 1.0, amplitude: float = 1.0, fase: float = 1.0) -> None:
+    BACKENDS: tuple[str, ...] = ("python", "numpy")  # Implementações disponíveis para a modulação por portadora
+
+    def __init__(self, sample: int = 100, frequencia: float = 1.0, amplitude: float = 1.0, fase: float = 1.0, backend: str = "python") -> None:
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend desconhecido: {backend}. Use um de {self.BACKENDS}")
         self.sample: int = sample
         self.frequencia: float = frequencia
         self.amplitude: float = amplitude
         self.fase: float = fase
+        self.backend: str = backend
+        # Constelação 8-QAM, cada trio de bits mapeado para um número complexo (I + jQ)
+        self.CONSTELACAO_QAM8: dict[str, complex] = {
+            "000": 1 + 1j, "001": 1 - 1j, "010": -1 + 1j,
+            "011": -1 - 1j, "100": 1/3 + 1/3j, "101": 1/3 - 1/3j,
+            "110": -1/3 + 1/3j, "111": -1/3 - 1/3j
+        }
 
-    def gerador_bit_stream(self, mensagem: str) -> list[bool]:
+    def gerador_bit_stream(self, mensagem: BitBuffer | str) -> BitBuffer:
         """
-        Converte uma mensagem em um trem de bits (lista de booleanos).
-        Verificamos se a mensagem só tem 0s e 1s, mas esse sempre será o caso
+        Converte a saída da camada de enlace em um trem de bits compactado.
+        Aceita também uma string de '0's e '1's, o formato usado anteriormente entre as camadas.
         """
-        return [True if char == '1' else False for char in mensagem]
+        return BitBuffer.from_string(mensagem) if isinstance(mensagem, str) else mensagem
 
     # Modulação Digital
-    def nrz_polar(self, bit_stream: list[bool]) -> list[int]:
+    def nrz_polar(self, bit_stream: BitBuffer | list[bool]) -> np.ndarray:
         """
         Realiza a modulação NRZ-Polar (Non-Return-to-Zero).
         Converte True para 1 e False para -1.
         """
-        return [1 if bit else -1 for bit in bit_stream]
+        bits: np.ndarray = self._bits(bit_stream).astype(np.int8)
+        return bits * 2 - 1
 
-    def manchester(self, bit_stream: list[bool]) -> list[int]:
+    def manchester(self, bit_stream: BitBuffer | list[bool]) -> np.ndarray:
         """
         Realiza a modulação Manchester.
-        Codifica cada bit com o XOR entre o bit e o clock, alternando o clock a cada ciclo.
+        Codifica cada bit com o XOR entre o bit e o clock, que vale 0 na primeira metade do bit e 1 na segunda.
         """
-        i: int = 0  # Índice do bit stream
-        clk: bool = 0  # Estado inicial do clock
-        dig_signal: list[int] = []  # Sinal digital gerado
-
-        while i < len(bit_stream):  # Enquanto não processar todos os bits
-            dig_signal.append(int(bit_stream[i] ^ clk))  # XOR do bit com o clock
-            i += 1 * clk  # Incrementa o índice apenas quando o clock está em alta
-            clk = not clk  # Alterna o estado do clock
+        bits: np.ndarray = self._bits(bit_stream).astype(np.int8)
+        dig_signal: np.ndarray = np.empty(2 * len(bits), dtype=np.int8)  # Sinal digital gerado
+        dig_signal[0::2] = bits  # XOR do bit com o clock em baixa
+        dig_signal[1::2] = bits ^ 1  # XOR do bit com o clock em alta
         return dig_signal
 
-    def bipolar(self, bit_stream: list[bool]) -> list[int]:
+    def bipolar(self, bit_stream: BitBuffer | list[bool]) -> np.ndarray:
         """
         Realiza a modulação bipolar.
         Alterna entre +1 e -1 para bits 1, mantendo 0 para bits 0.
         """
-        last_one: int = -1  # Último valor usado para bit 1 (+1 ou -1)
-        dig_signal: list[int] = []
+        bits: np.ndarray = self._bits(bit_stream).astype(np.int8)
+        # O k-ésimo bit 1 vale +1 quando k é ímpar e -1 quando k é par
+        ordem: np.ndarray = np.cumsum(bits, dtype=np.int64)
+        return np.where(ordem % 2 == 1, 1, -1).astype(np.int8) * bits
 
-        for bit in bit_stream:
-            if not bit:
-                dig_signal.append(0)  # Adiciona 0 para bits 0
-            else:
-                last_one = -last_one  # Alterna o valor de last_one
-                dig_signal.append(last_one)  # Adiciona +1 ou -1 para bits 1
-        return dig_signal
+    def _bits(self, bit_stream: BitBuffer | list[bool]) -> np.ndarray:
+        return bit_stream.unpack() if isinstance(bit_stream, BitBuffer) else np.asarray(bit_stream, dtype=np.uint8)
 
     # Modulação por portadora
-    def ask(self, dig_signal: list[int], mod_digital: str, amp_zero: int = 0, amp_one: int = 1) -> list[float]:
+    def ask(self, dig_signal: list[int], mod_digital: str, amp_zero: int = 0, amp_one: int = 1) -> list[float] | np.ndarray:
         """
         Realiza a modulação ASK (Amplitude Shift Keying).
         Modula o sinal digital utilizando diferentes amplitudes para 0 e 1.
+        Com o backend "numpy", retorna um np.ndarray com as mesmas amostras.
         """
+        if self.backend == "numpy":
+            return self._ask_numpy(dig_signal, mod_digital, amp_zero, amp_one)
         signal: list[float] = [0.0] * (len(dig_signal) * self.sample)  # Inicializa o sinal modulado
         nrz_polar: bool = mod_digital == "NRZ-Polar"  # Verifica se a modulação digital é NRZ-Polar
 
@@ -71,11 +81,14 @@ class CamadaFisicaTransmissor:
                     signal[i * self.sample + j] = amp_zero * sin(2*pi*self.frequencia*t + self.fase)  # Sinal para 0 (ou -1 se for NRZ-Polar)
         return signal
 
-    def fsk(self, dig_signal: list[int], mod_digital: str, f_zero: float = 0.0, f_one: float = 1.0) -> list[float]:
+    def fsk(self, dig_signal: list[int], mod_digital: str, f_zero: float = 0.0, f_one: float = 1.0) -> list[float] | np.ndarray:
         """
         Realiza a modulação FSK (Frequency Shift Keying).
         Modula o sinal digital utilizando diferentes frequências para 0 e 1.
+        Com o backend "numpy", retorna um np.ndarray com as mesmas amostras.
         """
+        if self.backend == "numpy":
+            return self._fsk_numpy(dig_signal, mod_digital, f_zero, f_one)
         signal: list[float] = [0.0] * (len(dig_signal) * self.sample)  # Inicializa o sinal modulado
         nrz_polar: bool = mod_digital == "NRZ-Polar"  # Verifica se a modulação digital é NRZ-Polar
 
@@ -88,17 +101,33 @@ class CamadaFisicaTransmissor:
                     signal[i * self.sample + j] = self.amplitude * sin(2*pi*f_zero*t + self.fase) # Sinal para 0 (ou -1 se for NRZ-Polar)
         return signal
 
-    def qam8_modulation(self, dig_signal: list[int], mod_digital: str) -> list[float]:
+    def mfsk(self, dig_signal: list[int], mod_digital: str, frequencias: list[float]) -> np.ndarray:
+        """
+        Realiza a modulação M-FSK (FSK M-ária).
+        Agrupa os bits em símbolos de log2(M) bits e transmite cada símbolo com uma das M frequências (o símbolo de valor i usa frequencias[i]).
+        Como no 8-QAM, o sinal é completado com zeros à esquerda até um múltiplo de log2(M) bits.
+        Usa sempre o caminho vetorizado, com as mesmas expressões de amostra do FSK binário.
+        """
+        M: int = len(frequencias)
+        if M < 2 or M & (M - 1):
+            raise ValueError(f"O M-FSK precisa de uma quantidade de frequências que seja potência de 2 (recebeu {M})")
+        k: int = M.bit_length() - 1  # Bits por símbolo
+        bits: np.ndarray = self._classes_binarias(dig_signal, mod_digital)
+        bits = np.concatenate([np.zeros(-len(bits) % k, dtype=np.intp), bits])  # Preenche com zeros à esquerda até ser divisível por k
+        indices: np.ndarray = bits.reshape(-1, k) @ (1 << np.arange(k - 1, -1, -1))  # Cada grupo de k bits vira o índice da frequência
+        modelos: np.ndarray = np.array([self._portadora(self.amplitude, frequencia, self.fase) for frequencia in frequencias])
+        return modelos[indices].ravel()
+
+    def qam8_modulation(self, dig_signal: list[int], mod_digital: str) -> list[float] | np.ndarray:
         """
         Realiza a modulação 8-QAM.
         Modula o sinal digital utilizando uma constelação de 8 símbolos, cada um mapeado para um número complexo.
+        Com o backend "numpy", retorna um np.ndarray com as mesmas amostras (sem alterar dig_signal).
         """
+        if self.backend == "numpy":
+            return self._qam8_numpy(dig_signal, mod_digital)
         signal: list[float] = [0.0] * (ceil(len(dig_signal) / 3) * self.sample)  # Inicializa o sinal modulado
-        constellation: dict[str, complex] = {
-            "000": 1 + 1j, "001": 1 - 1j, "010": -1 + 1j,
-            "011": -1 - 1j, "100": 1/3 + 1/3j, "101": 1/3 - 1/3j,
-            "110": -1/3 + 1/3j, "111": -1/3 - 1/3j
-        }
+        constellation: dict[str, complex] = self.CONSTELACAO_QAM8
 
         while len(dig_signal) % 3:  # Preenche o bit stream com zeros para ser divisível por 3
             dig_signal.insert(0, 0)
@@ -116,3 +145,45 @@ class CamadaFisicaTransmissor:
                 t: float = j / self.sample
                 signal[i * self.sample + j] = symbols[i].real * cos(2*pi*self.frequencia*t) + symbols[i].imag * sin(2*pi*self.frequencia*t) # Gera o sinal com base na função S(t)=I⋅cos(2πft)+Q⋅sin(2πft)
         return signal
+
+    # Backend vetorizado (NumPy)
+    def _portadora(self, amplitude: float, frequencia: float, fase: float) -> list[float]:
+        """
+        Gera as amostras de um período de símbolo da portadora A * sen(2pi*f*t + ø).
+        Usa exatamente a mesma expressão do laço em Python puro, para que as amostras sejam idênticas.
+        """
+        return [amplitude * sin(2*pi*frequencia*(j / self.sample) + fase) for j in range(self.sample)]
+
+    def _classes_binarias(self, dig_signal: list[int], mod_digital: str) -> np.ndarray:
+        """
+        Classifica cada nível do sinal digital como símbolo 0 ou 1 da portadora, seguindo a mesma regra do laço em Python puro:
+        em NRZ-Polar só o nível 1 é símbolo 1; nas demais modulações, os níveis 1 e -1 são símbolo 1.
+        """
+        niveis: np.ndarray = np.asarray(dig_signal, dtype=np.int8)
+        if mod_digital == "NRZ-Polar":
+            return (niveis == 1).astype(np.intp)
+        return (np.abs(niveis) == 1).astype(np.intp)
+
+    def _ask_numpy(self, dig_signal: list[int], mod_digital: str, amp_zero: float, amp_one: float) -> np.ndarray:
+        # Um modelo de portadora por classe de símbolo; o sinal é obtido indexando a tabela de modelos
+        modelos: np.ndarray = np.array([self._portadora(amp_zero, self.frequencia, self.fase),
+                                        self._portadora(amp_one, self.frequencia, self.fase)])
+        return modelos[self._classes_binarias(dig_signal, mod_digital)].ravel()
+
+    def _fsk_numpy(self, dig_signal: list[int], mod_digital: str, f_zero: float, f_one: float) -> np.ndarray:
+        modelos: np.ndarray = np.array([self._portadora(self.amplitude, f_zero, self.fase),
+                                        self._portadora(self.amplitude, f_one, self.fase)])
+        return modelos[self._classes_binarias(dig_signal, mod_digital)].ravel()
+
+    def _qam8_numpy(self, dig_signal: list[int], mod_digital: str) -> np.ndarray:
+        niveis: np.ndarray = np.asarray(dig_signal, dtype=np.int8)
+        # Mesmo mapeamento de níveis para bits do laço em Python puro (-1 vira 0, exceto no Bipolar)
+        bits: np.ndarray = np.abs(niveis) == 1 if mod_digital == "Bipolar" else niveis == 1
+        bits = np.concatenate([np.zeros(-len(bits) % 3, dtype=bool), bits])  # Preenche com zeros à esquerda até ser divisível por 3
+        indices: np.ndarray = bits.reshape(-1, 3).astype(np.intp) @ np.array([4, 2, 1])  # Cada trio de bits vira o índice do símbolo
+        # A ordem da constelação ("000" a "111") coincide com o índice binário do trio
+        modelos: np.ndarray = np.array([
+            [simbolo.real * cos(2*pi*self.frequencia*(j / self.sample)) + simbolo.imag * sin(2*pi*self.frequencia*(j / self.sample)) for j in range(self.sample)]
+            for simbolo in self.CONSTELACAO_QAM8.values()
+        ])
+        return modelos[indices].ravel()
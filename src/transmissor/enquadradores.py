@@ -0,0 +1,153 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
+from src.utils import VerificacaoQuadro
+
+MTU_MAXIMO: int = 1 << 16  # Maior carga útil por quadro (64 KB)
+VARINT_MAXIMO: int = 3  # Bytes do maior cabeçalho varint: 21 bits cobrem o MTU máximo mais o trailer
+
+
+def varint(valor: int) -> bytes:
+    """
+    Codifica um inteiro não negativo como varint (LEB128): 7 bits por byte, do menos significativo ao mais
+    significativo, com o bit mais alto de cada byte indicando que o número continua no byte seguinte.
+
+    Exemplo:
+        varint(4)     # b"\x04"
+        varint(1500)  # b"\xdc\x0b"
+    """
+    saida: bytearray = bytearray()
+    while valor > 0x7F:
+        saida.append(valor & 0x7F | 0x80)
+        valor >>= 7
+    saida.append(valor)
+    return bytes(saida)
+
+
+class Enquadrador(ABC):
+    """
+    Base dos enquadradores incrementais: recebe a carga útil em pedaços de qualquer tamanho e devolve os quadros
+    assim que eles ficam completos.
+
+    Os bytes que ainda não formam um quadro inteiro ficam guardados entre as chamadas, de modo que cada byte de
+    entrada é copiado uma única vez (tempo linear), independentemente de como a entrada foi dividida.
+
+    Com uma verificação por quadro, cada carga útil recebe o seu trailer (CRC-32 ou paridade) antes de ser
+    enquadrada; os trailers dos quadros completados numa mesma chamada são calculados juntos.
+
+    Exemplo:
+        enquadrador = EnquadradorContagem(maxFrameSize=4)
+        enquadrador.alimentar(b"Ola, ")  # [b"\\x04Ola,"]
+        enquadrador.alimentar(b"mundo")  # [b"\\x04 mun"]
+        enquadrador.finalizar()          # [b"\\x02do"]
+    """
+
+    def __init__(self, maxFrameSize: int = 4, verificacao: VerificacaoQuadro | None = None) -> None:
+        if not 1 <= maxFrameSize <= MTU_MAXIMO:
+            raise ValueError(f"O tamanho máximo do quadro deve estar entre 1 e {MTU_MAXIMO} bytes")
+        self.maxFrameSize: int = maxFrameSize
+        self.verificacao: VerificacaoQuadro | None = verificacao
+        self._pendente: bytearray = bytearray()  # Carga útil do quadro incompleto
+
+    @abstractmethod
+    def _quadro(self, carga: bytes | memoryview) -> bytes:
+        """
+        Monta um quadro a partir da sua carga útil. Implementado por cada técnica de enquadramento.
+        """
+
+    def _montar(self, cargas: list[bytes | memoryview]) -> list[bytes]:
+        """
+        Monta os quadros de várias cargas úteis, anexando antes os trailers da verificação por quadro, se houver.
+        """
+        if self.verificacao is not None and cargas:
+            cargas = self.verificacao.anexar(cargas)
+        return [self._quadro(carga) for carga in cargas]
+
+    def alimentar(self, dados: bytes | bytearray | memoryview) -> list[bytes]:
+        """
+        Acrescenta um pedaço da carga útil.
+
+        Args:
+            dados (bytes): O próximo pedaço do fluxo de bytes.
+
+        Returns:
+            list[bytes]: Os quadros completados por este pedaço, na ordem de transmissão.
+        """
+        visao: memoryview = memoryview(dados).cast("B")
+        cargas: list[bytes | memoryview] = []
+        i: int = 0
+        if self._pendente:
+            # Completa primeiro o quadro que ficou pela metade na chamada anterior
+            i = min(self.maxFrameSize - len(self._pendente), len(visao))
+            self._pendente += visao[:i]
+            if len(self._pendente) < self.maxFrameSize:
+                return []
+            cargas.append(self._pendente)
+            self._pendente = bytearray()
+        # Quadros inteiros são montados diretamente a partir de fatias (sem cópia) da entrada
+        while len(visao) - i >= self.maxFrameSize:
+            cargas.append(visao[i:i + self.maxFrameSize])
+            i += self.maxFrameSize
+        self._pendente += visao[i:]
+        return self._montar(cargas)
+
+    def finalizar(self) -> list[bytes]:
+        """
+        Encerra o fluxo, devolvendo o último quadro (menor que maxFrameSize), se houver.
+        """
+        if not self._pendente:
+            return []
+        quadros: list[bytes] = self._montar([self._pendente])
+        self._pendente = bytearray()
+        return quadros
+
+    def enquadrar(self, pedacos: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Enquadra um fluxo inteiro (ex.: um arquivo lido em blocos), produzindo os quadros à medida que ficam prontos.
+        """
+        for pedaco in pedacos:
+            yield from self.alimentar(pedaco)
+        yield from self.finalizar()
+
+
+class EnquadradorContagem(Enquadrador):
+    """
+    Enquadramento por contagem de caracteres: cada quadro é precedido por um byte com o tamanho da carga útil.
+    """
+
+    def __init__(self, maxFrameSize: int = 4, verificacao: VerificacaoQuadro | None = None) -> None:
+        # O byte de tamanho conta também o trailer da verificação por quadro
+        if maxFrameSize + (verificacao.tamanho if verificacao is not None else 0) > 255:
+            raise ValueError("Na contagem de caracteres o tamanho do quadro deve caber em um byte (máximo 255)")
+        super().__init__(maxFrameSize, verificacao)
+
+    def _quadro(self, carga: bytes | memoryview) -> bytes:
+        return bytes([len(carga)]) + carga
+
+
+class EnquadradorVarint(Enquadrador):
+    """
+    Enquadramento por contagem com cabeçalho varint: o tamanho da carga útil (com o trailer, se houver) é escrito em
+    1 byte até 127, 2 bytes até 16383 e 3 bytes até o MTU máximo, então quadros grandes (jumbo) custam só 2 ou 3
+    bytes de cabeçalho, sem o limite de 255 bytes da contagem de caracteres.
+    """
+
+    def _quadro(self, carga: bytes | memoryview) -> bytes:
+        return varint(len(carga)) + carga
+
+
+class EnquadradorInsercao(Enquadrador):
+    """
+    Enquadramento por inserção de bytes: a carga útil fica entre dois bytes de FLAG, e cada FLAG ou ESC da carga é
+    precedido por um ESC.
+    """
+
+    def __init__(self, maxFrameSize: int = 4, flag: bytes = bytes([22]), esc: bytes = bytes([27]),
+                 verificacao: VerificacaoQuadro | None = None) -> None:
+        super().__init__(maxFrameSize, verificacao)
+        self.FLAG: bytes = flag
+        self.ESC: bytes = esc
+
+    def _quadro(self, carga: bytes | memoryview) -> bytes:
+        # O ESC é escapado primeiro, para não duplicar os ESCs inseridos antes das FLAGs
+        carga = bytes(carga).replace(self.ESC, self.ESC + self.ESC).replace(self.FLAG, self.ESC + self.FLAG)
+        return self.FLAG + carga + self.FLAG
\ No newline at end of file
@@ -2,5 +2,10 @@ from .bytes_to_string import bytes_to_string
 from .listBool_to_bytes import listBool_to_bytes
 from .string_to_byte_stream import string_to_byte_stream
 from .text_to_bytes import text_to_bytes
+from .crc32 import CRC32
+from .bitbuffer import BitBuffer
+from .hamming import CodigoHamming, CODIGOS_HAMMING
+from .verificacao_quadro import VerificacaoQuadro, VERIFICACOES_QUADRO
+from .decimacao import decimar_min_max, GraficoDecimado
 
-__all__ = ["bytes_to_string", "listBool_to_bytes", "string_to_byte_stream", "text_to_bytes"]
\ No newline at end of file
+__all__ = ["bytes_to_string", "listBool_to_bytes", "string_to_byte_stream", "text_to_bytes", "CRC32", "BitBuffer", "CodigoHamming", "CODIGOS_HAMMING", "VerificacaoQuadro", "VERIFICACOES_QUADRO", "decimar_min_max", "GraficoDecimado"]
\ No newline at end of file
@@ -0,0 +1,130 @@
+from typing import Iterable, Iterator
+import numpy as np
+
+# Quantidade de bits 1 em cada valor de byte, usada na contagem em bloco
+_POPCOUNT: np.ndarray = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class BitBuffer:
+    """
+    Sequência de bits compactada, 8 bits por byte (o primeiro bit é o mais significativo do primeiro byte).
+
+    Substitui as strings de '0'/'1' e as listas de booleanos entre as camadas: ocupa 1 bit por bit em vez de dezenas
+    de bytes por objeto Python. Os bits de preenchimento do último byte são sempre 0.
+
+    A conversão a partir de bytes não copia os dados, e view() expõe os bytes compactados sem cópia. As operações em
+    bloco (unpack, pack, xor, popcount, fatiamento, concatenação) são feitas pelo NumPy sobre o array inteiro.
+
+    Exemplo:
+        bits = BitBuffer(b"A")             # 01000001
+        str(bits[1:4])                     # "100"
+        (bits ^ BitBuffer(b"\\x01")).to_bytes()  # b"@"
+    """
+    __slots__ = ("_dados", "_n")
+
+    def __init__(self, dados: bytes | bytearray | memoryview | np.ndarray = b"", n_bits: int | None = None) -> None:
+        """
+        Args:
+            dados: Os bytes compactados. bytes, bytearray e memoryview são usados sem cópia.
+            n_bits (int, opcional): O número de bits válidos. Padrão: 8 bits por byte.
+        """
+        self._dados: np.ndarray = dados if isinstance(dados, np.ndarray) else np.frombuffer(dados, dtype=np.uint8)
+        self._n: int = len(self._dados) * 8 if n_bits is None else n_bits
+        if not 0 <= self._n <= len(self._dados) * 8 or len(self._dados) != (self._n + 7) // 8:
+            raise ValueError(f"{len(self._dados)} bytes não comportam exatamente {self._n} bits")
+        if self._n % 8 and self._dados[-1] & (0xFF >> (self._n % 8)):
+            # Garante que os bits de preenchimento são 0 (só copia os dados quando é preciso zerá-los)
+            self._dados = self._dados.copy()
+            self._dados[-1] &= (0xFF << (8 - self._n % 8)) & 0xFF
+
+    # CONVERSÕES
+    @classmethod
+    def pack(cls, bits: Iterable | np.ndarray) -> "BitBuffer":
+        """
+        Compacta uma sequência de bits (booleanos, 0/1 ou um array NumPy) em um BitBuffer.
+        """
+        array: np.ndarray = np.asarray(bits if isinstance(bits, np.ndarray) else list(bits), dtype=bool)
+        return cls(np.packbits(array), len(array))
+
+    @classmethod
+    def from_string(cls, bits: str) -> "BitBuffer":
+        """
+        Converte uma string de '0'/'1' (o formato usado anteriormente entre as camadas) em um BitBuffer.
+        """
+        return cls.pack(np.frombuffer(bits.encode("ascii"), dtype=np.uint8) == ord("1"))
+
+    @classmethod
+    def wrap(cls, dados: "BitBuffer | bytes | bytearray | memoryview") -> "BitBuffer":
+        """
+        Retorna o próprio BitBuffer ou envolve bytes em um BitBuffer, sem cópia.
+        """
+        return dados if isinstance(dados, BitBuffer) else cls(dados)
+
+    def unpack(self) -> np.ndarray:
+        """
+        Retorna os bits como um array de uint8 com valores 0 e 1.
+        """
+        return np.unpackbits(self._dados, count=self._n)
+
+    def to_bytes(self) -> bytes:
+        """
+        Retorna os bytes compactados (o último byte é completado com zeros à direita).
+        """
+        return self._dados.tobytes()
+
+    def view(self) -> memoryview:
+        """
+        Retorna os bytes compactados sem cópia.
+        """
+        return memoryview(self._dados)
+
+    def copy(self) -> "BitBuffer":
+        return BitBuffer(self._dados.copy(), self._n)
+
+    # OPERAÇÕES EM BLOCO
+    def popcount(self) -> int:
+        """
+        Retorna a quantidade de bits 1.
+        """
+        return int(_POPCOUNT[self._dados].sum(dtype=np.int64))
+
+    def __xor__(self, outro: "BitBuffer") -> "BitBuffer":
+        if len(outro) != self._n:
+            raise ValueError(f"XOR entre sequências de tamanhos diferentes ({self._n} e {len(outro)} bits)")
+        return BitBuffer(np.bitwise_xor(self._dados, outro._dados), self._n)
+
+    def __add__(self, outro: "BitBuffer") -> "BitBuffer":
+        if self._n % 8 == 0:  # Alinhado ao byte: basta concatenar os bytes compactados
+            return BitBuffer(np.concatenate([self._dados, outro._dados]), self._n + len(outro))
+        return BitBuffer.pack(np.concatenate([self.unpack(), outro.unpack()]))
+
+    def __getitem__(self, indice: int | slice) -> "bool | BitBuffer":
+        if isinstance(indice, slice):
+            inicio, fim, passo = indice.indices(self._n)
+            if passo == 1 and inicio % 8 == 0:  # Fatia alinhada ao byte: reaproveita os bytes compactados
+                fim = max(fim, inicio)
+                return BitBuffer(self._dados[inicio // 8:(fim + 7) // 8], fim - inicio)
+            return BitBuffer.pack(self.unpack()[indice])
+        if indice < 0:
+            indice += self._n
+        if not 0 <= indice < self._n:
+            raise IndexError("índice fora do BitBuffer")
+        return bool(self._dados[indice // 8] >> (7 - indice % 8) & 1)
+
+    # PROTOCOLO DE SEQUÊNCIA
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self) -> Iterator[bool]:
+        return iter(self.unpack().astype(bool).tolist())
+
+    def __eq__(self, outro: object) -> bool:
+        if not isinstance(outro, BitBuffer):
+            return NotImplemented
+        return self._n == len(outro) and np.array_equal(self._dados, outro._dados)
+
+    def __str__(self) -> str:
+        return (self.unpack() + ord("0")).tobytes().decode("ascii")
+
+    def __repr__(self) -> str:
+        return f"BitBuffer('{self if self._n <= 64 else str(self[:64]) + '...'}', n_bits={self._n})"
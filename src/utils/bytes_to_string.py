@@ -1,3 +1,5 @@
+from .bitbuffer import BitBuffer
+
 def bytes_to_string(byte_stream: bytes):
     """
     Converte um bytestream (sequência de bytes) em uma string.
@@ -6,8 +8,7 @@ def bytes_to_string(byte_stream: bytes):
         byte_stream (bytes): O bytestream a ser convertido.
 
     Retorna:
-        str: A string resultante da conversão.
+        str: A string resultante da conversão, com 8 caracteres '0'/'1' por byte.
     """
-    # Em f'{byte:08b}' o f cria uma f-string, que permite inserir valores formatados dentro de {}
-    # byte:08b formata o byte convertendo ele para binário (b) e garantindo que ele tenha 8 dígitos (08)
-    return ''.join(f'{byte:08b}' for byte in byte_stream)
\ No newline at end of file
+    # Os bytes são desempacotados em bloco pelo BitBuffer, em vez de formatar cada byte com f'{byte:08b}'
+    return str(BitBuffer(byte_stream))
\ No newline at end of file
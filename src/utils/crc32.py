@@ -0,0 +1,112 @@
+from functools import lru_cache
+from struct import iter_unpack
+
+_MASCARA: int = 0xFFFFFFFF
+
+
+@lru_cache(maxsize=None)
+def _tabelas(poly: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Gera as 8 tabelas de 256 entradas usadas no slicing-by-8 para o polinômio informado.
+
+    O CRC do projeto é o resto de M(x) * x^32 dividido por G(x) = x^31 + poly, ou seja, o bit mais significativo
+    da janela de 32 bits é descartado a cada passo. Para usar tabelas de byte, o registrador de 31 bits é mantido
+    alinhado à esquerda em 32 bits (o bit 0 fica sempre em 0), com o polinômio também deslocado de uma posição.
+
+    Args:
+        poly (int): O polinômio CRC (sem o termo de maior grau), como em CamadaEnlaceTransmissor.CRC32_POLY.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: As tabelas T0..T7, em que Tk[i] é o resto do byte i seguido de k bytes nulos.
+    """
+    poly_alinhado: int = ((poly | 0x80000000) << 1) & _MASCARA
+    t0: list[int] = []
+    for i in range(256):
+        resto: int = i << 24
+        for _ in range(8):
+            resto = ((resto << 1) ^ poly_alinhado) & _MASCARA if resto & 0x80000000 else (resto << 1) & _MASCARA
+        t0.append(resto)
+
+    tabelas: list[list[int]] = [t0]
+    for _ in range(7):
+        anterior: list[int] = tabelas[-1]
+        tabelas.append([((valor << 8) & _MASCARA) ^ t0[valor >> 24] for valor in anterior])
+    return tuple(tuple(tabela) for tabela in tabelas)
+
+
+class CRC32:
+    """
+    Cálculo incremental do CRC-32 por tabelas (slicing-by-8), compartilhado entre transmissor e receptor.
+
+    Produz o mesmo valor do cálculo bit a bit de CamadaEnlaceTransmissor.crc32, mas processa 8 bytes por iteração,
+    em tempo linear no tamanho da mensagem. Os dados podem ser fornecidos em pedaços com update(), à medida que chegam.
+
+    Exemplo:
+        crc = CRC32()
+        crc.update(b"Ola, ")
+        crc.update(b"mundo")
+        crc.intdigest()  # Igual ao CRC de b"Ola, mundo"
+    """
+
+    def __init__(self, dados: bytes = b"", poly: int = 0x04C11DB7) -> None:
+        self.poly: int = poly
+        self._tabelas: tuple[tuple[int, ...], ...] = _tabelas(poly)
+        self._registrador: int = 0  # Resto parcial, alinhado à esquerda em 32 bits
+        self._pendente: bytes = b""  # Bytes que ainda não completaram um bloco de 8
+        if dados:
+            self.update(dados)
+
+    def update(self, dados: bytes) -> "CRC32":
+        """
+        Acrescenta um pedaço de dados ao cálculo.
+
+        Args:
+            dados (bytes): O próximo pedaço da mensagem (bytes, bytearray ou memoryview).
+
+        Returns:
+            CRC32: O próprio objeto, para permitir encadeamento.
+        """
+        dados = self._pendente + bytes(dados) if self._pendente else memoryview(dados).cast("B")
+        completos: int = len(dados) - len(dados) % 8
+        t0, t1, t2, t3, t4, t5, t6, t7 = self._tabelas
+        reg: int = self._registrador
+        # Cada iteração consome 8 bytes: os 4 primeiros se combinam com o registrador, os 4 seguintes entram direto nas tabelas
+        for alto, baixo in iter_unpack(">II", dados[:completos]):
+            alto ^= reg
+            reg = (t7[alto >> 24] ^ t6[(alto >> 16) & 0xFF] ^ t5[(alto >> 8) & 0xFF] ^ t4[alto & 0xFF]
+                   ^ t3[baixo >> 24] ^ t2[(baixo >> 16) & 0xFF] ^ t1[(baixo >> 8) & 0xFF] ^ t0[baixo & 0xFF])
+        self._registrador = reg
+        self._pendente = bytes(dados[completos:])
+        return self
+
+    def intdigest(self) -> int:
+        """
+        Retorna o CRC dos dados fornecidos até agora, sem encerrar o cálculo (update() pode continuar sendo chamado).
+
+        Returns:
+            int: O valor do CRC-32, no mesmo formato de CamadaEnlaceTransmissor.crc32.
+        """
+        t0: tuple[int, ...] = self._tabelas[0]
+        reg: int = self._registrador
+        # Os bytes que não completaram um bloco são processados um a um
+        for byte in self._pendente:
+            reg = ((reg << 8) & _MASCARA) ^ t0[(reg >> 24) ^ byte]
+        # O CRC do projeto anexa 32 zeros à mensagem, um a mais que o grau do polinômio: processamos esse bit extra
+        poly_alinhado: int = ((self.poly | 0x80000000) << 1) & _MASCARA
+        reg = ((reg << 1) ^ poly_alinhado) & _MASCARA if reg & 0x80000000 else (reg << 1) & _MASCARA
+        return reg >> 1
+
+    def digest(self) -> bytes:
+        """
+        Retorna o CRC dos dados fornecidos até agora como 4 bytes (big-endian), como é anexado à mensagem.
+        """
+        return self.intdigest().to_bytes(4, byteorder="big")
+
+    def copy(self) -> "CRC32":
+        """
+        Retorna uma cópia do estado atual do cálculo.
+        """
+        copia: CRC32 = CRC32(poly=self.poly)
+        copia._registrador = self._registrador
+        copia._pendente = self._pendente
+        return copia
@@ -0,0 +1,115 @@
+import math
+import numpy as np
+
+
+def decimar_min_max(y: np.ndarray, inicio: int, fim: int, colunas: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduz o trecho y[inicio:fim] a no máximo 2 pontos por coluna de pixels: o mínimo e o máximo de cada coluna,
+    na ordem em que aparecem. O desenho resultante tem o mesmo envelope do sinal completo (nenhum pico some), mas o
+    custo de desenhar fica limitado pela largura do gráfico e não pelo tamanho da onda.
+
+    Args:
+        y (np.ndarray): O sinal completo.
+        inicio (int): O índice da primeira amostra do trecho visível (ajustado aos limites do sinal).
+        fim (int): O índice seguinte à última amostra do trecho visível (ajustado aos limites do sinal).
+        colunas (int): O número de colunas de pixels disponíveis para o trecho.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Os índices (eixo x) e os valores dos pontos a desenhar.
+    """
+    inicio = max(inicio, 0)
+    fim = min(fim, len(y))
+    n: int = max(fim - inicio, 0)
+    colunas = max(colunas, 1)
+    if n <= 2 * colunas:
+        # Poucos pontos: desenha o trecho sem redução
+        return np.arange(inicio, fim), np.asarray(y[inicio:fim])
+
+    # Divide o trecho em colunas de mesmo tamanho; a última é completada repetindo a última amostra
+    tamanho: int = math.ceil(n / colunas)
+    colunas = math.ceil(n / tamanho)
+    trecho: np.ndarray = np.asarray(y[inicio:fim])
+    if colunas * tamanho > n:
+        trecho = np.concatenate([trecho, np.full(colunas * tamanho - n, trecho[-1], dtype=trecho.dtype)])
+    blocos: np.ndarray = trecho.reshape(colunas, tamanho)
+
+    # Posição do mínimo e do máximo de cada coluna, mantidos na ordem temporal para preservar a forma do sinal
+    minimos: np.ndarray = blocos.argmin(axis=1)
+    maximos: np.ndarray = blocos.argmax(axis=1)
+    deslocamentos: np.ndarray = np.arange(colunas) * tamanho
+    indices: np.ndarray = np.empty(2 * colunas, dtype=np.int64)
+    indices[0::2] = deslocamentos + np.minimum(minimos, maximos)
+    indices[1::2] = deslocamentos + np.maximum(minimos, maximos)
+    indices = np.minimum(indices, n - 1)  # Pontos que caíram no preenchimento voltam para a última amostra
+    return inicio + indices, trecho[indices]
+
+
+class GraficoDecimado:
+    """
+    Linha persistente de um Axes do matplotlib, desenhada com decimação min/max ajustada à largura do gráfico em
+    pixels. É criada uma única vez junto com o gráfico e reaproveitada a cada novo sinal, então nenhuma figura,
+    canvas ou barra de ferramentas é recriado e o uso de memória não cresce com o número de mensagens.
+
+    - atualizar() troca os dados da linha com set_data. Se os limites dos eixos não mudam, apenas a linha é redesenhada
+      sobre o fundo guardado (blitting); caso contrário, o canvas é redesenhado uma vez.
+    - A cada mudança dos limites do eixo x (zoom ou deslocamento pela NavigationToolbar2Tk) o trecho visível é
+      decimado de novo, com a mesma quantidade de pontos, então ao aproximar o gráfico os detalhes aparecem.
+
+    Deve ser criado depois do FigureCanvasTkAgg da figura, que é o canvas usado para o blitting.
+
+    Args:
+        ax (matplotlib.axes.Axes): O gráfico onde desenhar.
+        **estilo: Argumentos repassados ao ax.plot (cor, drawstyle="steps-post" para sinais digitais etc.).
+
+    Exemplo:
+        grafico = GraficoDecimado(ax, color="blue")
+        grafico.atualizar(wave)
+    """
+
+    def __init__(self, ax, **estilo) -> None:
+        self.ax = ax
+        self.y: np.ndarray = np.zeros(0)
+        # Linha animada: fica fora do desenho normal da figura, para que o fundo guardado não a contenha
+        self.linha, = ax.plot([], [], animated=True, **estilo)
+        self._fundo = None  # Região do gráfico sem a linha, guardada a cada desenho completo
+        ax.figure.canvas.mpl_connect("draw_event", self._ao_desenhar)
+        ax.callbacks.connect("xlim_changed", self._refinar)
+
+    def _colunas(self) -> int:
+        return max(int(self.ax.bbox.width), 1)  # Largura atual do gráfico, em pixels
+
+    def _ao_desenhar(self, evento) -> None:
+        # Após cada desenho completo (inclusive redimensionamento e zoom), guarda o fundo e desenha a linha por cima
+        canvas = self.ax.figure.canvas
+        self._fundo = canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.linha)
+
+    def _refinar(self, ax) -> None:
+        # Desenha só o trecho visível (com uma amostra de folga em cada lado, para a linha chegar às bordas)
+        inicio, fim = ax.get_xlim()
+        self.linha.set_data(*decimar_min_max(self.y, math.floor(inicio) - 1, math.ceil(fim) + 2, self._colunas()))
+        ax.figure.canvas.draw_idle()
+
+    def atualizar(self, y: list[float] | np.ndarray) -> None:
+        """
+        Exibe um novo sinal na linha, ajustando os eixos ao sinal inteiro.
+
+        Args:
+            y (list[float] | np.ndarray): O sinal completo.
+        """
+        self.y = np.asarray(y)
+        limites_x: tuple[float, float] = (0, max(len(self.y) - 1, 1))
+        minimo, maximo = (float(self.y.min()), float(self.y.max())) if len(self.y) else (-1.0, 1.0)
+        folga: float = 0.05 * (maximo - minimo) or 1.0  # Margem de 5%, como o ajuste automático do matplotlib
+        limites_y: tuple[float, float] = (minimo - folga, maximo + folga)
+
+        canvas = self.ax.figure.canvas
+        if self._fundo is not None and self.ax.get_xlim() == limites_x and self.ax.get_ylim() == limites_y:
+            # Mesmos eixos: redesenha apenas a linha sobre o fundo guardado
+            self.linha.set_data(*decimar_min_max(self.y, 0, len(self.y), self._colunas()))
+            canvas.restore_region(self._fundo)
+            self.ax.draw_artist(self.linha)
+            canvas.blit(self.ax.bbox)
+            return
+        self.ax.set_ylim(*limites_y)
+        self.ax.set_xlim(*limites_x)  # Dispara _refinar, que decima o sinal e agenda o redesenho completo
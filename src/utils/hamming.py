@@ -0,0 +1,146 @@
+import numpy as np
+from .bitbuffer import BitBuffer
+
+
+class CodigoHamming:
+    """
+    Código de Hamming em blocos: a mensagem é dividida em blocos de k bits e cada bloco vira uma palavra de n bits.
+
+    Dentro de cada palavra os bits de paridade ficam nas posições que são potências de 2 (1-based), como no código
+    de Hamming aplicado à mensagem inteira. No modo SECDED é acrescentado um bit de paridade global ao fim de cada
+    palavra, que permite corrigir um erro e detectar dois erros por bloco.
+
+    As tabelas são calculadas uma única vez no construtor:
+        - a tabela de codificação, com a palavra de cada valor de bloco possível (k <= 16), ou a matriz geradora;
+        - a tabela de síndromes, que leva cada síndrome ao índice do bit a corrigir (-1 se não corresponder a bit algum).
+    A codificação e a decodificação tratam todos os blocos de uma vez com operações de matriz do NumPy.
+
+    Como k não divide necessariamente o número de bits da mensagem, ela é completada com um bit 1 seguido de zeros
+    até fechar o último bloco; o receptor remove tudo a partir do último bit 1.
+
+    Args:
+        n (int): O número de bits de cada palavra (incluindo o bit de paridade global no modo SECDED).
+        k (int): O número de bits de dados de cada palavra.
+        secded (bool): Acrescenta o bit de paridade global (Single Error Correction, Double Error Detection).
+
+    Exemplo:
+        codigo = CodigoHamming(7, 4)
+        bits = codigo.codificar(BitBuffer(b"Ola"))
+        codigo.decodificar(bits)  # (BitBuffer(b"Ola"), 0, 0)
+    """
+
+    def __init__(self, n: int, k: int, secded: bool = False) -> None:
+        self.n: int = n
+        self.k: int = k
+        self.secded: bool = secded
+        n_hamming: int = n - secded  # Bits da palavra de Hamming, sem a paridade global
+        self.r: int = n_hamming.bit_length()  # Uma paridade por potência de 2 até n_hamming
+        if n_hamming - self.r != k:
+            raise ValueError(f"Não existe código de Hamming ({n}, {k}){' SECDED' if secded else ''}")
+
+        posicoes: np.ndarray = np.arange(1, n_hamming + 1)
+        self._dados: np.ndarray = np.flatnonzero(posicoes & (posicoes - 1))  # Índices dos bits de dados na palavra
+        # Matriz de verificação: a coluna de cada posição é a própria posição em binário
+        h: np.ndarray = ((posicoes[None, :] >> np.arange(self.r)[:, None]) & 1).astype(np.float32)
+
+        # Matriz geradora (k x n): cada linha é a palavra de um único bit de dados ativo
+        geradora: np.ndarray = np.zeros((k, n), dtype=np.uint8)
+        geradora[np.arange(k), self._dados] = 1
+        for i in range(self.r):
+            # A paridade da posição 2^i cobre todas as posições com o bit i ativado
+            geradora[:, (1 << i) - 1] = h[i, self._dados]
+        if secded:
+            geradora[:, -1] = geradora[:, :-1].sum(axis=1) & 1
+        self._geradora: np.ndarray = geradora.astype(np.float32)
+        self._verificacao: np.ndarray = np.ascontiguousarray(h.T)  # (n_hamming x r), para blocos em linhas
+
+        # Tabela de codificação: a palavra de cada um dos 2^k blocos possíveis (só para blocos pequenos)
+        self._tabela: np.ndarray | None = None
+        if k <= 16:
+            valores: np.ndarray = np.arange(1 << k)
+            blocos: np.ndarray = ((valores[:, None] >> np.arange(k - 1, -1, -1)) & 1).astype(np.float32)
+            self._tabela = ((blocos @ self._geradora) % 2).astype(np.uint8)
+
+        # Tabela de síndromes: como a coluna de cada posição é a própria posição, a síndrome é a posição errada
+        self._correcao: np.ndarray = np.full(1 << self.r, -1, dtype=np.int64)
+        self._correcao[posicoes] = posicoes - 1
+
+    def __repr__(self) -> str:
+        return f"CodigoHamming({self.n}, {self.k}{', secded=True' if self.secded else ''})"
+
+    def codificar(self, bits: BitBuffer) -> BitBuffer:
+        """
+        Codifica a sequência de bits, bloco a bloco.
+
+        Args:
+            bits (BitBuffer): Os bits de dados.
+
+        Returns:
+            BitBuffer: As palavras de todos os blocos, concatenadas.
+        """
+        dados: np.ndarray = bits.unpack()
+        n_blocos: int = len(dados) // self.k + 1  # Sempre há espaço para o bit 1 do preenchimento
+        blocos: np.ndarray = np.zeros(n_blocos * self.k, dtype=np.uint8)
+        blocos[:len(dados)] = dados
+        blocos[len(dados)] = 1
+        blocos = blocos.reshape(n_blocos, self.k)
+
+        if self._tabela is not None:
+            indices: np.ndarray = blocos @ (1 << np.arange(self.k - 1, -1, -1))  # Valor inteiro de cada bloco
+            palavras: np.ndarray = self._tabela[indices]
+        else:
+            palavras = ((blocos.astype(np.float32) @ self._geradora) % 2).astype(np.uint8)
+        return BitBuffer.pack(palavras.ravel())
+
+    def decodificar(self, bits: BitBuffer, remover_preenchimento: bool = True) -> tuple[BitBuffer, int, int]:
+        """
+        Decodifica as palavras, corrigindo até um erro por bloco.
+
+        Args:
+            bits (BitBuffer): As palavras recebidas. Bits que não completam uma palavra são descartados.
+            remover_preenchimento (bool): Remove o preenchimento do último bloco. Use False para decodificar uma parte
+                da mensagem que não contém o último bloco (o preenchimento só existe nele).
+
+        Returns:
+            tuple[BitBuffer, int, int]: Uma tupla contendo:
+                - Os bits de dados, sem o preenchimento (se remover_preenchimento).
+                - O número de blocos em que um erro foi corrigido.
+                - O número de blocos com erro detectado que não pôde ser corrigido.
+        """
+        recebido: np.ndarray = bits.unpack()
+        palavras: np.ndarray = recebido[:len(recebido) - len(recebido) % self.n].reshape(-1, self.n).copy()
+        n_hamming: int = self.n - self.secded
+
+        # Síndrome de cada bloco: os bits de paridade que não conferem formam a posição (1-based) do bit errado
+        bits_sindrome: np.ndarray = (palavras[:, :n_hamming].astype(np.float32) @ self._verificacao) % 2
+        sindromes: np.ndarray = bits_sindrome.astype(np.int64) @ (1 << np.arange(self.r))
+        indices: np.ndarray = self._correcao[sindromes]
+
+        if self.secded:
+            paridade_global: np.ndarray = palavras.sum(axis=1) & 1
+            # Paridade global errada: erro simples (no bit indicado pela síndrome ou no próprio bit global)
+            # Paridade global certa com síndrome não nula: dois erros, detectados mas não corrigíveis
+            corrigivel: np.ndarray = (paridade_global == 1) & ((sindromes == 0) | (indices >= 0))
+            nao_corrigivel: np.ndarray = (sindromes != 0) & ~corrigivel
+        else:
+            corrigivel = indices >= 0
+            nao_corrigivel = (sindromes != 0) & ~corrigivel  # Síndrome de uma posição que não existe (código encurtado)
+
+        blocos_corrigir: np.ndarray = np.flatnonzero(corrigivel & (sindromes != 0))
+        palavras[blocos_corrigir, indices[blocos_corrigir]] ^= 1
+        corrigidos: int = int(np.count_nonzero(corrigivel))
+
+        # Extrai os bits de dados e remove o preenchimento (o último bit 1 e os zeros que o seguem)
+        dados: np.ndarray = palavras[:, self._dados].ravel()
+        uns: np.ndarray = np.flatnonzero(dados)
+        if remover_preenchimento and len(uns):
+            dados = dados[:uns[-1]]
+        return BitBuffer.pack(dados), corrigidos, int(np.count_nonzero(nao_corrigivel))
+
+
+# Códigos em blocos disponíveis, pelo nome exibido nas interfaces
+CODIGOS_HAMMING: dict[str, CodigoHamming] = {
+    "Hamming (7,4)": CodigoHamming(7, 4),
+    "Hamming (15,11)": CodigoHamming(15, 11),
+    "SECDED (72,64)": CodigoHamming(72, 64, secded=True),
+}
\ No newline at end of file
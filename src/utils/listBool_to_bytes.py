@@ -1,5 +1,8 @@
+from .bitbuffer import BitBuffer
+
 def listBool_to_bytes(listBool):
     """
     Convert a list of boolean values to a byte array.
+    The last byte is padded with zeros on the right when the list length is not a multiple of 8.
     """
-    return bytes([int(''.join(['1' if x else '0' for x in listBool[i:i+8]]), 2) for i in range(0, len(listBool), 8)])
\ No newline at end of file
+    return BitBuffer.pack(listBool).to_bytes()
\ No newline at end of file
@@ -0,0 +1,118 @@
+from typing import Sequence
+import numpy as np
+from .crc32 import CRC32, _MASCARA, _tabelas
+
+LOTE_MINIMO: int = 48  # Quadros de mesmo tamanho a partir dos quais o CRC-32 é calculado por coluna, com o NumPy
+
+
+class VerificacaoQuadro:
+    """
+    Verificação de erros por quadro: cada quadro leva no fim o seu próprio campo de verificação (trailer), calculado
+    só sobre a sua carga útil, em vez de um único Bit de Paridade ou CRC-32 para a mensagem inteira.
+
+    Assim o receptor confere cada quadro sozinho, assim que ele sai do desenquadrador, e descarta só os quadros
+    danificados. Os quadros são tratados em lote: os de mesmo tamanho formam uma matriz (um quadro por linha) e o
+    cálculo avança uma coluna (um byte de cada quadro) por vez, com operações do NumPy sobre todos os quadros juntos.
+    Com poucos quadros longos (jumbo), o CRC-32 de cada quadro é calculado pelo CRC32 por tabelas, que processa 8
+    bytes por iteração, em vez de uma operação do NumPy por byte.
+
+    Técnicas:
+        "paridade": 1 byte com o XOR de todos os bytes da carga (paridade par de cada uma das 8 posições de bit);
+        "crc32": os 4 bytes do CRC-32 da carga, o mesmo valor de CamadaEnlaceTransmissor.crc32.
+
+    Args:
+        tecnica (str): "paridade" ou "crc32".
+        poly (int): O polinômio do CRC-32 (sem o termo de maior grau).
+
+    Exemplo:
+        verificacao = VerificacaoQuadro("crc32")
+        quadros = verificacao.anexar([b"Ola,", b" mundo"])
+        verificacao.verificar(quadros)  # ([b"Ola,", b" mundo"], [True, True])
+    """
+
+    def __init__(self, tecnica: str, poly: int = 0x04C11DB7) -> None:
+        if tecnica not in ("paridade", "crc32"):
+            raise ValueError(f"Verificação por quadro desconhecida: {tecnica}")
+        self.tecnica: str = tecnica
+        self.poly: int = poly
+        self.tamanho: int = 1 if tecnica == "paridade" else 4  # Bytes do trailer
+        if tecnica == "crc32":
+            self._tabela: np.ndarray = np.array(_tabelas(poly)[0], dtype=np.uint32)
+            self._poly_alinhado: np.uint32 = np.uint32(((poly | 0x80000000) << 1) & _MASCARA)
+
+    def __repr__(self) -> str:
+        return f"VerificacaoQuadro({self.tecnica!r})"
+
+    def _trailers(self, cargas: np.ndarray) -> np.ndarray:
+        """
+        Calcula os trailers de uma matriz de cargas do mesmo tamanho (uma por linha), retornando uma linha de
+        `tamanho` bytes por carga.
+        """
+        if self.tecnica == "paridade":
+            return np.bitwise_xor.reduce(cargas, axis=1, initial=0).astype(np.uint8)[:, None]
+        if len(cargas) < LOTE_MINIMO:
+            return np.frombuffer(b"".join(CRC32(linha.tobytes(), self.poly).digest() for linha in cargas), dtype=np.uint8).reshape(-1, 4)
+        # CRC-32 por tabela de byte, com o registrador de cada quadro avançando junto, coluna a coluna
+        reg: np.ndarray = np.zeros(len(cargas), dtype=np.uint32)
+        for coluna in cargas.T:
+            reg = (reg << np.uint32(8)) ^ self._tabela[(reg >> np.uint32(24)) ^ coluna]
+        # O bit extra dos 32 zeros anexados, como em CRC32.intdigest
+        alto: np.ndarray = (reg & np.uint32(0x80000000)) != 0
+        reg = np.where(alto, (reg << np.uint32(1)) ^ self._poly_alinhado, reg << np.uint32(1)) >> np.uint32(1)
+        return reg.astype(">u4").view(np.uint8).reshape(-1, 4)
+
+    def _por_tamanho(self, quadros: Sequence[bytes]) -> dict[int, list[int]]:
+        """
+        Agrupa os índices dos quadros por tamanho, para que cada grupo forme uma matriz.
+        """
+        grupos: dict[int, list[int]] = {}
+        for indice, quadro in enumerate(quadros):
+            grupos.setdefault(len(quadro), []).append(indice)
+        return grupos
+
+    def anexar(self, cargas: Sequence[bytes | memoryview]) -> list[bytes]:
+        """
+        Anexa o trailer ao fim de cada carga útil.
+
+        Args:
+            cargas (Sequence[bytes]): As cargas úteis dos quadros.
+
+        Returns:
+            list[bytes]: Cada carga seguida do seu trailer, na mesma ordem.
+        """
+        quadros: list[bytes] = [b""] * len(cargas)
+        for tamanho, indices in self._por_tamanho(cargas).items():
+            matriz: np.ndarray = np.frombuffer(b"".join(cargas[i] for i in indices), dtype=np.uint8).reshape(len(indices), tamanho)
+            for indice, quadro in zip(indices, np.hstack([matriz, self._trailers(matriz)])):
+                quadros[indice] = quadro.tobytes()
+        return quadros
+
+    def verificar(self, quadros: Sequence[bytes]) -> tuple[list[bytes], list[bool]]:
+        """
+        Confere o trailer de cada quadro, independentemente dos outros.
+
+        Args:
+            quadros (Sequence[bytes]): Os quadros recebidos (carga útil seguida do trailer), como saem do desenquadrador.
+
+        Returns:
+            tuple[list[bytes], list[bool]]: As cargas sem o trailer e, para cada quadro, se ele está íntegro. Quadros
+            menores que o trailer são considerados danificados.
+        """
+        cargas: list[bytes] = [b""] * len(quadros)
+        integros: list[bool] = [False] * len(quadros)
+        for tamanho, indices in self._por_tamanho(quadros).items():
+            if tamanho < self.tamanho:
+                continue
+            matriz: np.ndarray = np.frombuffer(b"".join(quadros[i] for i in indices), dtype=np.uint8).reshape(len(indices), tamanho)
+            validos: np.ndarray = (self._trailers(matriz[:, :tamanho - self.tamanho]) == matriz[:, tamanho - self.tamanho:]).all(axis=1)
+            for indice, valido in zip(indices, validos.tolist()):
+                cargas[indice] = quadros[indice][:tamanho - self.tamanho]
+                integros[indice] = valido
+        return cargas, integros
+
+
+# Técnicas de verificação por quadro, pelo nome exibido nas interfaces
+VERIFICACOES_QUADRO: dict[str, VerificacaoQuadro] = {
+    "Paridade por Quadro": VerificacaoQuadro("paridade"),
+    "CRC-32 por Quadro": VerificacaoQuadro("crc32"),
+}
@@ -0,0 +1,45 @@
+import socket
+import time
+import unittest
+import numpy as np
+from src.comunicacao import Mensagem, ServidorReceptor, codificar
+
+
+class TestServidorReceptor(unittest.TestCase):
+
+    def test_contadores_de_conexoes_encerradas_logo_apos_o_envio(self):
+        """
+        Transmissores que enviam uma única mensagem e fecham a conexão em seguida: a conexão é encerrada na thread de
+        E/S antes de a trabalhadora decodificar a mensagem, e as decodificações ainda devem entrar no resumo.
+        """
+        recebidas: list[Mensagem] = []
+
+        def ao_receber(mensagem, estatisticas):
+            time.sleep(0.05)  # Decodificação mais lenta que o encerramento da conexão
+            recebidas.append(mensagem)
+
+        servidor = ServidorReceptor(ao_receber, port=0)
+        servidor.iniciar()
+        try:
+            mensagem = Mensagem(8, 1.0, 1.0, 0.0, "NRZ-Polar", "ASK", "Nenhum", "Nenhum", np.zeros(500, dtype=np.float32), (0.0, 1.0))
+            dados: bytes = codificar(mensagem)
+            for _ in range(5):
+                with socket.create_connection(("127.0.0.1", servidor.port)) as conn:
+                    conn.sendall(dados)
+            limite: float = time.monotonic() + 5
+            while len(servidor.estatisticas()) > 1 and time.monotonic() < limite:
+                time.sleep(0.01)
+            estatisticas = servidor.estatisticas()
+        finally:
+            servidor.parar()
+
+        self.assertEqual(len(recebidas), 5)
+        self.assertEqual(len(estatisticas), 1)  # Só o resumo das encerradas
+        self.assertEqual(estatisticas[0].mensagens_recebidas, 5)
+        self.assertEqual(estatisticas[0].mensagens_decodificadas, 5)
+        self.assertEqual(estatisticas[0].bytes_recebidos, 5 * len(dados))
+        self.assertEqual(estatisticas[0].erros, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()